@@ -10,6 +10,12 @@ Responsabilidades:
 """
 
 import logging
+import re
+import string
+from bisect import bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -17,12 +23,73 @@ from src.database.db_manager import DBManager
 from src.models.area_element_tag import (
     AreaElementTag,
     create_tag_from_db_row,
+    tags_from_rows_bulk,
     filter_tags_by_name,
+    iter_filter_tags_by_name,
     sort_tags_by_name
 )
 
 logger = logging.getLogger(__name__)
 
+# Máximo de áreas cuyo listado de tags se memoriza
+_AREA_TAGS_MEMO_SIZE = 64
+
+# Caracteres ASCII válidos en nombres de tag (equivale a [a-zA-Z0-9\s_-])
+_TAG_NAME_ASCII_CHARS = frozenset(
+    c for c in map(chr, range(128)) if c.isalnum() or c.isspace() or c in '_-'
+)
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+# Patrón para nombres no ASCII (\s también acepta espacios Unicode)
+_TAG_NAME_RE = re.compile(r'^[a-zA-Z0-9\s_-]+$')
+
+
+@lru_cache(maxsize=512)
+def _validate_tag_name_cached(name: str) -> Tuple[bool, str]:
+    """
+    Valida el nombre de un tag (resultado cacheado por nombre)
+
+    Args:
+        name: Nombre a validar
+
+    Returns:
+        Tupla (es_válido, mensaje_error)
+    """
+    if not name or not name.strip():
+        return False, "El nombre no puede estar vacío"
+
+    if len(name) > 50:
+        return False, "El nombre no puede exceder 50 caracteres"
+
+    # Validar caracteres permitidos (alfanuméricos, espacios, guiones, underscores)
+    if name.isascii():
+        valid_chars = _TAG_NAME_ASCII_CHARS.issuperset(name)
+    else:
+        valid_chars = _TAG_NAME_RE.match(name) is not None
+
+    if not valid_chars:
+        return False, "El nombre solo puede contener letras, números, espacios, guiones y underscores"
+
+    return True, ""
+
+
+@lru_cache(maxsize=512)
+def _validate_color_cached(color: str) -> bool:
+    """
+    Valida formato de color hex (resultado cacheado por color)
+
+    Args:
+        color: Color a validar
+
+    Returns:
+        True si es válido
+    """
+    if not color:
+        return False
+
+    # Formato: #RRGGBB o #RGB
+    return len(color) in (4, 7) and color[0] == '#' and _HEX_DIGITS.issuperset(color[1:])
+
 
 class AreaElementTagManager(QObject):
     """
@@ -36,8 +103,12 @@ class AreaElementTagManager(QObject):
     tag_created = pyqtSignal(dict)      # tag_data
     tag_updated = pyqtSignal(dict)      # tag_data
     tag_deleted = pyqtSignal(int)       # tag_id
+    tags_created_batch = pyqtSignal(list)  # [tag_data, ...]
+    tags_deleted_batch = pyqtSignal(list)  # [tag_id, ...]
     tag_associated = pyqtSignal(int, int)  # relation_id, tag_id
     tag_removed = pyqtSignal(int, int)     # relation_id, tag_id
+    tags_associated_batch = pyqtSignal(int, list)  # element_id, tag_ids
+    tags_removed_batch = pyqtSignal(int, list)     # element_id, tag_ids
     cache_invalidated = pyqtSignal()
 
     def __init__(self, db_manager: DBManager):
@@ -50,7 +121,15 @@ class AreaElementTagManager(QObject):
         super().__init__()
         self.db = db_manager
         self._tags_cache: Optional[Dict[int, AreaElementTag]] = None  # Lazy loading
+        self._tags_by_name: Optional[Dict[str, AreaElementTag]] = None  # Índice nombre -> tag
+        # Índice de búsqueda: nombres en minúsculas concatenados (lazy, ver filter_tags)
+        self._name_blob: Optional[str] = None
+        self._name_offsets: List[int] = []
+        self._name_blob_tags: List[AreaElementTag] = []
         self._cache_enabled = True
+        # LRU por área: area_id -> (conexión, total_changes al consultar, tags)
+        self._area_tags_cache: "OrderedDict[int, Tuple[Any, int, List[AreaElementTag]]]" = OrderedDict()
+        self._signal_buffer: Optional[Dict[str, Dict[int, List[int]]]] = None  # Activo en batch_signals()
         logger.info("AreaElementTagManager initialized")
 
     # ==================== CACHE ====================
@@ -58,34 +137,81 @@ class AreaElementTagManager(QObject):
     def invalidate_cache(self):
         """Invalida el caché de tags"""
         self._tags_cache = None
+        self._tags_by_name = None
+        self._name_blob = None
+        self._area_tags_cache.clear()
         self.cache_invalidated.emit()
         logger.debug("Tags cache invalidated")
 
+    def invalidate_area_tags(self, area_id: int = None):
+        """
+        Invalida el listado memorizado de tags por área
+
+        Debe llamarse cuando se modifican relaciones/componentes de un área
+        sin pasar por este manager.
+
+        Args:
+            area_id: ID del área (None = invalidar todas)
+        """
+        if area_id is None:
+            self._area_tags_cache.clear()
+        else:
+            self._area_tags_cache.pop(area_id, None)
+
+    def set_cache_enabled(self, enabled: bool):
+        """
+        Activa o desactiva el caché de tags
+
+        Con el caché activo se mantienen todos los tags en memoria (la tabla
+        suele tener pocos cientos de filas). Desactivarlo libera esa memoria
+        y hace que cada consulta vaya a la BD.
+
+        Args:
+            enabled: True para activar el caché
+        """
+        self._cache_enabled = enabled
+        if not enabled:
+            self._tags_cache = None
+            self._tags_by_name = None
+            self._name_blob = None
+
     def _cache_tag(self, tag: AreaElementTag):
         """
-        Agrega un tag al caché
+        Agrega un tag al caché (solo si ya está cargado)
 
         Args:
             tag: Tag a agregar al caché
         """
-        if self._cache_enabled and tag:
-            if self._tags_cache is None:
-                self._tags_cache = {}
+        # Si el caché aún no se cargó no se crea uno parcial: se cargará completo
+        if self._cache_enabled and tag and self._tags_cache is not None:
+            # Si el tag cambió de nombre, retirar la entrada anterior del índice
+            previous = self._tags_cache.get(tag.id)
+            if previous is not None and previous.name != tag.name:
+                self._tags_by_name.pop(previous.name, None)
+
             self._tags_cache[tag.id] = tag
+            self._tags_by_name[tag.name] = tag
+            self._name_blob = None
 
-    def _get_from_cache(self, tag_id: int) -> Optional[AreaElementTag]:
+    def _tag_from_row(self, tag_data: Dict[str, Any]) -> AreaElementTag:
         """
-        Obtiene un tag del caché
+        Obtiene el tag de una fila de BD reutilizando la instancia cacheada
 
         Args:
-            tag_id: ID del tag
+            tag_data: Fila de BD con datos del tag
 
         Returns:
-            Tag desde el caché o None si no existe
+            Instancia cacheada si existe, o una nueva (que se agrega al caché)
         """
-        if self._cache_enabled and self._tags_cache is not None:
-            return self._tags_cache.get(tag_id)
-        return None
+        cache = self._tags_cache
+        if cache is not None:
+            cached = cache.get(tag_data['id'])
+            if cached is not None:
+                return cached
+
+        tag = create_tag_from_db_row(tag_data)
+        self._cache_tag(tag)
+        return tag
 
     def _load_cache(self, force: bool = False):
         """
@@ -103,16 +229,80 @@ class AreaElementTagManager(QObject):
         try:
             all_tags_data = self.db.get_all_area_element_tags()
             self._tags_cache = {}
+            self._tags_by_name = {}
+            self._name_blob = None
 
-            for tag_data in all_tags_data:
-                tag = create_tag_from_db_row(tag_data)
+            for tag in tags_from_rows_bulk(all_tags_data):
                 self._tags_cache[tag.id] = tag
+                self._tags_by_name[tag.name] = tag
 
-            logger.debug(f"Tags cache loaded: {len(self._tags_cache)} tags")
+            logger.debug("Tags cache loaded: %s tags", len(self._tags_cache))
 
         except Exception as e:
             logger.error(f"Error loading tags cache: {e}")
 
+    # ==================== SEÑALES ====================
+
+    @contextmanager
+    def batch_signals(self):
+        """
+        Agrupa las señales de asociación emitidas dentro del bloque
+
+        Dentro del bloque, las asociaciones/remociones no emiten señales
+        individuales; al salir se emite una única señal tags_associated_batch /
+        tags_removed_batch por elemento. Los bloques anidados se vacían
+        una sola vez, al salir del bloque externo.
+
+        Usage:
+            with tag_manager.batch_signals():
+                tag_manager.add_tag_to_relation(...)
+                tag_manager.add_tag_to_relation(...)
+        """
+        outermost = self._signal_buffer is None
+        if outermost:
+            self._signal_buffer = {'associated': {}, 'removed': {}}
+
+        try:
+            yield self
+        finally:
+            if outermost:
+                buffer = self._signal_buffer
+                self._signal_buffer = None
+
+                for element_id, tag_ids in buffer['associated'].items():
+                    self.tags_associated_batch.emit(element_id, tag_ids)
+                for element_id, tag_ids in buffer['removed'].items():
+                    self.tags_removed_batch.emit(element_id, tag_ids)
+
+    def _emit_associated(self, element_id: int, tag_ids: List[int]):
+        """
+        Emite (o acumula si hay un batch activo) la asociación de tags
+
+        Args:
+            element_id: ID de la relación o componente
+            tag_ids: IDs de tags asociados
+        """
+        # El área del elemento no se conoce aquí: invalidar todo el listado por área
+        self._area_tags_cache.clear()
+        if self._signal_buffer is not None:
+            self._signal_buffer['associated'].setdefault(element_id, []).extend(tag_ids)
+        else:
+            self.tags_associated_batch.emit(element_id, list(tag_ids))
+
+    def _emit_removed(self, element_id: int, tag_ids: List[int]):
+        """
+        Emite (o acumula si hay un batch activo) la remoción de tags
+
+        Args:
+            element_id: ID de la relación o componente
+            tag_ids: IDs de tags removidos
+        """
+        self._area_tags_cache.clear()
+        if self._signal_buffer is not None:
+            self._signal_buffer['removed'].setdefault(element_id, []).extend(tag_ids)
+        else:
+            self.tags_removed_batch.emit(element_id, list(tag_ids))
+
     # ==================== GESTIÓN DE TAGS ====================
 
     def create_tag(self, name: str, color: str = "#9b59b6",
@@ -140,14 +330,13 @@ class AreaElementTagManager(QObject):
             return None
 
         try:
-            tag_id = self.db.add_area_element_tag(name, color, description)
-            tag_data = self.db.get_area_element_tag_by_id(tag_id)
+            tag_data = self.db.create_area_element_tag(name, color, description)
 
             if tag_data:
                 tag = create_tag_from_db_row(tag_data)
                 self._cache_tag(tag)
                 self.tag_created.emit(tag_data)
-                logger.info(f"Tag creado: {name} (ID: {tag_id})")
+                logger.info("Tag creado: %s (ID: %s)", name, tag.id)
                 return tag
 
             return None
@@ -170,25 +359,38 @@ class AreaElementTagManager(QObject):
         Returns:
             Lista de tags
         """
+        if not self._cache_enabled:
+            return tags_from_rows_bulk(self.db.get_all_area_element_tags())
+
         if refresh or self._tags_cache is None:
             self._load_cache(force=refresh)
 
-        return list(self._tags_cache.values() if self._tags_cache else [])
+        cache = self._tags_cache
+        return list(cache.values()) if cache is not None else []
 
     def get_tag(self, tag_id: int) -> Optional[AreaElementTag]:
         """
         Obtiene un tag por ID (usa caché)
 
+        En el primer acceso carga todos los tags con una sola consulta y
+        responde desde memoria; la BD solo se consulta si el caché está
+        desactivado o el tag no está en él.
+
         Args:
             tag_id: ID del tag
 
         Returns:
             Tag o None si no existe
         """
-        # Intentar desde caché
-        cached = self._get_from_cache(tag_id)
-        if cached:
-            return cached
+        if self._cache_enabled:
+            if self._tags_cache is None:
+                self._load_cache()
+
+            cache = self._tags_cache
+            if cache is not None:
+                cached = cache.get(tag_id)
+                if cached is not None:
+                    return cached
 
         # Obtener de BD
         tag_data = self.db.get_area_element_tag_by_id(tag_id)
@@ -201,7 +403,7 @@ class AreaElementTagManager(QObject):
 
     def get_tag_by_name(self, name: str) -> Optional[AreaElementTag]:
         """
-        Obtiene un tag por nombre
+        Obtiene un tag por nombre (usa caché, ver get_tag)
 
         Args:
             name: Nombre del tag
@@ -209,6 +411,14 @@ class AreaElementTagManager(QObject):
         Returns:
             Tag o None si no existe
         """
+        # Intentar desde el índice de nombres del caché
+        if self._cache_enabled:
+            self._load_cache()
+            if self._tags_by_name is not None:
+                cached = self._tags_by_name.get(name)
+                if cached:
+                    return cached
+
         tag_data = self.db.get_area_element_tag_by_name(name)
         if tag_data:
             tag = create_tag_from_db_row(tag_data)
@@ -244,21 +454,20 @@ class AreaElementTagManager(QObject):
             return False
 
         try:
-            success = self.db.update_area_element_tag(tag_id, name, color, description)
+            # La fila actualizada llega en la misma sentencia (UPDATE ... RETURNING)
+            tag_data = self.db.update_area_element_tag(tag_id, name, color, description)
+            success = tag_data is not None
 
             if success:
-                # Invalidar caché de este tag
-                if tag_id in self._tags_cache:
-                    del self._tags_cache[tag_id]
+                # El nombre puede cambiar el orden de los listados por área
+                self._area_tags_cache.clear()
 
-                # Obtener tag actualizado y emitir señal
-                tag_data = self.db.get_area_element_tag_by_id(tag_id)
-                if tag_data:
-                    tag = create_tag_from_db_row(tag_data)
-                    self._cache_tag(tag)
-                    self.tag_updated.emit(tag_data)
+                # Mismo payload que tag_created: la fila tal como la guarda la BD
+                tag = create_tag_from_db_row(tag_data)
+                self._cache_tag(tag)
+                self.tag_updated.emit(tag_data)
 
-                logger.info(f"Tag {tag_id} actualizado")
+                logger.info("Tag %s actualizado", tag_id)
 
             return success
 
@@ -270,33 +479,40 @@ class AreaElementTagManager(QObject):
             logger.error(f"Error actualizando tag: {e}")
             return False
 
-    def delete_tag(self, tag_id: int) -> bool:
+    def delete_tag(self, tag_id: int, check_usage: bool = True) -> bool:
         """
         Elimina un tag (verifica uso antes de eliminar)
 
         Args:
             tag_id: ID del tag
+            check_usage: Si True, consulta el uso del tag para advertir
+                         (solo informativo, cuesta una consulta extra)
 
         Returns:
             True si se eliminó correctamente
         """
         # Verificar uso del tag
-        usage_count = self.db.get_tag_usage_count(tag_id)
-        if usage_count > 0:
-            logger.warning(f"Tag {tag_id} está en uso ({usage_count} relaciones)")
-            # Nota: Aún así se puede eliminar gracias a CASCADE
-            # pero advertimos al usuario
+        if check_usage:
+            usage_count = self.db.get_tag_usage_count(tag_id)
+            if usage_count > 0:
+                logger.warning("Tag %s está en uso (%s relaciones)", tag_id, usage_count)
+                # Nota: Aún así se puede eliminar gracias a CASCADE
+                # pero advertimos al usuario
 
         try:
             success = self.db.delete_area_element_tag(tag_id)
 
             if success:
                 # Remover del caché si existe
-                if self._tags_cache is not None and tag_id in self._tags_cache:
-                    del self._tags_cache[tag_id]
+                if self._tags_cache is not None:
+                    old_tag = self._tags_cache.pop(tag_id, None)
+                    if old_tag is not None:
+                        self._tags_by_name.pop(old_tag.name, None)
+                        self._name_blob = None
 
+                self._area_tags_cache.clear()
                 self.tag_deleted.emit(tag_id)
-                logger.info(f"Tag {tag_id} eliminado")
+                logger.info("Tag %s eliminado", tag_id)
 
             return success
 
@@ -304,12 +520,16 @@ class AreaElementTagManager(QObject):
             logger.error(f"Error eliminando tag {tag_id}: {e}")
             return False
 
-    def search_tags(self, query: str) -> List[AreaElementTag]:
+    def search_tags(self, query: str, force_db: bool = False) -> List[AreaElementTag]:
         """
         Busca tags por nombre
 
+        Si el caché está cargado filtra en memoria; si no, consulta la BD.
+
         Args:
             query: Texto a buscar
+            force_db: Si True, consulta siempre la BD (p.ej. si otro proceso
+                      pudo modificar los tags)
 
         Returns:
             Lista de tags que coinciden
@@ -317,15 +537,15 @@ class AreaElementTagManager(QObject):
         if not query:
             return self.get_all_tags()
 
+        if not force_db and self._cache_enabled and self._tags_cache is not None:
+            # Mismo orden que la consulta (ORDER BY name); sin copiar el caché completo
+            return sorted(iter_filter_tags_by_name(self._tags_cache.values(), query),
+                          key=lambda t: t.name)
+
         try:
             tags_data = self.db.search_area_element_tags(query)
-            tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
-
-            # Agregar al caché
-            for tag in tags:
-                self._cache_tag(tag)
-
-            return tags
+            tag_from_row = self._tag_from_row
+            return [tag_from_row(tag_data) for tag_data in tags_data]
 
         except Exception as e:
             logger.error(f"Error buscando tags: {e}")
@@ -348,11 +568,10 @@ class AreaElementTagManager(QObject):
             success = self.db.update_area_relation_tags(relation_id, tag_ids)
 
             if success:
-                # Emitir señal por cada tag asociado
-                for tag_id in tag_ids:
-                    self.tag_associated.emit(relation_id, tag_id)
+                # Emitir una única señal para todo el lote
+                self._emit_associated(relation_id, tag_ids)
 
-                logger.info(f"Tags asignados a relación {relation_id}: {len(tag_ids)} tags")
+                logger.info("Tags asignados a relación %s: %s tags", relation_id, len(tag_ids))
 
             return success
 
@@ -375,8 +594,12 @@ class AreaElementTagManager(QObject):
             success = self.db.assign_tag_to_area_relation(relation_id, tag_id)
 
             if success:
-                self.tag_associated.emit(relation_id, tag_id)
-                logger.info(f"Tag {tag_id} asociado a relación {relation_id}")
+                if self._signal_buffer is not None:
+                    self._emit_associated(relation_id, [tag_id])
+                else:
+                    self._area_tags_cache.clear()
+                    self.tag_associated.emit(relation_id, tag_id)
+                logger.info("Tag %s asociado a relación %s", tag_id, relation_id)
 
             return success
 
@@ -399,8 +622,12 @@ class AreaElementTagManager(QObject):
             success = self.db.remove_tag_from_area_relation(relation_id, tag_id)
 
             if success:
-                self.tag_removed.emit(relation_id, tag_id)
-                logger.info(f"Tag {tag_id} removido de relación {relation_id}")
+                if self._signal_buffer is not None:
+                    self._emit_removed(relation_id, [tag_id])
+                else:
+                    self._area_tags_cache.clear()
+                    self.tag_removed.emit(relation_id, tag_id)
+                logger.info("Tag %s removido de relación %s", tag_id, relation_id)
 
             return success
 
@@ -420,13 +647,8 @@ class AreaElementTagManager(QObject):
         """
         try:
             tags_data = self.db.get_tags_for_area_relation(relation_id)
-            tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
-
-            # Agregar al caché
-            for tag in tags:
-                self._cache_tag(tag)
-
-            return tags
+            tag_from_row = self._tag_from_row
+            return [tag_from_row(tag_data) for tag_data in tags_data]
 
         except Exception as e:
             logger.error(f"Error obteniendo tags de relación: {e}")
@@ -467,11 +689,10 @@ class AreaElementTagManager(QObject):
             success = self.db.update_area_component_tags(component_id, tag_ids)
 
             if success:
-                # Emitir señal por cada tag asociado
-                for tag_id in tag_ids:
-                    self.tag_associated.emit(component_id, tag_id)
+                # Emitir una única señal para todo el lote
+                self._emit_associated(component_id, tag_ids)
 
-                logger.info(f"Tags asignados a componente {component_id}: {len(tag_ids)} tags")
+                logger.info("Tags asignados a componente %s: %s tags", component_id, len(tag_ids))
 
             return success
 
@@ -494,8 +715,12 @@ class AreaElementTagManager(QObject):
             success = self.db.assign_tag_to_area_component(component_id, tag_id)
 
             if success:
-                self.tag_associated.emit(component_id, tag_id)
-                logger.info(f"Tag {tag_id} asociado a componente {component_id}")
+                if self._signal_buffer is not None:
+                    self._emit_associated(component_id, [tag_id])
+                else:
+                    self._area_tags_cache.clear()
+                    self.tag_associated.emit(component_id, tag_id)
+                logger.info("Tag %s asociado a componente %s", tag_id, component_id)
 
             return success
 
@@ -518,8 +743,12 @@ class AreaElementTagManager(QObject):
             success = self.db.remove_tag_from_area_component(component_id, tag_id)
 
             if success:
-                self.tag_removed.emit(component_id, tag_id)
-                logger.info(f"Tag {tag_id} removido de componente {component_id}")
+                if self._signal_buffer is not None:
+                    self._emit_removed(component_id, [tag_id])
+                else:
+                    self._area_tags_cache.clear()
+                    self.tag_removed.emit(component_id, tag_id)
+                logger.info("Tag %s removido de componente %s", tag_id, component_id)
 
             return success
 
@@ -539,7 +768,8 @@ class AreaElementTagManager(QObject):
         """
         try:
             tags_data = self.db.get_tags_for_area_component(component_id)
-            return [create_tag_from_db_row(tag_data) for tag_data in tags_data]
+            tag_from_row = self._tag_from_row
+            return [tag_from_row(tag_data) for tag_data in tags_data]
 
         except Exception as e:
             logger.error(f"Error obteniendo tags del componente: {e}")
@@ -594,15 +824,13 @@ class AreaElementTagManager(QObject):
         try:
             popular_data = self.db.get_popular_Area_element_tags(limit)
             result = []
+            tag_from_row = self._tag_from_row
 
             for tag_data in popular_data:
-                tag = create_tag_from_db_row(tag_data)
+                tag = tag_from_row(tag_data)
                 usage_count = tag_data.get('usage_count', 0)
                 result.append((tag, usage_count))
 
-                # Agregar al caché
-                self._cache_tag(tag)
-
             return result
 
         except Exception as e:
@@ -634,45 +862,44 @@ class AreaElementTagManager(QObject):
         Returns:
             Lista de tags únicos usados en el proyecto, ordenados
         """
+        # El listado memorizado solo es válido si no hubo escrituras en la
+        # conexión desde que se consultó: las asociaciones también se modifican
+        # sin pasar por este manager (otras instancias, diálogos, borrados en cascada)
+        memo = self._area_tags_cache
+
         try:
-            # Recopilar IDs de tags únicos
-            tag_ids = set()
-
-            # 1. Obtener tags de relaciones
-            relations = self.db.get_area_relations(area_id)
-            for relation in relations:
-                tags_data = self.db.get_tags_for_area_relation(relation['id'])
-                for tag_data in tags_data:
-                    tag_ids.add(tag_data['id'])
-
-            # 2. Obtener tags de componentes
-            components = self.db.get_area_components(area_id)
-            for component in components:
-                tags_data = self.db.get_tags_for_area_component(component['id'])
-                for tag_data in tags_data:
-                    tag_ids.add(tag_data['id'])
-
-            # Obtener objetos Tag completos
-            tags = []
-            for tag_id in tag_ids:
-                tag = self.get_tag(tag_id)
-                if tag:
-                    tags.append(tag)
+            conn = self.db.connect()
+            version = conn.total_changes
+            entry = memo.get(area_id)
+            if entry is not None and entry[0] is conn and entry[1] == version:
+                memo.move_to_end(area_id)
+                return list(entry[2])
+
+            # Obtener tags únicos de relaciones y componentes en una sola consulta
+            tag_from_row = self._tag_from_row
+            tags = [tag_from_row(tag_data) for tag_data in self.db.get_area_element_tags_for_area(area_id)]
 
             # Obtener orden personalizado
             tag_orders = self.db.get_area_tag_orders(area_id)
 
             # Función de ordenamiento
             def get_sort_key(t):
+                order = tag_orders.get(t.id)
                 # Si tiene orden personalizado, usarlo
-                if t.id in tag_orders:
-                    return (0, tag_orders[t.id], t.name.lower())
+                if order is not None:
+                    return (0, order, t.name.lower())
                 # Si no, al final, ordenado alfabéticamente
                 return (1, 0, t.name.lower())
 
             # Ordenar
             tags.sort(key=get_sort_key)
-            return tags
+
+            memo[area_id] = (conn, version, tags)
+            memo.move_to_end(area_id)
+            if len(memo) > _AREA_TAGS_MEMO_SIZE:
+                memo.popitem(last=False)
+
+            return list(tags)
 
         except Exception as e:
             logger.error(f"Error obteniendo tags del proyecto {area_id}: {e}")
@@ -690,6 +917,7 @@ class AreaElementTagManager(QObject):
         Returns:
             True si se actualizó correctamente
         """
+        self._area_tags_cache.pop(area_id, None)
         return self.db.update_area_tag_order(area_id, tag_id, new_index)
 
     def set_area_tags_order(self, area_id: int, ordered_tag_ids: List[int]) -> bool:
@@ -703,6 +931,7 @@ class AreaElementTagManager(QObject):
         Returns:
             True si se actualizaron todos
         """
+        self._area_tags_cache.pop(area_id, None)
         try:
             for index, tag_id in enumerate(ordered_tag_ids):
                 self.db.update_area_tag_order(area_id, tag_id, index)
@@ -724,8 +953,45 @@ class AreaElementTagManager(QObject):
         if not query:
             return self.get_all_tags()
 
-        tags = self.get_all_tags()
-        return filter_tags_by_name(tags, query)
+        if self._cache_enabled and self._tags_cache is None:
+            self._load_cache()
+        if self._tags_cache is None or '\n' in query:
+            return filter_tags_by_name(self.get_all_tags(), query)
+
+        if self._name_blob is None:
+            self._build_name_blob()
+
+        # Buscar sobre el texto concatenado (el recorrido lo hace str.find en C)
+        # y mapear cada coincidencia a su fila mediante los offsets
+        blob = self._name_blob
+        offsets = self._name_offsets
+        tags = self._name_blob_tags
+        q = query.lower()
+        result = []
+        pos = blob.find(q)
+        while pos != -1:
+            row = bisect_right(offsets, pos) - 1
+            result.append(tags[row])
+            # Saltar al siguiente nombre: una coincidencia por tag
+            next_start = offsets[row + 1] if row + 1 < len(offsets) else len(blob)
+            pos = blob.find(q, next_start)
+        return result
+
+    def _build_name_blob(self):
+        """Construye el índice de búsqueda de filter_tags a partir del caché"""
+        tags = list(self._tags_cache.values())
+        offsets = []
+        position = 0
+        names = []
+        for tag in tags:
+            name = tag.name.lower()
+            offsets.append(position)
+            names.append(name)
+            position += len(name) + 1
+        # Separador '\n': filter_tags descarta consultas que lo contengan
+        self._name_blob = '\n'.join(names)
+        self._name_offsets = offsets
+        self._name_blob_tags = tags
 
     # ==================== VALIDACIONES ====================
 
@@ -739,18 +1005,9 @@ class AreaElementTagManager(QObject):
         Returns:
             Tupla (es_válido, mensaje_error)
         """
-        if not name or not name.strip():
+        if not name:
             return False, "El nombre no puede estar vacío"
-
-        if len(name) > 50:
-            return False, "El nombre no puede exceder 50 caracteres"
-
-        # Validar caracteres permitidos (alfanuméricos, espacios, guiones, underscores)
-        import re
-        if not re.match(r'^[a-zA-Z0-9\s_-]+$', name):
-            return False, "El nombre solo puede contener letras, números, espacios, guiones y underscores"
-
-        return True, ""
+        return _validate_tag_name_cached(name)
 
     def validate_color(self, color: str) -> bool:
         """
@@ -764,11 +1021,7 @@ class AreaElementTagManager(QObject):
         """
         if not color:
             return False
-
-        import re
-        # Formato: #RRGGBB o #RGB
-        pattern = r'^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$'
-        return bool(re.match(pattern, color))
+        return _validate_color_cached(color)
 
     # ==================== OPERACIONES BATCH ====================
 
@@ -776,6 +1029,8 @@ class AreaElementTagManager(QObject):
         """
         Crea múltiples tags en batch
 
+        Valida todos los tags primero y los inserta en una sola transacción.
+
         Args:
             tags_data: Lista de diccionarios con datos de tags
                       [{'name': 'python', 'color': '#3776ab', 'description': '...'}, ...]
@@ -783,22 +1038,64 @@ class AreaElementTagManager(QObject):
         Returns:
             Lista de tags creados (None en posiciones donde falló)
         """
-        results = []
+        results: List[Optional[AreaElementTag]] = [None] * len(tags_data)
+        pending = []  # (índice, name, color, description)
 
-        for tag_data in tags_data:
+        for index, tag_data in enumerate(tags_data):
             name = tag_data.get('name')
             color = tag_data.get('color', '#9b59b6')
             description = tag_data.get('description', '')
 
-            tag = self.create_tag(name, color, description)
-            results.append(tag)
+            is_valid, error_msg = self.validate_tag_name(name)
+            if not is_valid:
+                logger.error(f"Validación fallida: {error_msg}")
+                continue
+
+            if not self.validate_color(color):
+                logger.error(f"Color inválido: {color}")
+                continue
+
+            pending.append((index, name, color, description))
+
+        if pending:
+            try:
+                created_ids = self.db.add_area_element_tags_bulk(
+                    [(name, color, description) for _, name, color, description in pending]
+                )
+                rows_by_id = {
+                    row['id']: row
+                    for row in self.db.get_area_element_tags_by_ids(list(created_ids.values()))
+                }
 
-        logger.info(f"Batch creation: {len([t for t in results if t])} de {len(tags_data)} tags creados")
+                created_data = []
+
+                for index, name, _, _ in pending:
+                    # pop: un nombre repetido en el lote solo se crea una vez
+                    tag_data = rows_by_id.get(created_ids.pop(name, None))
+                    if not tag_data:
+                        logger.error(f"Error creando tag: ya existe un tag con el nombre '{name}'")
+                        continue
+
+                    tag = create_tag_from_db_row(tag_data)
+                    self._cache_tag(tag)
+                    created_data.append(tag_data)
+                    results[index] = tag
+
+                # Una sola señal para todo el lote
+                if created_data:
+                    self.tags_created_batch.emit(created_data)
+
+            except Exception as e:
+                logger.error(f"Error creando tags en batch: {e}")
+
+        if logger.isEnabledFor(logging.INFO):
+            created_count = sum(1 for t in results if t)
+            logger.info("Batch creation: %s de %s tags creados", created_count, len(tags_data))
         return results
 
     def delete_tags_batch(self, tag_ids: List[int]) -> int:
         """
-        Elimina múltiples tags
+        Elimina múltiples tags en una sola transacción
 
         Args:
             tag_ids: Lista de IDs de tags a eliminar
@@ -806,11 +1103,21 @@ class AreaElementTagManager(QObject):
         Returns:
             Número de tags eliminados exitosamente
         """
-        deleted_count = 0
-
-        for tag_id in tag_ids:
-            if self.delete_tag(tag_id):
-                deleted_count += 1
-
-        logger.info(f"Batch deletion: {deleted_count} de {len(tag_ids)} tags eliminados")
-        return deleted_count
+        # Sin verificación de uso por tag: es solo informativa y CASCADE
+        # elimina las asociaciones igualmente
+        unique_ids = list(dict.fromkeys(tag_ids))
+
+        # Solo los IDs que existían: los inexistentes no se notifican
+        deleted_ids = self.db.delete_area_element_tags_bulk(unique_ids) if unique_ids else []
+        if deleted_ids:
+            self._area_tags_cache.clear()
+            for tag_id in deleted_ids:
+                if self._tags_cache is not None:
+                    old_tag = self._tags_cache.pop(tag_id, None)
+                    if old_tag is not None:
+                        self._tags_by_name.pop(old_tag.name, None)
+                        self._name_blob = None
+            self.tags_deleted_batch.emit(deleted_ids)
+
+        logger.info("Batch deletion: %s de %s tags eliminados", len(deleted_ids), len(tag_ids))
+        return len(deleted_ids)
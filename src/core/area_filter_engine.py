@@ -8,7 +8,7 @@ Responsabilidades:
 """
 
 import logging
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, FrozenSet, Set, Tuple
 from functools import lru_cache
 
 from src.database.db_manager import DBManager
@@ -23,10 +23,24 @@ class AreaFilterEngine:
     Filtra categorías, items y tags según el proyecto activo seleccionado
     """
 
-    def __init__(self, db_manager: DBManager):
+    def __init__(self, db_manager: DBManager, area_manager=None):
+        """
+        Args:
+            db_manager: Gestor de base de datos
+            area_manager: AreaManager opcional; si se indica, sus señales de
+                relaciones invalidan el caché del área activa
+        """
         self.db = db_manager
         self._active_area_filter: Optional[int] = None
-        self._entity_cache: Dict[str, Set[int]] = {}
+        # Caché LRU por instancia: (area_id, entity_type) -> frozenset de IDs
+        self._ids_for = lru_cache(maxsize=256)(self._load_entity_ids)
+        self._cached_keys: Set[Tuple[int, str]] = set()
+
+        # Invalidar caché cuando cambian las relaciones de un área
+        if area_manager is not None:
+            area_manager.relation_added.connect(self._on_relation_changed)
+            area_manager.relation_removed.connect(self._on_relation_changed)
+            area_manager.relations_bulk_changed.connect(self._on_relations_bulk_changed)
         logger.info("AreaFilterEngine initialized")
 
     # ==================== PROYECTO ACTIVO ====================
@@ -59,25 +73,35 @@ class AreaFilterEngine:
 
     def clear_cache(self):
         """Limpia el caché de entidades"""
-        self._entity_cache.clear()
+        self._ids_for.cache_clear()
+        self._cached_keys.clear()
         logger.debug("Filter cache cleared")
 
-    def _get_cached_entities(self, entity_type: str) -> Optional[Set[int]]:
-        """Obtiene IDs de entidades del caché"""
-        if not self._active_area_filter:
-            return None
-        cache_key = f"{self._active_area_filter}_{entity_type}"
-        return self._entity_cache.get(cache_key)
+    def _on_relation_changed(self, area_id: int, entity_type: str, entity_id: int):
+        """
+        Invalida el caché si cambió una relación del área activa
 
-    def _cache_entities(self, entity_type: str, entity_ids: Set[int]):
-        """Guarda IDs de entidades en caché"""
-        if self._active_area_filter:
-            cache_key = f"{self._active_area_filter}_{entity_type}"
-            self._entity_cache[cache_key] = entity_ids
+        El caché solo contiene entradas del área activa (se limpia al cambiarla),
+        por lo que los cambios en otras áreas no requieren invalidación.
+        """
+        if area_id == self._active_area_filter:
+            self.clear_cache()
+            logger.debug(f"Filter cache invalidated: {entity_type}#{entity_id} changed in Area {area_id}")
+
+    def _on_relations_bulk_changed(self, area_id: int):
+        """Invalida el caché tras una operación masiva sobre el área activa"""
+        if area_id == self._active_area_filter:
+            self.clear_cache()
+
+    def _load_entity_ids(self, area_id: int, entity_type: str) -> FrozenSet[int]:
+        """Carga desde BD los IDs de entidades de un tipo en un área"""
+        relations = self.db.get_area_relations(area_id, entity_type=entity_type)
+        self._cached_keys.add((area_id, entity_type))
+        return frozenset(rel['entity_id'] for rel in relations)
 
     # ==================== OBTENER ENTIDADES FILTRADAS ====================
 
-    def get_entity_ids_in_area(self, entity_type: str) -> Set[int]:
+    def get_entity_ids_in_area(self, entity_type: str) -> FrozenSet[int]:
         """
         Obtiene IDs de entidades del tipo especificado en el proyecto activo
 
@@ -85,29 +109,13 @@ class AreaFilterEngine:
             entity_type: Tipo de entidad ('tag', 'process', 'list', 'table', 'category', 'item')
 
         Returns:
-            Set de IDs de entidades en el proyecto
+            Frozenset de IDs de entidades en el proyecto
         """
         # Si no hay filtro activo, retornar set vacío
         if not self._active_area_filter:
-            return set()
-
-        # Intentar desde caché
-        cached = self._get_cached_entities(entity_type)
-        if cached is not None:
-            return cached
+            return frozenset()
 
-        # Obtener desde BD
-        relations = self.db.get_area_relations(
-            self._active_area_filter,
-            entity_type=entity_type
-        )
-
-        entity_ids = {rel['entity_id'] for rel in relations}
-
-        # Guardar en caché
-        self._cache_entities(entity_type, entity_ids)
-
-        return entity_ids
+        return self._ids_for(self._active_area_filter, entity_type)
 
     def get_filtered_items(self) -> List[Dict]:
         """
@@ -119,16 +127,7 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        item_ids = self.get_entity_ids_in_area('item')
-
-        if not item_ids:
-            return []
-
-        # Obtener items desde BD
-        all_items = self.db.get_all_items(active_only=True)
-
-        # Filtrar por IDs del proyecto
-        filtered = [item for item in all_items if item['id'] in item_ids]
+        filtered = self.db.get_entities_in_area(self._active_area_filter, 'item')
 
         logger.debug(f"Filtered {len(filtered)} items for Area {self._active_area_filter}")
         return filtered
@@ -143,16 +142,7 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        category_ids = self.get_entity_ids_in_area('category')
-
-        if not category_ids:
-            return []
-
-        # Obtener categorías desde BD
-        all_categories = self.db.get_categories(include_inactive=False)
-
-        # Filtrar por IDs del proyecto
-        filtered = [cat for cat in all_categories if cat['id'] in category_ids]
+        filtered = self.db.get_entities_in_area(self._active_area_filter, 'category')
 
         logger.debug(f"Filtered {len(filtered)} categories for Area {self._active_area_filter}")
         return filtered
@@ -167,16 +157,8 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        tag_ids = self.get_entity_ids_in_area('tag')
-
-        if not tag_ids:
-            return []
-
-        # Obtener tags desde BD
-        all_tags = self.db.get_all_tags()
-
-        # Filtrar por IDs del proyecto
-        filtered_tags = [tag['name'] for tag in all_tags if tag['id'] in tag_ids]
+        tags = self.db.get_entities_in_area(self._active_area_filter, 'tag')
+        filtered_tags = [tag['name'] for tag in tags]
 
         logger.debug(f"Filtered {len(filtered_tags)} tags for Area {self._active_area_filter}")
         return filtered_tags
@@ -186,20 +168,7 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        list_ids = self.get_entity_ids_in_area('list')
-
-        if not list_ids:
-            return []
-
-        # Obtener todas las listas
-        all_lists = []
-        categories = self.db.get_categories()
-        for cat in categories:
-            lists = self.db.get_listas_by_category_new(cat['id'])
-            all_lists.extend(lists)
-
-        # Filtrar por IDs del proyecto
-        filtered = [lst for lst in all_lists if lst['id'] in list_ids]
+        filtered = self.db.get_entities_in_area(self._active_area_filter, 'list')
 
         logger.debug(f"Filtered {len(filtered)} lists for Area {self._active_area_filter}")
         return filtered
@@ -209,16 +178,7 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        process_ids = self.get_entity_ids_in_area('process')
-
-        if not process_ids:
-            return []
-
-        # Obtener procesos desde BD
-        all_processes = self.db.get_all_processes()
-
-        # Filtrar por IDs del proyecto
-        filtered = [proc for proc in all_processes if proc['id'] in process_ids]
+        filtered = self.db.get_entities_in_area(self._active_area_filter, 'process')
 
         logger.debug(f"Filtered {len(filtered)} processes for Area {self._active_area_filter}")
         return filtered
@@ -228,16 +188,7 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return []
 
-        table_ids = self.get_entity_ids_in_area('table')
-
-        if not table_ids:
-            return []
-
-        # Obtener tablas desde BD
-        all_tables = self.db.get_all_tables()
-
-        # Filtrar por IDs del proyecto
-        filtered = [tbl for tbl in all_tables if tbl['id'] in table_ids]
+        filtered = self.db.get_entities_in_area(self._active_area_filter, 'table')
 
         logger.debug(f"Filtered {len(filtered)} tables for Area {self._active_area_filter}")
         return filtered
@@ -258,8 +209,11 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return False
 
-        entity_ids = self.get_entity_ids_in_area(entity_type)
-        return entity_id in entity_ids
+        # Si el set ya está en caché, usarlo; si no, consulta puntual sin llenar el caché
+        if (self._active_area_filter, entity_type) in self._cached_keys:
+            return entity_id in self.get_entity_ids_in_area(entity_type)
+
+        return self.db.area_has_entity(self._active_area_filter, entity_type, entity_id)
 
     def filter_items_by_area(self, items: List[Dict]) -> List[Dict]:
         """
@@ -305,12 +259,14 @@ class AreaFilterEngine:
         if not self._active_area_filter:
             return {}
 
+        counts = self.db.get_area_entity_counts(self._active_area_filter)
+
         return {
             'Area_id': self._active_area_filter,
-            'items': len(self.get_entity_ids_in_area('item')),
-            'categories': len(self.get_entity_ids_in_area('category')),
-            'tags': len(self.get_entity_ids_in_area('tag')),
-            'lists': len(self.get_entity_ids_in_area('list')),
-            'processes': len(self.get_entity_ids_in_area('process')),
-            'tables': len(self.get_entity_ids_in_area('table'))
+            'items': counts.get('item', 0),
+            'categories': counts.get('category', 0),
+            'tags': counts.get('tag', 0),
+            'lists': counts.get('list', 0),
+            'processes': counts.get('process', 0),
+            'tables': counts.get('table', 0)
         }
@@ -13,10 +13,20 @@ from typing import List, Dict, Optional, Tuple, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.database.db_manager import DBManager
-from src.models.area import Area, AreaRelation, AreaComponent, validate_entity_type
+from src.core.entity_metadata import fetch_entity_metadata, fetch_entities_metadata_batch
+from src.models.area import Area, AreaRelation, AreaComponent, VALID_ENTITY_TYPES
 
 logger = logging.getLogger(__name__)
 
+# Tipo de entidad -> clave del diccionario agrupado
+_TYPE_TO_GROUP = {
+    'tag': 'tags',
+    'process': 'processes',
+    'list': 'lists',
+    'table': 'tables',
+    'category': 'categories',
+    'item': 'items',
+}
 
 class AreaManager(QObject):
     """
@@ -31,6 +41,7 @@ class AreaManager(QObject):
     area_deleted = pyqtSignal(int)   # area_id
     relation_added = pyqtSignal(int, str, int)  # area_id, entity_type, entity_id
     relation_removed = pyqtSignal(int, str, int)
+    relations_bulk_changed = pyqtSignal(int)  # area_id (operaciones masivas)
     component_added = pyqtSignal(int, str)  # area_id, component_type
     component_removed = pyqtSignal(int)  # component_id
 
@@ -120,8 +131,7 @@ class AreaManager(QObject):
 
         if success:
             # Invalidar caché de esta área
-            if area_id in self._areas_cache:
-                del self._areas_cache[area_id]
+            self._areas_cache.pop(area_id, None)
 
             # Obtener área actualizada y emitir señal
             area = self.get_area(area_id)
@@ -138,8 +148,7 @@ class AreaManager(QObject):
 
         if success:
             # Remover del caché
-            if area_id in self._areas_cache:
-                del self._areas_cache[area_id]
+            self._areas_cache.pop(area_id, None)
 
             self.area_deleted.emit(area_id)
             logger.info(f"Área {area_id} eliminada")
@@ -165,29 +174,13 @@ class AreaManager(QObject):
             True si se agregó exitosamente
         """
         # Validar tipo de entidad
-        if not validate_entity_type(entity_type):
+        if entity_type not in VALID_ENTITY_TYPES:
             logger.error(f"Tipo de entidad inválido: {entity_type}")
             return False
 
         # Si no se especifica orden, agregar al final
         if order_index is None:
-            # Obtener el order_index máximo actual
-            relations = self.db.get_area_relations(area_id)
-            components = self.db.get_area_components(area_id)
-
-            max_order = -1
-            for rel in relations:
-                rel_order = rel.get('order_index')
-                # Manejar None explícitamente
-                if rel_order is not None and rel_order > max_order:
-                    max_order = rel_order
-            for comp in components:
-                comp_order = comp.get('order_index')
-                # Manejar None explícitamente
-                if comp_order is not None and comp_order > max_order:
-                    max_order = comp_order
-
-            order_index = max_order + 1
+            order_index = self.db.get_area_max_order(area_id) + 1
 
         try:
             relation_id = self.db.add_area_relation(
@@ -221,9 +214,7 @@ class AreaManager(QObject):
                                 content: str = "", order_index: int = None) -> bool:
         """Agrega un componente estructural al área"""
         if order_index is None:
-            relations = self.db.get_area_relations(area_id)
-            components = self.db.get_area_components(area_id)
-            order_index = len(relations) + len(components)
+            order_index = self.db.get_area_max_order(area_id) + 1
 
         try:
             component_id = self.db.add_area_component(
@@ -251,19 +242,11 @@ class AreaManager(QObject):
         """
         relations = self.db.get_area_relations(area_id)
 
-        grouped = {
-            'tags': [],
-            'processes': [],
-            'lists': [],
-            'tables': [],
-            'categories': [],
-            'items': []
-        }
+        grouped = {key: [] for key in _TYPE_TO_GROUP.values()}
 
         for rel in relations:
-            entity_type = rel['entity_type']
-            key = entity_type + 's'  # 'tag' -> 'tags'
-            if key in grouped:
+            key = _TYPE_TO_GROUP.get(rel['entity_type'])
+            if key:
                 grouped[key].append(rel)
 
         return grouped
@@ -277,64 +260,25 @@ class AreaManager(QObject):
         """
         from src.models.area import get_entity_type_icon, get_entity_type_label
 
-        metadata = {
-            'type': entity_type,
-            'id': entity_id,
-            'icon': get_entity_type_icon(entity_type),
-            'label': get_entity_type_label(entity_type),
-            'name': '',
-            'content': ''
-        }
+        return fetch_entity_metadata(
+            self.db, entity_type, entity_id, get_entity_type_icon, get_entity_type_label
+        )
 
-        # Obtener nombre/contenido desde BD
-        try:
-            if entity_type == 'tag':
-                result = self.db.execute_query(
-                    "SELECT name FROM tags WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'item':
-                result = self.db.execute_query(
-                    "SELECT label, content FROM items WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['label']
-                    metadata['content'] = result[0]['content']
-
-            elif entity_type == 'list':
-                result = self.db.execute_query(
-                    "SELECT name FROM listas WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'process':
-                result = self.db.execute_query(
-                    "SELECT name FROM processes WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'table':
-                result = self.db.execute_query(
-                    "SELECT name FROM tables WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'category':
-                result = self.db.execute_query(
-                    "SELECT name FROM categories WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
+    def get_entities_metadata_batch(self, pairs: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict]:
+        """
+        Obtiene metadata de varias entidades con una consulta por tipo
 
-        except Exception as e:
-            logger.error(f"Error obteniendo metadata de {entity_type}#{entity_id}: {e}")
+        Args:
+            pairs: Lista de tuplas (entity_type, entity_id)
 
-        return metadata
+        Returns:
+            Diccionario {(entity_type, entity_id): metadata}
+        """
+        from src.models.area import get_entity_type_icon, get_entity_type_label
+
+        return fetch_entities_metadata_batch(
+            self.db, pairs, get_entity_type_icon, get_entity_type_label
+        )
 
     def validate_area_name(self, name: str, exclude_id: int = None) -> Tuple[bool, str]:
         """
@@ -350,11 +294,8 @@ class AreaManager(QObject):
             return False, "El nombre es demasiado largo (máx 100 caracteres)"
 
         # Verificar unicidad
-        all_areas = self.db.get_all_areas(active_only=False)
-        for area in all_areas:
-            if area['name'].lower() == name.lower():
-                if exclude_id is None or area['id'] != exclude_id:
-                    return False, f"Ya existe un área con el nombre '{name}'"
+        if self.db.area_name_exists(name, exclude_id):
+            return False, f"Ya existe un área con el nombre '{name}'"
 
         return True, ""
 
@@ -392,26 +333,18 @@ class AreaManager(QObject):
 
         new_area_id = new_area['id']
 
-        # Copiar relaciones
-        relations = self.db.get_area_relations(area_id)
-        for rel in relations:
-            self.db.add_area_relation(
-                new_area_id,
-                rel['entity_type'],
-                rel['entity_id'],
-                rel['description'],
-                rel['order_index']
-            )
+        # Copiar relaciones y componentes directamente en SQL (una transacción)
+        try:
+            self.db.clone_area_contents(area_id, new_area_id)
+        except Exception as e:
+            logger.error(f"Error copiando contenido del área {area_id}: {e}")
+            # No dejar un área a medio duplicar (ni su nombre ocupado)
+            if self.db.purge_area(new_area_id):
+                self._areas_cache.pop(new_area_id, None)
+                self.area_deleted.emit(new_area_id)
+            return None
 
-        # Copiar componentes
-        components = self.db.get_area_components(area_id)
-        for comp in components:
-            self.db.add_area_component(
-                new_area_id,
-                comp['component_type'],
-                comp['content'],
-                comp['order_index']
-            )
+        self.relations_bulk_changed.emit(new_area_id)
 
         logger.info(f"Área duplicada: {original['name']} -> {new_name}")
         return new_area
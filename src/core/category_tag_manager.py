@@ -7,7 +7,7 @@ Los tags de categorías son diferentes de los tags de items/projects.
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.models.category_tag import CategoryTag
 
 logger = logging.getLogger(__name__)
@@ -29,8 +29,38 @@ class CategoryTagManager:
             db: DBManager instance
         """
         self.db = db
+        self._tags_cache: Optional[List[CategoryTag]] = None
+        self._by_name: Dict[str, CategoryTag] = {}
+        self._by_id: Dict[int, CategoryTag] = {}
         logger.info("CategoryTagManager initialized")
 
+    def invalidate_cache(self):
+        """Invalidar el caché de tags (se recarga en el próximo acceso)"""
+        self._tags_cache = None
+        self._by_name = {}
+        self._by_id = {}
+
+    def _load_cache(self) -> List[CategoryTag]:
+        """
+        Cargar todos los tags desde la BD y construir los índices
+
+        Returns:
+            List[CategoryTag]: Lista de tags cacheada
+        """
+        tags_data = self.db.get_all_category_tags()
+        self._tags_cache = [
+            CategoryTag(
+                id=tag['id'],
+                name=tag['name'],
+                created_at=tag.get('created_at'),
+                updated_at=tag.get('updated_at')
+            )
+            for tag in tags_data
+        ]
+        self._by_name = {tag.name.lower(): tag for tag in self._tags_cache}
+        self._by_id = {tag.id: tag for tag in self._tags_cache}
+        return self._tags_cache
+
     def get_all_tags(self) -> List[CategoryTag]:
         """
         Obtener todos los tags de categorías
@@ -39,17 +69,9 @@ class CategoryTagManager:
             List[CategoryTag]: Lista de tags ordenados alfabéticamente
         """
         try:
-            tags_data = self.db.get_all_category_tags()
-            tags = [
-                CategoryTag(
-                    id=tag['id'],
-                    name=tag['name'],
-                    created_at=tag.get('created_at'),
-                    updated_at=tag.get('updated_at')
-                )
-                for tag in tags_data
-            ]
-            return tags
+            if self._tags_cache is None:
+                self._load_cache()
+            return list(self._tags_cache)
         except Exception as e:
             logger.error(f"Error getting all category tags: {e}")
             return []
@@ -65,11 +87,9 @@ class CategoryTagManager:
             CategoryTag o None si no se encuentra
         """
         try:
-            all_tags = self.get_all_tags()
-            for tag in all_tags:
-                if tag.id == tag_id:
-                    return tag
-            return None
+            if self._tags_cache is None:
+                self._load_cache()
+            return self._by_id.get(tag_id)
         except Exception as e:
             logger.error(f"Error getting category tag {tag_id}: {e}")
             return None
@@ -85,12 +105,9 @@ class CategoryTagManager:
             CategoryTag o None si no se encuentra
         """
         try:
-            name = name.strip().lower()
-            all_tags = self.get_all_tags()
-            for tag in all_tags:
-                if tag.name.lower() == name:
-                    return tag
-            return None
+            if self._tags_cache is None:
+                self._load_cache()
+            return self._by_name.get(name.strip().lower())
         except Exception as e:
             logger.error(f"Error getting category tag by name '{name}': {e}")
             return None
@@ -122,6 +139,7 @@ class CategoryTagManager:
             tag_id = self.db.get_or_create_category_tag(name)
 
             if tag_id:
+                self.invalidate_cache()
                 return CategoryTag(
                     id=tag_id,
                     name=name,
@@ -149,7 +167,9 @@ class CategoryTagManager:
                 return self.get_all_tags()
 
             query = query.lower()
-            all_tags = self.get_all_tags()
+            if self._tags_cache is None:
+                self._load_cache()
+            all_tags = self._tags_cache
 
             # Buscar tags que contengan el query
             matching_tags = [
@@ -171,7 +191,9 @@ class CategoryTagManager:
             int: Número de tags eliminados
         """
         try:
-            return self.db.delete_unused_category_tags()
+            deleted = self.db.delete_unused_category_tags()
+            self.invalidate_cache()
+            return deleted
         except Exception as e:
             logger.error(f"Error deleting unused category tags: {e}")
             return 0
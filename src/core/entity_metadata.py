@@ -0,0 +1,135 @@
+"""
+Entity Metadata - Lectura de metadata (nombre, contenido, icono) de entidades
+
+Compartido por AreaManager y ProjectManager: ambos relacionan las mismas
+entidades (tags, items, listas, procesos, tablas, categorías) y solo difieren
+en el icono/etiqueta que muestran para cada tipo.
+"""
+
+import logging
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tipo de entidad -> (tabla, columnas con alias uniformes name/content)
+ENTITY_METADATA_SOURCES = {
+    'tag': ('tags', "name AS name, '' AS content"),
+    'item': ('items', "label AS name, content AS content"),
+    'list': ('listas', "name AS name, '' AS content"),
+    'process': ('processes', "name AS name, '' AS content"),
+    'table': ('tables', "name AS name, '' AS content"),
+    'category': ('categories', "name AS name, '' AS content"),
+}
+
+# Consultas precompiladas para obtener metadata de una sola entidad
+_META_SQL = {
+    entity_type: f"SELECT {columns} FROM {table} WHERE id = ?"
+    for entity_type, (table, columns) in ENTITY_METADATA_SOURCES.items()
+}
+
+
+def empty_entity_metadata(entity_type: str, entity_id: int,
+                          icon_for: Callable[[str], str],
+                          label_for: Callable[[str], str]) -> Dict:
+    """
+    Crea el diccionario base de metadata de una entidad
+
+    Args:
+        entity_type: Tipo de entidad
+        entity_id: ID de la entidad
+        icon_for: Función tipo -> icono
+        label_for: Función tipo -> etiqueta
+
+    Returns:
+        Diccionario con type, id, icon, label, name y content vacíos
+    """
+    return {
+        'type': entity_type,
+        'id': entity_id,
+        'icon': icon_for(entity_type),
+        'label': label_for(entity_type),
+        'name': '',
+        'content': ''
+    }
+
+
+def fetch_entity_metadata(db, entity_type: str, entity_id: int,
+                          icon_for: Callable[[str], str],
+                          label_for: Callable[[str], str]) -> Dict:
+    """
+    Obtiene metadata de una entidad (nombre, icono, etc)
+
+    Args:
+        db: DBManager sobre el que consultar
+        entity_type: Tipo de entidad
+        entity_id: ID de la entidad
+        icon_for: Función tipo -> icono
+        label_for: Función tipo -> etiqueta
+
+    Returns:
+        Diccionario con metadata de la entidad
+    """
+    metadata = empty_entity_metadata(entity_type, entity_id, icon_for, label_for)
+
+    # Obtener nombre/contenido desde BD
+    try:
+        sql = _META_SQL.get(entity_type)
+        if sql:
+            result = db.execute_query(sql, (entity_id,))
+            if result:
+                metadata['name'] = result[0]['name']
+                metadata['content'] = result[0]['content']
+
+    except Exception as e:
+        logger.error(f"Error obteniendo metadata de {entity_type}#{entity_id}: {e}")
+
+    return metadata
+
+
+def fetch_entities_metadata_batch(db, pairs: List[Tuple[str, int]],
+                                  icon_for: Callable[[str], str],
+                                  label_for: Callable[[str], str]) -> Dict[Tuple[str, int], Dict]:
+    """
+    Obtiene metadata de varias entidades con una consulta por tipo
+
+    Args:
+        db: DBManager sobre el que consultar
+        pairs: Lista de tuplas (entity_type, entity_id)
+        icon_for: Función tipo -> icono
+        label_for: Función tipo -> etiqueta
+
+    Returns:
+        Diccionario {(entity_type, entity_id): metadata}
+    """
+    metadata_map: Dict[Tuple[str, int], Dict] = {}
+    by_type: Dict[str, List[int]] = {}
+
+    for entity_type, entity_id in pairs:
+        if (entity_type, entity_id) not in metadata_map:
+            metadata_map[(entity_type, entity_id)] = empty_entity_metadata(
+                entity_type, entity_id, icon_for, label_for
+            )
+            by_type.setdefault(entity_type, []).append(entity_id)
+
+    for entity_type, ids in by_type.items():
+        source = ENTITY_METADATA_SOURCES.get(entity_type)
+        if not source:
+            continue
+
+        table, columns = source
+        placeholders = ','.join('?' * len(ids))
+
+        try:
+            rows = db.execute_query(
+                f"SELECT id, {columns} FROM {table} WHERE id IN ({placeholders})",
+                tuple(ids)
+            )
+            for row in rows:
+                metadata = metadata_map[(entity_type, row['id'])]
+                metadata['name'] = row['name']
+                metadata['content'] = row['content']
+
+        except Exception as e:
+            logger.error(f"Error obteniendo metadata de {entity_type} ({len(ids)} ids): {e}")
+
+    return metadata_map
@@ -10,6 +10,7 @@ Responsabilidades:
 """
 
 import logging
+import re
 from typing import List, Dict, Optional, Tuple, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -17,12 +18,17 @@ from src.database.db_manager import DBManager
 from src.models.project_element_tag import (
     ProjectElementTag,
     create_tag_from_db_row,
+    create_tag_from_db_tuple,
     filter_tags_by_name,
     sort_tags_by_name
 )
 
 logger = logging.getLogger(__name__)
 
+# Patrones de validación precompilados
+_TAG_NAME_RE = re.compile(r'^[a-zA-Z0-9\s_-]+$')
+_HEX_COLOR_RE = re.compile(r'^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$')
+
 
 class ProjectElementTagManager(QObject):
     """
@@ -36,8 +42,10 @@ class ProjectElementTagManager(QObject):
     tag_created = pyqtSignal(dict)      # tag_data
     tag_updated = pyqtSignal(dict)      # tag_data
     tag_deleted = pyqtSignal(int)       # tag_id
+    tags_created_batch = pyqtSignal(list)  # [tag_data, ...]
     tag_associated = pyqtSignal(int, int)  # relation_id, tag_id
     tag_removed = pyqtSignal(int, int)     # relation_id, tag_id
+    tags_associated_batch = pyqtSignal(int, list)  # relation_id/component_id, tag_ids
     cache_invalidated = pyqtSignal()
 
     def __init__(self, db_manager: DBManager):
@@ -50,6 +58,11 @@ class ProjectElementTagManager(QObject):
         super().__init__()
         self.db = db_manager
         self._tags_cache: Optional[Dict[int, ProjectElementTag]] = None  # Lazy loading
+        self._name_index: Dict[str, int] = {}  # nombre -> ID (paralelo a _tags_cache)
+        # Listas paralelas para filter_tags (None = reconstruir en el próximo uso)
+        self._cached_names_lower: Optional[List[str]] = None
+        self._cached_ids: Optional[List[int]] = None
+        self._usage_count_cache: Optional[Dict[int, int]] = None  # tag_id -> asociaciones
         self._cache_enabled = True
         logger.info("ProjectElementTagManager initialized")
 
@@ -58,20 +71,77 @@ class ProjectElementTagManager(QObject):
     def invalidate_cache(self):
         """Invalida el caché de tags"""
         self._tags_cache = None
+        self._name_index = {}
+        self._cached_names_lower = None
+        self._cached_ids = None
+        self._usage_count_cache = None
         self.cache_invalidated.emit()
         logger.debug("Tags cache invalidated")
 
-    def _cache_tag(self, tag: ProjectElementTag):
+    def set_cache_enabled(self, enabled: bool):
+        """
+        Activa o desactiva el caché de tags
+
+        Con el caché activo se mantienen todos los tags en memoria. Desactivarlo
+        libera esa memoria (incluidos los conteos de uso) y hace que cada
+        consulta vaya a la BD.
+
+        Args:
+            enabled: True para activar el caché
+        """
+        self._cache_enabled = enabled
+        if not enabled:
+            self._tags_cache = None
+            self._name_index = {}
+            self._cached_names_lower = None
+            self._cached_ids = None
+            self._usage_count_cache = None
+
+    def _put(self, tag: ProjectElementTag):
         """
-        Agrega un tag al caché
+        Agrega o actualiza un tag en el caché y en el índice por nombre
+
+        Solo actúa si el caché ya está cargado: un caché parcial haría que
+        get_all_tags() retornara solo algunos tags.
 
         Args:
             tag: Tag a agregar al caché
         """
-        if self._cache_enabled and tag:
-            if self._tags_cache is None:
-                self._tags_cache = {}
-            self._tags_cache[tag.id] = tag
+        if not self._cache_enabled or not tag or self._tags_cache is None:
+            return
+
+        old_tag = self._tags_cache.get(tag.id)
+        if old_tag is not None and old_tag.name != tag.name:
+            self._name_index.pop(old_tag.name, None)
+
+        self._tags_cache[tag.id] = tag
+        self._name_index[tag.name] = tag.id
+        self._cached_names_lower = None
+
+    def _drop(self, tag_id: int):
+        """
+        Elimina un tag del caché y del índice por nombre
+
+        Args:
+            tag_id: ID del tag
+        """
+        if self._tags_cache is None:
+            return
+
+        old_tag = self._tags_cache.pop(tag_id, None)
+        if old_tag is not None:
+            self._name_index.pop(old_tag.name, None)
+            self._cached_names_lower = None
+
+    def invalidate_usage_counts(self):
+        """
+        Descarta los conteos de uso (se recalculan en el próximo acceso)
+
+        Llamar también cuando se modifican asociaciones sin pasar por este
+        manager (p. ej. al eliminar relaciones/componentes, que borran sus
+        asociaciones en cascada).
+        """
+        self._usage_count_cache = None
 
     def _get_from_cache(self, tag_id: int) -> Optional[ProjectElementTag]:
         """
@@ -101,12 +171,19 @@ class ProjectElementTagManager(QObject):
             return
 
         try:
-            all_tags_data = self.db.get_all_project_element_tags()
-            self._tags_cache = {}
+            tags_cache = {}
+            name_index = {}
 
-            for tag_data in all_tags_data:
-                tag = create_tag_from_db_row(tag_data)
-                self._tags_cache[tag.id] = tag
+            # Tuplas en lugar de dicts: evita un dict intermedio por fila
+            for row in self.db.iter_project_element_tags_tuples():
+                tag = create_tag_from_db_tuple(row)
+                tags_cache[tag.id] = tag
+                name_index[tag.name] = tag.id
+
+            self._tags_cache = tags_cache
+            self._name_index = name_index
+            self._cached_names_lower = None
+            self._usage_count_cache = self.db.get_project_element_tag_usage_counts()
 
             logger.debug(f"Tags cache loaded: {len(self._tags_cache)} tags")
 
@@ -140,14 +217,13 @@ class ProjectElementTagManager(QObject):
             return None
 
         try:
-            tag_id = self.db.add_project_element_tag(name, color, description)
-            tag_data = self.db.get_project_element_tag_by_id(tag_id)
+            tag_data = self.db.create_project_element_tag(name, color, description)
 
             if tag_data:
                 tag = create_tag_from_db_row(tag_data)
-                self._cache_tag(tag)
+                self._put(tag)
                 self.tag_created.emit(tag_data)
-                logger.info(f"Tag creado: {name} (ID: {tag_id})")
+                logger.info(f"Tag creado: {name} (ID: {tag.id})")
                 return tag
 
             return None
@@ -170,6 +246,9 @@ class ProjectElementTagManager(QObject):
         Returns:
             Lista de tags
         """
+        if not self._cache_enabled:
+            return [create_tag_from_db_row(tag_data) for tag_data in self.db.get_all_project_element_tags()]
+
         if refresh or self._tags_cache is None:
             self._load_cache(force=refresh)
 
@@ -185,7 +264,10 @@ class ProjectElementTagManager(QObject):
         Returns:
             Tag o None si no existe
         """
-        # Intentar desde caché
+        # Intentar desde caché (se carga completo en el primer acceso)
+        if self._tags_cache is None:
+            self._load_cache()
+
         cached = self._get_from_cache(tag_id)
         if cached:
             return cached
@@ -194,7 +276,7 @@ class ProjectElementTagManager(QObject):
         tag_data = self.db.get_project_element_tag_by_id(tag_id)
         if tag_data:
             tag = create_tag_from_db_row(tag_data)
-            self._cache_tag(tag)
+            self._put(tag)
             return tag
 
         return None
@@ -209,10 +291,18 @@ class ProjectElementTagManager(QObject):
         Returns:
             Tag o None si no existe
         """
+        # Intentar desde el índice por nombre
+        if self._tags_cache is None:
+            self._load_cache()
+
+        tag_id = self._name_index.get(name)
+        if tag_id is not None:
+            return self._tags_cache[tag_id]
+
         tag_data = self.db.get_project_element_tag_by_name(name)
         if tag_data:
             tag = create_tag_from_db_row(tag_data)
-            self._cache_tag(tag)
+            self._put(tag)
             return tag
 
         return None
@@ -244,23 +334,19 @@ class ProjectElementTagManager(QObject):
             return False
 
         try:
-            success = self.db.update_project_element_tag(tag_id, name, color, description)
-
-            if success:
-                # Invalidar caché de este tag
-                if tag_id in self._tags_cache:
-                    del self._tags_cache[tag_id]
+            # La fila actualizada llega en la misma sentencia (UPDATE ... RETURNING)
+            tag_data = self.db.update_project_element_tag_returning(tag_id, name, color, description)
 
-                # Obtener tag actualizado y emitir señal
-                tag_data = self.db.get_project_element_tag_by_id(tag_id)
-                if tag_data:
-                    tag = create_tag_from_db_row(tag_data)
-                    self._cache_tag(tag)
-                    self.tag_updated.emit(tag_data)
+            if tag_data:
+                # Reemplazar el tag cacheado y emitir señal
+                self._drop(tag_id)
+                tag = create_tag_from_db_row(tag_data)
+                self._put(tag)
+                self.tag_updated.emit(tag_data)
 
                 logger.info(f"Tag {tag_id} actualizado")
 
-            return success
+            return tag_data is not None
 
         except ValueError as e:
             # Nombre duplicado
@@ -281,7 +367,7 @@ class ProjectElementTagManager(QObject):
             True si se eliminó correctamente
         """
         # Verificar uso del tag
-        usage_count = self.db.get_tag_usage_count(tag_id)
+        usage_count = self.get_tag_usage_count(tag_id)
         if usage_count > 0:
             logger.warning(f"Tag {tag_id} está en uso ({usage_count} relaciones)")
             # Nota: Aún así se puede eliminar gracias a CASCADE
@@ -292,8 +378,9 @@ class ProjectElementTagManager(QObject):
 
             if success:
                 # Remover del caché
-                if tag_id in self._tags_cache:
-                    del self._tags_cache[tag_id]
+                self._drop(tag_id)
+                if self._usage_count_cache is not None:
+                    self._usage_count_cache.pop(tag_id, None)
 
                 self.tag_deleted.emit(tag_id)
                 logger.info(f"Tag {tag_id} eliminado")
@@ -323,7 +410,7 @@ class ProjectElementTagManager(QObject):
 
             # Agregar al caché
             for tag in tags:
-                self._cache_tag(tag)
+                self._put(tag)
 
             return tags
 
@@ -348,9 +435,9 @@ class ProjectElementTagManager(QObject):
             success = self.db.update_project_relation_tags(relation_id, tag_ids)
 
             if success:
-                # Emitir señal por cada tag asociado
-                for tag_id in tag_ids:
-                    self.tag_associated.emit(relation_id, tag_id)
+                self.invalidate_usage_counts()
+                # Una sola señal para todos los tags asignados
+                self.tags_associated_batch.emit(relation_id, list(tag_ids))
 
                 logger.info(f"Tags asignados a relación {relation_id}: {len(tag_ids)} tags")
 
@@ -375,6 +462,7 @@ class ProjectElementTagManager(QObject):
             success = self.db.add_tag_to_project_relation(relation_id, tag_id)
 
             if success:
+                self.invalidate_usage_counts()
                 self.tag_associated.emit(relation_id, tag_id)
                 logger.info(f"Tag {tag_id} asociado a relación {relation_id}")
 
@@ -399,6 +487,7 @@ class ProjectElementTagManager(QObject):
             success = self.db.remove_tag_from_project_relation(relation_id, tag_id)
 
             if success:
+                self.invalidate_usage_counts()
                 self.tag_removed.emit(relation_id, tag_id)
                 logger.info(f"Tag {tag_id} removido de relación {relation_id}")
 
@@ -424,7 +513,7 @@ class ProjectElementTagManager(QObject):
 
             # Agregar al caché
             for tag in tags:
-                self._cache_tag(tag)
+                self._put(tag)
 
             return tags
 
@@ -443,8 +532,7 @@ class ProjectElementTagManager(QObject):
             Lista de IDs de relaciones
         """
         try:
-            relations = self.db.get_project_relations_by_tag(tag_id)
-            return [rel['id'] for rel in relations]
+            return self.db.get_project_relation_ids_by_tag(tag_id)
 
         except Exception as e:
             logger.error(f"Error obteniendo relaciones por tag: {e}")
@@ -467,9 +555,9 @@ class ProjectElementTagManager(QObject):
             success = self.db.update_project_component_tags(component_id, tag_ids)
 
             if success:
-                # Emitir señal por cada tag asociado
-                for tag_id in tag_ids:
-                    self.tag_associated.emit(component_id, tag_id)
+                self.invalidate_usage_counts()
+                # Una sola señal para todos los tags asignados
+                self.tags_associated_batch.emit(component_id, list(tag_ids))
 
                 logger.info(f"Tags asignados a componente {component_id}: {len(tag_ids)} tags")
 
@@ -494,6 +582,7 @@ class ProjectElementTagManager(QObject):
             success = self.db.add_tag_to_project_component(component_id, tag_id)
 
             if success:
+                self.invalidate_usage_counts()
                 self.tag_associated.emit(component_id, tag_id)
                 logger.info(f"Tag {tag_id} asociado a componente {component_id}")
 
@@ -518,6 +607,7 @@ class ProjectElementTagManager(QObject):
             success = self.db.remove_tag_from_project_component(component_id, tag_id)
 
             if success:
+                self.invalidate_usage_counts()
                 self.tag_removed.emit(component_id, tag_id)
                 logger.info(f"Tag {tag_id} removido de componente {component_id}")
 
@@ -576,7 +666,9 @@ class ProjectElementTagManager(QObject):
             Número de relaciones que usan el tag
         """
         try:
-            return self.db.get_tag_usage_count(tag_id)
+            if self._usage_count_cache is None:
+                self._usage_count_cache = self.db.get_project_element_tag_usage_counts()
+            return self._usage_count_cache.get(tag_id, 0)
         except Exception as e:
             logger.error(f"Error obteniendo conteo de uso: {e}")
             return 0
@@ -592,6 +684,20 @@ class ProjectElementTagManager(QObject):
             Lista de tuplas (tag, conteo de uso)
         """
         try:
+            if self._tags_cache is None:
+                self._load_cache()
+
+            # Calcular desde caché si está disponible
+            if self._tags_cache is not None:
+                if self._usage_count_cache is None:
+                    self._usage_count_cache = self.db.get_project_element_tag_usage_counts()
+                counts = self._usage_count_cache
+                ranked = sorted(
+                    self._tags_cache.values(),
+                    key=lambda t: (-counts.get(t.id, 0), t.name)
+                )
+                return [(tag, counts.get(tag.id, 0)) for tag in ranked[:limit]]
+
             popular_data = self.db.get_popular_project_element_tags(limit)
             result = []
 
@@ -601,7 +707,7 @@ class ProjectElementTagManager(QObject):
                 result.append((tag, usage_count))
 
                 # Agregar al caché
-                self._cache_tag(tag)
+                self._put(tag)
 
             return result
 
@@ -635,29 +741,14 @@ class ProjectElementTagManager(QObject):
             Lista de tags únicos usados en el proyecto, ordenados
         """
         try:
-            # Recopilar IDs de tags únicos
-            tag_ids = set()
-
-            # 1. Obtener tags de relaciones
-            relations = self.db.get_project_relations(project_id)
-            for relation in relations:
-                tags_data = self.db.get_tags_for_project_relation(relation['id'])
-                for tag_data in tags_data:
-                    tag_ids.add(tag_data['id'])
-
-            # 2. Obtener tags de componentes
-            components = self.db.get_project_components(project_id)
-            for component in components:
-                tags_data = self.db.get_tags_for_project_component(component['id'])
-                for tag_data in tags_data:
-                    tag_ids.add(tag_data['id'])
-
-            # Obtener objetos Tag completos
+            # Tags únicos de relaciones y componentes en una sola consulta
             tags = []
-            for tag_id in tag_ids:
-                tag = self.get_tag(tag_id)
-                if tag:
-                    tags.append(tag)
+            for tag_data in self.db.get_distinct_tags_for_project(project_id):
+                tag = self._get_from_cache(tag_data['id'])
+                if tag is None:
+                    tag = create_tag_from_db_row(tag_data)
+                    self._put(tag)
+                tags.append(tag)
 
             # Obtener orden personalizado
             tag_orders = self.db.get_project_tag_orders(project_id)
@@ -724,8 +815,22 @@ class ProjectElementTagManager(QObject):
         if not query:
             return self.get_all_tags()
 
-        tags = self.get_all_tags()
-        return filter_tags_by_name(tags, query)
+        if self._tags_cache is None:
+            self._load_cache()
+        if self._tags_cache is None:
+            # Caché deshabilitado
+            return filter_tags_by_name(self.get_all_tags(), query)
+
+        if self._cached_names_lower is None:
+            self._cached_ids = list(self._tags_cache)
+            self._cached_names_lower = [tag.name.lower() for tag in self._tags_cache.values()]
+
+        q = query.lower()
+        return [
+            self._tags_cache[tag_id]
+            for name, tag_id in zip(self._cached_names_lower, self._cached_ids)
+            if q in name
+        ]
 
     # ==================== VALIDACIONES ====================
 
@@ -746,8 +851,7 @@ class ProjectElementTagManager(QObject):
             return False, "El nombre no puede exceder 50 caracteres"
 
         # Validar caracteres permitidos (alfanuméricos, espacios, guiones, underscores)
-        import re
-        if not re.match(r'^[a-zA-Z0-9\s_-]+$', name):
+        if not _TAG_NAME_RE.match(name):
             return False, "El nombre solo puede contener letras, números, espacios, guiones y underscores"
 
         return True, ""
@@ -762,13 +866,11 @@ class ProjectElementTagManager(QObject):
         Returns:
             True si es válido
         """
-        if not color:
+        # Formato: #RRGGBB o #RGB
+        if not color or len(color) not in (4, 7):
             return False
 
-        import re
-        # Formato: #RRGGBB o #RGB
-        pattern = r'^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})$'
-        return bool(re.match(pattern, color))
+        return bool(_HEX_COLOR_RE.match(color))
 
     # ==================== OPERACIONES BATCH ====================
 
@@ -776,6 +878,8 @@ class ProjectElementTagManager(QObject):
         """
         Crea múltiples tags en batch
 
+        Valida todos los tags primero y los inserta en una sola transacción.
+
         Args:
             tags_data: Lista de diccionarios con datos de tags
                       [{'name': 'python', 'color': '#3776ab', 'description': '...'}, ...]
@@ -783,22 +887,62 @@ class ProjectElementTagManager(QObject):
         Returns:
             Lista de tags creados (None en posiciones donde falló)
         """
-        results = []
+        results: List[Optional[ProjectElementTag]] = [None] * len(tags_data)
+        pending = []  # (índice, name, color, description)
 
-        for tag_data in tags_data:
+        for index, tag_data in enumerate(tags_data):
             name = tag_data.get('name')
             color = tag_data.get('color', '#3498db')
             description = tag_data.get('description', '')
 
-            tag = self.create_tag(name, color, description)
-            results.append(tag)
+            is_valid, error_msg = self.validate_tag_name(name)
+            if not is_valid:
+                logger.error(f"Validación fallida: {error_msg}")
+                continue
+
+            if not self.validate_color(color):
+                logger.error(f"Color inválido: {color}")
+                continue
+
+            pending.append((index, name, color, description))
+
+        if pending:
+            try:
+                created_ids = self.db.add_project_element_tags_bulk(
+                    [(name, color, description) for _, name, color, description in pending]
+                )
+                rows_by_id = {
+                    row['id']: row
+                    for row in self.db.get_project_element_tags_by_ids(list(created_ids.values()))
+                }
+
+                created_data = []
+
+                for index, name, _, _ in pending:
+                    # pop: un nombre repetido en el lote solo se crea una vez
+                    tag_data = rows_by_id.get(created_ids.pop(name, None))
+                    if not tag_data:
+                        logger.error(f"Error creando tag: ya existe un tag con el nombre '{name}'")
+                        continue
+
+                    tag = create_tag_from_db_row(tag_data)
+                    self._put(tag)
+                    created_data.append(tag_data)
+                    results[index] = tag
+
+                # Una sola señal para todo el lote
+                if created_data:
+                    self.tags_created_batch.emit(created_data)
+
+            except Exception as e:
+                logger.error(f"Error creando tags en batch: {e}")
 
         logger.info(f"Batch creation: {len([t for t in results if t])} de {len(tags_data)} tags creados")
         return results
 
     def delete_tags_batch(self, tag_ids: List[int]) -> int:
         """
-        Elimina múltiples tags
+        Elimina múltiples tags con un solo DELETE
 
         Args:
             tag_ids: Lista de IDs de tags a eliminar
@@ -806,15 +950,18 @@ class ProjectElementTagManager(QObject):
         Returns:
             Número de tags eliminados exitosamente
         """
-        deleted_count = 0
+        unique_ids = list(dict.fromkeys(tag_ids))
 
-        for tag_id in tag_ids:
-            if self.delete_tag(tag_id):
-                deleted_count += 1
-
-        logger.info(f"Batch deletion: {deleted_count} de {len(tag_ids)} tags eliminados")
-        return deleted_count
+        # Solo los IDs que existían: los inexistentes no se notifican
+        deleted_ids = self.db.delete_project_element_tags_bulk(unique_ids) if unique_ids else []
+        for tag_id in deleted_ids:
+            self._drop(tag_id)
+            if self._usage_count_cache is not None:
+                self._usage_count_cache.pop(tag_id, None)
+            self.tag_deleted.emit(tag_id)
 
+        logger.info(f"Batch deletion: {len(deleted_ids)} de {len(tag_ids)} tags eliminados")
+        return len(deleted_ids)
 
     def get_tags_for_area(self, area_id: int) -> List[Any]:
         """
@@ -831,40 +978,14 @@ class ProjectElementTagManager(QObject):
             Lista de objetos tag (construidos desde area_element_tags)
         """
         try:
-            # Recopilar IDs de tags únicos para evitar duplicados
-            tag_ids = set()
-            tags_map = {}  # id -> tag_data
-            
-            # 1. Obtener tags de relaciones del área
-            relations = self.db.get_area_relations(area_id)
-            for relation in relations:
-                tags_data = self.db.get_tags_for_area_relation(relation['id'])
-                for tag_data in tags_data:
-                    if tag_data['id'] not in tag_ids:
-                        tag_ids.add(tag_data['id'])
-                        tags_map[tag_data['id']] = tag_data
-
-            # 2. Obtener tags de componentes del área
-            components = self.db.get_area_components(area_id)
-            for component in components:
-                tags_data = self.db.get_tags_for_area_component(component['id'])
-                for tag_data in tags_data:
-                    if tag_data['id'] not in tag_ids:
-                        tag_ids.add(tag_data['id'])
-                        tags_map[tag_data['id']] = tag_data
-            
-            # Convertir a objetos Tag (usando create_tag_from_db_row)
-            # Nota: create_tag_from_db_row espera dict con claves estándar (id, name, color, etc.)
-            # area_element_tags tiene esa estructura compatible.
+            # Tags únicos de relaciones y componentes en una sola consulta
             valid_tags = []
-            for tag_id in tag_ids:
-                tag_data = tags_map[tag_id]
+            for tag_data in self.db.get_area_element_tags_for_area(area_id):
                 try:
-                    tag = create_tag_from_db_row(tag_data)
-                    valid_tags.append(tag)
+                    valid_tags.append(create_tag_from_db_row(tag_data))
                 except Exception as e:
-                    logger.warning(f"Error convirtiendo tag de área {tag_id}: {e}")
-            
+                    logger.warning(f"Error convirtiendo tag de área {tag_data.get('id')}: {e}")
+
             # Ordenar alfabéticamente
             valid_tags.sort(key=lambda t: t.name.lower())
             
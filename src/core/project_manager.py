@@ -13,6 +13,7 @@ from typing import List, Dict, Optional, Tuple, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.database.db_manager import DBManager
+from src.core.entity_metadata import fetch_entity_metadata, fetch_entities_metadata_batch
 from src.models.project import Project, ProjectRelation, ProjectComponent, validate_entity_type
 
 logger = logging.getLogger(__name__)
@@ -277,64 +278,25 @@ class ProjectManager(QObject):
         """
         from src.models.project import get_entity_type_icon, get_entity_type_label
 
-        metadata = {
-            'type': entity_type,
-            'id': entity_id,
-            'icon': get_entity_type_icon(entity_type),
-            'label': get_entity_type_label(entity_type),
-            'name': '',
-            'content': ''
-        }
+        return fetch_entity_metadata(
+            self.db, entity_type, entity_id, get_entity_type_icon, get_entity_type_label
+        )
 
-        # Obtener nombre/contenido desde BD
-        try:
-            if entity_type == 'tag':
-                result = self.db.execute_query(
-                    "SELECT name FROM tags WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'item':
-                result = self.db.execute_query(
-                    "SELECT label, content FROM items WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['label']
-                    metadata['content'] = result[0]['content']
-
-            elif entity_type == 'list':
-                result = self.db.execute_query(
-                    "SELECT name FROM listas WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'process':
-                result = self.db.execute_query(
-                    "SELECT name FROM processes WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'table':
-                result = self.db.execute_query(
-                    "SELECT name FROM tables WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
-
-            elif entity_type == 'category':
-                result = self.db.execute_query(
-                    "SELECT name FROM categories WHERE id = ?", (entity_id,)
-                )
-                if result:
-                    metadata['name'] = result[0]['name']
+    def get_entities_metadata_batch(self, pairs: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict]:
+        """
+        Obtiene metadata de varias entidades con una consulta por tipo
 
-        except Exception as e:
-            logger.error(f"Error obteniendo metadata de {entity_type}#{entity_id}: {e}")
+        Args:
+            pairs: Lista de tuplas (entity_type, entity_id)
 
-        return metadata
+        Returns:
+            Diccionario {(entity_type, entity_id): metadata}
+        """
+        from src.models.project import get_entity_type_icon, get_entity_type_label
+
+        return fetch_entities_metadata_batch(
+            self.db, pairs, get_entity_type_icon, get_entity_type_label
+        )
 
     def validate_project_name(self, name: str, exclude_id: int = None) -> Tuple[bool, str]:
         """
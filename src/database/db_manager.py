@@ -9,7 +9,7 @@ import logging
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from contextlib import contextmanager
 
 
@@ -18,6 +18,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _sql_casefold(value):
+    """Función SQL casefold(): normaliza mayúsculas con Unicode (LOWER de SQLite solo cubre ASCII)"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+# Máximo de valores por lista IN (...): por debajo del límite de parámetros
+# de SQLite (999 en versiones anteriores a 3.32)
+_IN_CHUNK_SIZE = 500
+
+
+def _in_chunks(values, size: int = _IN_CHUNK_SIZE) -> Iterator[Tuple[tuple, str]]:
+    """
+    Divide valores en bloques para consultas con IN (...)
+
+    Args:
+        values: Secuencia de valores
+        size: Máximo de valores por bloque
+
+    Yields:
+        Tuplas (valores del bloque, placeholders "?,?,...")
+    """
+    values = list(values)
+    for start in range(0, len(values), size):
+        chunk = tuple(values[start:start + size])
+        yield chunk, ','.join('?' * len(chunk))
+
+
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
@@ -43,6 +70,17 @@ class DBManager:
             self._create_database()
         else:
             logger.info("Database already exists")
+            self._apply_index_migrations()
+
+    def _apply_index_migrations(self):
+        """Aplica a una BD existente los índices agregados después de su creación"""
+        from src.database.migrations.add_area_indexes import ensure_area_indexes
+
+        try:
+            ensure_area_indexes(self.connect())
+        except sqlite3.Error as e:
+            # BD antigua sin tablas de áreas: los índices se crearán con ellas
+            logger.warning(f"Could not apply area index migration: {e}")
 
     def connect(self) -> sqlite3.Connection:
         """
@@ -57,10 +95,38 @@ class DBManager:
                 check_same_thread=False
             )
             self.connection.row_factory = sqlite3.Row
+            self.connection.create_function("casefold", 1, _sql_casefold, deterministic=True)
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
         return self.connection
 
+    def create_reader(self) -> Optional['DBManager']:
+        """
+        Crea un DBManager de solo lectura con su propia conexión
+
+        Pensado para consultas en hilos de trabajo: no comparte la conexión
+        (ni las transacciones sin confirmar) del hilo principal. El llamador
+        debe cerrarlo con close().
+
+        Returns:
+            DBManager de solo lectura, o None si la BD es en memoria
+            (otra conexión no vería los mismos datos)
+        """
+        if str(self.db_path) == ":memory:":
+            return None
+
+        reader = object.__new__(type(self))
+        reader.db_path = self.db_path
+        reader._fts5_available = self._fts5_available
+        reader.connection = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False
+        )
+        reader.connection.row_factory = sqlite3.Row
+        reader.connection.create_function("casefold", 1, _sql_casefold, deterministic=True)
+        return reader
+
     def close(self):
         """Close database connection"""
         if self.connection:
@@ -912,7 +978,7 @@ class DBManager:
                 -- Índices para áreas
                 CREATE INDEX IF NOT EXISTS idx_areas_active ON areas(is_active) WHERE is_active = 1;
                 CREATE INDEX IF NOT EXISTS idx_area_relations_area ON area_relations(area_id);
-                CREATE INDEX IF NOT EXISTS idx_area_relations_entity ON area_relations(entity_type, entity_id);
+                CREATE INDEX IF NOT EXISTS idx_area_relations_entity_area ON area_relations(entity_type, entity_id, area_id);
                 CREATE INDEX IF NOT EXISTS idx_area_relations_order ON area_relations(area_id, order_index);
                 CREATE INDEX IF NOT EXISTS idx_area_components_area ON area_components(area_id);
                 CREATE INDEX IF NOT EXISTS idx_area_components_order ON area_components(area_id, order_index);
@@ -1560,6 +1626,38 @@ class DBManager:
             logger.error(f"Error updating area filtered order: {e}")
             return False
 
+    def set_area_filtered_orders(self, area_id: int, filter_tag_id: int,
+                                 entries: List[tuple]) -> bool:
+        """
+        Updates or inserts the filtered order of several elements in a single transaction
+
+        Args:
+            area_id: Area ID
+            filter_tag_id: Tag ID used for filtering
+            entries: List of (element_type, element_id, order_index)
+
+        Returns:
+            True if successful
+        """
+        query = """
+            INSERT INTO area_filtered_order
+            (area_id, filter_tag_id, element_type, element_id, order_index)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(area_id, filter_tag_id, element_type, element_id) DO UPDATE SET
+                order_index = excluded.order_index,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        try:
+            with self.transaction() as conn:
+                conn.executemany(query, [
+                    (area_id, filter_tag_id, element_type, element_id, order_index)
+                    for element_type, element_id, order_index in entries
+                ])
+            return True
+        except Exception as e:
+            logger.error(f"Error updating area filtered orders: {e}")
+            return False
+
     def clear_area_filtered_order(self, area_id: int, filter_tag_id: int = None) -> bool:
         """
         Clears the filtered order for an area
@@ -2523,7 +2621,18 @@ class DBManager:
             ORDER BY i.created_at DESC
         """
         results = self.execute_query(query, (include_inactive,))
+        return self._attach_tags_and_decrypt(results)
+
+    def _attach_tags_and_decrypt(self, results: List[Dict]) -> List[Dict]:
+        """
+        Load relational tags and decrypt sensitive content of item rows (in place)
+
+        Args:
+            results: Item rows
 
+        Returns:
+            List[Dict]: The same rows, with 'tags' loaded and content decrypted
+        """
         # Initialize encryption manager for decrypting sensitive items
         from src.core.encryption_manager import EncryptionManager
         encryption_manager = EncryptionManager()
@@ -7327,6 +7436,47 @@ class DBManager:
             logger.error(f"Error creando project element tag: {e}")
             raise
 
+    def create_project_element_tag(self, name: str, color: str = "#3498db",
+                                   description: str = "") -> Optional[Dict]:
+        """
+        Crea un tag de elemento de proyecto y retorna la fila creada
+
+        Usa INSERT ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace INSERT + SELECT.
+
+        Args:
+            name: Nombre del tag (único)
+            color: Color en formato hex
+            description: Descripción del tag
+
+        Returns:
+            Optional[Dict]: Datos del tag creado
+
+        Raises:
+            ValueError: Si ya existe un tag con ese nombre
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            tag_id = self.add_project_element_tag(name, color, description)
+            return self.get_project_element_tag_by_id(tag_id)
+
+        try:
+            with self.transaction() as conn:
+                row = conn.execute("""
+                    INSERT INTO project_element_tags (name, color, description)
+                    VALUES (?, ?, ?)
+                    RETURNING *
+                """, (name, color, description)).fetchone()
+
+            logger.info(f"Project element tag creado: {name} (ID: {row['id']})")
+            return dict(row)
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error creando project element tag: {e}")
+            raise
+
     def get_all_project_element_tags(self) -> List[Dict]:
         """
         Obtiene todos los tags de elementos de proyecto
@@ -7348,6 +7498,35 @@ class DBManager:
             logger.error(f"Error obteniendo project element tags: {e}")
             return []
 
+    def iter_project_element_tags_tuples(self, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Recorre todos los tags de elementos de proyecto como tuplas
+
+        Pensado para cargas masivas: no construye un dict por fila y lee
+        por lotes con fetchmany.
+
+        Args:
+            batch_size: Filas por lote
+
+        Yields:
+            Tuplas (id, name, color, description, created_at, updated_at)
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.row_factory = None  # Tuplas simples en lugar de sqlite3.Row
+        cursor.arraysize = batch_size
+        cursor.execute("""
+            SELECT id, name, color, description, created_at, updated_at
+            FROM project_element_tags
+            ORDER BY name ASC
+        """)
+
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
     def get_tags_for_project(self, project_id: int) -> List[Dict]:
         """
         Obtiene todos los tags asociados a un proyecto específico
@@ -7479,6 +7658,71 @@ class DBManager:
             logger.error(f"Error actualizando tag {tag_id}: {e}")
             return False
 
+    def update_project_element_tag_returning(self, tag_id: int, name: str = None,
+                                             color: str = None,
+                                             description: str = None) -> Optional[Dict]:
+        """
+        Actualiza un tag de elemento de proyecto y retorna la fila actualizada
+
+        Usa UPDATE ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace UPDATE + SELECT.
+
+        Args:
+            tag_id: ID del tag
+            name: Nuevo nombre (opcional)
+            color: Nuevo color (opcional)
+            description: Nueva descripción (opcional)
+
+        Returns:
+            Optional[Dict]: Datos del tag actualizado, o None si no se actualizó
+
+        Raises:
+            ValueError: Si ya existe un tag con ese nombre
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            if not self.update_project_element_tag(tag_id, name, color, description):
+                return None
+            return self.get_project_element_tag_by_id(tag_id)
+
+        update_fields = {}
+        if name is not None:
+            update_fields['name'] = name
+        if color is not None:
+            update_fields['color'] = color
+        if description is not None:
+            update_fields['description'] = description
+
+        if not update_fields:
+            logger.warning("No hay campos válidos para actualizar")
+            return None
+
+        try:
+            update_fields['updated_at'] = datetime.now().isoformat()
+
+            set_clause = ", ".join([f"{field} = ?" for field in update_fields.keys()])
+            values = list(update_fields.values()) + [tag_id]
+
+            with self.transaction() as conn:
+                row = conn.execute(f"""
+                    UPDATE project_element_tags
+                    SET {set_clause}
+                    WHERE id = ?
+                    RETURNING *
+                """, values).fetchone()
+
+            if row is None:
+                return None
+
+            logger.info(f"Tag {tag_id} actualizado")
+            return dict(row)
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error actualizando tag {tag_id}: {e}")
+            return None
+
     def delete_project_element_tag(self, tag_id: int) -> bool:
         """
         Elimina un tag de elemento de proyecto y todas sus asociaciones
@@ -7526,6 +7770,103 @@ class DBManager:
             logger.error(f"Error buscando tags con query '{query}': {e}")
             return []
 
+    def add_project_element_tags_bulk(self, rows: List[tuple]) -> Dict[str, int]:
+        """
+        Crea múltiples tags de elementos de proyecto en una sola transacción
+
+        Los nombres que ya existen en la BD (o repetidos dentro del lote)
+        se ignoran y no aparecen en el resultado.
+
+        Args:
+            rows: Lista de tuplas (name, color, description)
+
+        Returns:
+            Mapeo nombre -> ID de los tags creados
+        """
+        if not rows:
+            return {}
+
+        names = list(dict.fromkeys(row[0] for row in rows))
+
+        with self.transaction() as conn:
+            existing = set()
+            for chunk, placeholders in _in_chunks(names):
+                existing.update(
+                    row['name'] for row in conn.execute(
+                        f"SELECT name FROM project_element_tags WHERE name IN ({placeholders})",
+                        chunk
+                    )
+                )
+
+            new_rows = [row for row in rows if row[0] not in existing]
+            conn.executemany("""
+                INSERT OR IGNORE INTO project_element_tags (name, color, description)
+                VALUES (?, ?, ?)
+            """, new_rows)
+
+            new_names = list(dict.fromkeys(row[0] for row in new_rows))
+            created = {}
+            for chunk, placeholders in _in_chunks(new_names):
+                for row in conn.execute(
+                    f"SELECT id, name FROM project_element_tags WHERE name IN ({placeholders})",
+                    chunk
+                ):
+                    created[row['name']] = row['id']
+            return created
+
+    def get_project_element_tags_by_ids(self, tag_ids: List[int]) -> List[Dict]:
+        """
+        Obtiene varios tags de elementos de proyecto por ID en una sola consulta
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            Lista de diccionarios con datos de tags
+        """
+        if not tag_ids:
+            return []
+
+        try:
+            conn = self.connect()
+            tags = []
+            for chunk, placeholders in _in_chunks(tag_ids):
+                cursor = conn.execute(f"""
+                    SELECT id, name, color, description, created_at, updated_at
+                    FROM project_element_tags
+                    WHERE id IN ({placeholders})
+                """, chunk)
+                tags.extend(dict(row) for row in cursor.fetchall())
+
+            return tags
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags por IDs: {e}")
+            return []
+
+    def delete_project_element_tags_bulk(self, tag_ids: List[int]) -> List[int]:
+        """
+        Elimina múltiples tags de elementos de proyecto en una sola transacción
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            IDs de los tags eliminados (vacía si no existía ninguno o si hubo un error)
+        """
+        if not tag_ids:
+            return []
+
+        try:
+            # Las asociaciones se eliminan automáticamente por CASCADE
+            deleted_ids = self._delete_ids_returning("project_element_tags", tag_ids)
+            logger.info(f"{len(deleted_ids)} tags eliminados en lote")
+            return deleted_ids
+
+        except Exception as e:
+            logger.error(f"Error eliminando tags en lote: {e}")
+            return []
+
     # ==================== PROJECT ELEMENT TAG ASSOCIATIONS ====================
 
     def add_tag_to_project_relation(self, relation_id: int, tag_id: int) -> bool:
@@ -7633,6 +7974,32 @@ class DBManager:
             logger.error(f"Error obteniendo relaciones con tag {tag_id}: {e}")
             return []
 
+    def get_project_relation_ids_by_tag(self, tag_id: int) -> List[int]:
+        """
+        Obtiene solo los IDs de las relaciones de proyecto que tienen un tag
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Lista de IDs de relaciones ordenados por order_index
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT pr.id
+                FROM project_relations pr
+                INNER JOIN project_element_tag_associations a ON pr.id = a.project_relation_id
+                WHERE a.tag_id = ?
+                ORDER BY pr.order_index ASC
+            """, (tag_id,))
+
+            return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo IDs de relaciones con tag {tag_id}: {e}")
+            return []
+
     def get_lists_by_project_tag(self, project_id: int, tag_id: int) -> List[Dict]:
         """
         Obtiene todas las listas de un proyecto que tienen un tag específico
@@ -7723,6 +8090,28 @@ class DBManager:
             logger.error(f"Error contando uso del tag {tag_id}: {e}")
             return 0
 
+    def get_project_element_tag_usage_counts(self) -> Dict[int, int]:
+        """
+        Cuenta las asociaciones de todos los tags de elementos de proyecto
+        en una sola consulta
+
+        Returns:
+            Mapeo tag_id -> número de asociaciones (solo tags en uso)
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT tag_id, COUNT(*)
+                FROM project_element_tag_associations
+                GROUP BY tag_id
+            """)
+
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            logger.error(f"Error contando uso de tags: {e}")
+            return {}
+
     def get_popular_project_element_tags(self, limit: int = 10) -> List[Dict]:
         """
         Obtiene los tags más usados con su conteo de uso
@@ -7828,6 +8217,40 @@ class DBManager:
             logger.error(f"Error obteniendo tags para componente {component_id}: {e}")
             return []
 
+    def get_distinct_tags_for_project(self, project_id: int) -> List[Dict]:
+        """
+        Obtiene los tags únicos usados en un proyecto (relaciones y componentes)
+        en una sola consulta
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Lista de tags únicos ordenados por nombre
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT t.id, t.name, t.color, t.description, t.created_at, t.updated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                INNER JOIN project_relations r ON a.project_relation_id = r.id
+                WHERE r.project_id = ?
+                UNION
+                SELECT t.id, t.name, t.color, t.description, t.created_at, t.updated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                INNER JOIN project_components c ON a.project_component_id = c.id
+                WHERE c.project_id = ?
+                ORDER BY name ASC
+            """, (project_id, project_id))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags únicos del proyecto {project_id}: {e}")
+            return []
+
     def get_project_components_by_tag(self, tag_id: int) -> List[Dict]:
         """
         Obtiene todos los componentes que tienen un tag específico
@@ -7942,6 +8365,25 @@ class DBManager:
 
         return self.execute_query(query)
 
+    def area_name_exists(self, name: str, exclude_id: int = None) -> bool:
+        """
+        Verifica si existe un área con el nombre dado (sin distinguir mayúsculas,
+        incluidas las acentuadas: "Área" y "área" se consideran iguales)
+
+        Args:
+            name: Nombre a buscar
+            exclude_id: ID de un área a ignorar (p. ej. la que se está editando)
+
+        Returns:
+            bool: True si ya existe otra área con ese nombre
+        """
+        query = """
+            SELECT 1 FROM areas
+            WHERE casefold(name) = casefold(?) AND (? IS NULL OR id <> ?)
+            LIMIT 1
+        """
+        return bool(self.execute_query(query, (name, exclude_id, exclude_id)))
+
     def update_area(self, area_id: int, **kwargs) -> bool:
         """
         Actualiza un área
@@ -8270,22 +8712,6232 @@ class DBManager:
         """
         return self.execute_update(query, (area_id, entity_type, entity_id, description, order_index))
 
-    def get_area_relations(self, area_id: int) -> List[Dict]:
+    def get_area_max_order(self, area_id: int) -> int:
         """
-        Obtiene todas las relaciones de un área
+        Obtiene el order_index máximo entre relaciones y componentes de un área
 
         Args:
             area_id: ID del área
 
+        Returns:
+            int: order_index máximo, o -1 si el área está vacía
+        """
+        query = """
+            SELECT COALESCE(MAX(order_index), -1) as max_order FROM (
+                SELECT order_index FROM area_relations WHERE area_id = ?
+                UNION ALL
+                SELECT order_index FROM area_components WHERE area_id = ?
+            )
+        """
+        result = self.execute_query(query, (area_id, area_id))
+        return result[0]['max_order'] if result else -1
+
+    def clone_area_contents(self, src_area_id: int, dst_area_id: int) -> Tuple[int, int]:
+        """
+        Copia las relaciones y componentes de un área a otra en una sola
+        transacción (un INSERT ... SELECT por tabla)
+
+        Si falla cualquiera de las copias no queda nada copiado.
+
+        Args:
+            src_area_id: ID del área origen
+            dst_area_id: ID del área destino
+
+        Returns:
+            Tuple[int, int]: (relaciones copiadas, componentes copiados)
+        """
+        with self.transaction() as conn:
+            relations = conn.execute("""
+                INSERT INTO area_relations (area_id, entity_type, entity_id, description, order_index)
+                SELECT ?, entity_type, entity_id, description, order_index
+                FROM area_relations
+                WHERE area_id = ?
+            """, (dst_area_id, src_area_id)).rowcount
+
+            components = conn.execute("""
+                INSERT INTO area_components (area_id, component_type, content, order_index)
+                SELECT ?, component_type, content, order_index
+                FROM area_components
+                WHERE area_id = ?
+            """, (dst_area_id, src_area_id)).rowcount
+
+        return relations, components
+
+    def get_area_relations(self, area_id: int, entity_type: str = None) -> List[Dict]:
+        """
+        Obtiene todas las relaciones de un área
+
+        Args:
+            area_id: ID del área
+            entity_type: Si se especifica, filtra por tipo de entidad
+
+        Returns:
+            List[Dict]: Lista de relaciones
+        """
+        query = "SELECT * FROM area_relations WHERE area_id = ?"
+        params = [area_id]
+
+        if entity_type:
+            query += " AND entity_type = ?"
+            params.append(entity_type)
+
+        query += " ORDER BY order_index ASC"
+        return self.execute_query(query, tuple(params))
+
+    def area_has_entity(self, area_id: int, entity_type: str, entity_id: int) -> bool:
+        """
+        Verifica si una entidad está relacionada con un área
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            bool: True si existe la relación
+        """
+        query = """
+            SELECT 1 FROM area_relations
+            WHERE area_id = ? AND entity_type = ? AND entity_id = ?
+            LIMIT 1
+        """
+        return bool(self.execute_query(query, (area_id, entity_type, entity_id)))
+
+    def get_area_entity_counts(self, area_id: int) -> Dict[str, int]:
+        """
+        Cuenta las relaciones de un área agrupadas por tipo de entidad
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            Dict[str, int]: {entity_type: cantidad}
+        """
+        query = """
+            SELECT entity_type, COUNT(*) as count
+            FROM area_relations
+            WHERE area_id = ?
+            GROUP BY entity_type
+        """
+        results = self.execute_query(query, (area_id,))
+        return {row['entity_type']: row['count'] for row in results}
+
+    def get_entities_in_area(self, area_id: int, entity_type: str) -> List[Dict]:
+        """
+        Obtiene las entidades de un tipo que pertenecen a un área
+        (JOIN con area_relations, sin cargar la tabla completa)
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad ('tag', 'process', 'list', 'table', 'category', 'item')
+
+        Returns:
+            List[Dict]: Filas de la tabla de la entidad
+        """
+        if entity_type == 'list':
+            # Listas de categorías activas, con conteo de items
+            query = """
+                SELECT l.*,
+                       COUNT(i.id) as item_count,
+                       MAX(i.last_used) as last_item_used
+                FROM listas l
+                INNER JOIN area_relations r ON r.entity_id = l.id
+                INNER JOIN categories c ON c.id = l.category_id
+                LEFT JOIN items i ON i.list_id = l.id
+                WHERE r.area_id = ? AND r.entity_type = 'list'
+                  AND c.is_active = 1
+                GROUP BY l.id
+                ORDER BY l.created_at DESC
+            """
+            return self.execute_query(query, (area_id,))
+
+        if entity_type == 'item':
+            # Mismo resultado que get_all_items: items de categorías activas,
+            # con datos de categoría, tags y contenido sensible descifrado
+            query = """
+                SELECT
+                    i.*,
+                    c.name as category_name,
+                    c.icon as category_icon,
+                    c.color as category_color,
+                    c.id as category_id
+                FROM items i
+                INNER JOIN area_relations r ON r.entity_id = i.id
+                INNER JOIN categories c ON i.category_id = c.id
+                WHERE r.area_id = ? AND r.entity_type = 'item'
+                  AND c.is_active = 1
+                ORDER BY i.created_at DESC
+            """
+            return self._attach_tags_and_decrypt(self.execute_query(query, (area_id,)))
+
+        if entity_type == 'category':
+            # Mismo resultado que get_categories: categorías activas con 'tags'
+            query = """
+                SELECT c.*
+                FROM categories c
+                INNER JOIN area_relations r ON r.entity_id = c.id
+                WHERE r.area_id = ? AND r.entity_type = 'category'
+                  AND c.is_active = 1
+                ORDER BY c.order_index
+            """
+            categories = self.execute_query(query, (area_id,))
+
+            # Tags de todas las categorías del área en una sola consulta
+            tags_query = """
+                SELECT ctc.category_id, ct.name
+                FROM category_tags ct
+                INNER JOIN category_tags_category ctc ON ct.id = ctc.tag_id
+                INNER JOIN area_relations r ON r.entity_id = ctc.category_id
+                WHERE r.area_id = ? AND r.entity_type = 'category'
+                ORDER BY ct.name ASC
+            """
+            tags_by_category: Dict[int, List[str]] = {}
+            for row in self.execute_query(tags_query, (area_id,)):
+                tags_by_category.setdefault(row['category_id'], []).append(row['name'])
+
+            for category in categories:
+                category['tags'] = tags_by_category.get(category['id'], [])
+
+            return categories
+
+        # tipo -> (tabla, condición adicional, orden)
+        entity_tables = {
+            'tag': ('tags', '1 = 1', 'e.name ASC'),
+            'process': ('processes', 'e.is_active = 1 AND e.is_archived = 0',
+                        'e.pinned_order ASC, e.order_index ASC, e.name ASC'),
+            'table': ('tables', '1 = 1', 'e.name'),
+        }
+
+        if entity_type not in entity_tables:
+            logger.warning(f"Tipo de entidad no soportado: {entity_type}")
+            return []
+
+        table, condition, order = entity_tables[entity_type]
+        query = f"""
+            SELECT e.*
+            FROM {table} e
+            INNER JOIN area_relations r ON r.entity_id = e.id
+            WHERE r.area_id = ? AND r.entity_type = ?
+              AND {condition}
+            ORDER BY {order}
+        """
+        return self.execute_query(query, (area_id, entity_type))
+
+    def remove_area_relation(self, relation_id: int) -> bool:
+        """
+        Elimina una relación área-entidad
+
+        Args:
+            relation_id: ID de la relación
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = "DELETE FROM area_relations WHERE id = ?"
+        try:
+            self.execute_update(query, (relation_id,))
+            return True
+        except Exception as e:
+            logger.error(f"Error eliminando relación {relation_id}: {e}")
+            return False
+
+    def remove_area_relation_by_entity(self, area_id: int, entity_type: str,
+                                       entity_id: int) -> bool:
+        """
+        Elimina una relación específica por entidad
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = """
+            DELETE FROM area_relations
+            WHERE area_id = ? AND entity_type = ? AND entity_id = ?
+        """
+        try:
+            self.execute_update(query, (area_id, entity_type, entity_id))
+            return True
+        except Exception as e:
+            logger.error(f"Error eliminando relación: {e}")
+            return False
+
+    def update_relation_description(self, relation_id: int, description: str) -> bool:
+        """
+        Actualiza la descripción de una relación de área
+
+        Args:
+            relation_id: ID de la relación
+            description: Nueva descripción
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        query = "UPDATE area_relations SET description = ? WHERE id = ?"
+        try:
+            self.execute_update(query, (description, relation_id))
+            return True
+        except Exception as e:
+            logger.error(f"Error actualizando descripción de relación {relation_id}: {e}")
+            return False
+
+    def update_area_relation_order(self, relation_id: int, order_index: int) -> bool:
+        """
+        Actualiza el orden de una relación de área
+
+        Args:
+            relation_id: ID de la relación
+            order_index: Nuevo índice de orden
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        query = "UPDATE area_relations SET order_index = ? WHERE id = ?"
+        try:
+            self.execute_update(query, (order_index, relation_id))
+            return True
+        except Exception as e:
+            logger.error(f"Error actualizando orden de relación de área {relation_id}: {e}")
+            return False
+
+    # ==================== COMPONENTES DE ÁREAS ====================
+
+    def add_area_component(self, area_id: int, component_type: str,
+                           content: str = "", order_index: int = 0) -> int:
+        """
+        Agrega un componente estructural a un área
+
+        Args:
+            area_id: ID del área
+            component_type: Tipo de componente ('divider', 'comment', 'alert', 'note')
+            content: Contenido del componente
+            order_index: Índice de orden
+
+        Returns:
+            int: ID del componente creado
+        """
+        query = """
+            INSERT INTO area_components (area_id, component_type, content, order_index)
+            VALUES (?, ?, ?, ?)
+        """
+        return self.execute_update(query, (area_id, component_type, content, order_index))
+
+    def get_area_components(self, area_id: int) -> List[Dict]:
+        """
+        Get all components for an area
+        """
+        query = "SELECT * FROM area_components WHERE area_id = ? ORDER BY order_index"
+        return self.execute_query(query, (area_id,))
+
+    def get_tags_for_area_relation(self, relation_id: int) -> List[Dict]:
+        """
+        Get tags for an area relation
+        """
+        query = """
+            SELECT t.*
+            FROM area_element_tags t
+            JOIN area_element_tag_associations a ON t.id = a.tag_id
+            WHERE a.area_relation_id = ?
+            ORDER BY t.name
+        """
+        return self.execute_query(query, (relation_id,))
+
+    def get_tags_for_area_component(self, component_id: int) -> List[Dict]:
+        """
+        Get tags for an area component
+        """
+        query = """
+            SELECT t.*
+            FROM area_element_tags t
+            JOIN area_element_tag_associations a ON t.id = a.tag_id
+            WHERE a.area_component_id = ?
+            ORDER BY t.name
+        """
+        return self.execute_query(query, (component_id,))
+
+    def get_tag_statistics(self) -> Dict:
+        """
+        Get tag statistics
+
+        Returns:
+            Dict: Statistics about tags
+        """
+        # Total tags
+        query = "SELECT COUNT(*) as total FROM tags"
+        total_tags = self.execute_query(query)[0]['total']
+
+        # Tags in use (usage_count > 0)
+        query = "SELECT COUNT(*) as in_use FROM tags WHERE usage_count > 0"
+        tags_in_use = self.execute_query(query)[0]['in_use']
+
+        # Unused tags
+        query = "SELECT COUNT(*) as unused FROM tags WHERE usage_count = 0"
+        unused_tags = self.execute_query(query)[0]['unused']
+
+        # Average tags per item
+        query = """
+            SELECT AVG(tag_count) as avg_tags
+            FROM (
+                SELECT item_id, COUNT(*) as tag_count
+                FROM item_tags
+                GROUP BY item_id
+            )
+        """
+        result = self.execute_query(query)
+        avg_tags = result[0]['avg_tags'] if result and result[0]['avg_tags'] else 0
+
+        # Top 10 most used tags
+        query = """
+            SELECT name, usage_count
+            FROM tags
+            WHERE usage_count > 0
+            ORDER BY usage_count DESC, name ASC
+            LIMIT 10
+        """
+        top_tags = self.execute_query(query)
+
+        return {
+            'total_tags': total_tags,
+            'tags_in_use': tags_in_use,
+            'unused_tags': unused_tags,
+            'avg_tags_per_item': round(avg_tags, 2) if avg_tags else 0,
+            'top_tags': [{'name': t['name'], 'count': t['usage_count']} for t in top_tags]
+        }
+
+    def get_tag_stats(self, tag_name: str) -> Dict:
+        """
+        Get statistics for a specific tag
+
+        Args:
+            tag_name: Tag name
+
+        Returns:
+            Dict: Tag statistics (id, name, usage_count, last_used, etc.)
+        """
+        tag = self.get_tag_by_name(tag_name)
+        if not tag:
+            return {
+                'id': None,
+                'name': tag_name.lower(),
+                'usage_count': 0,
+                'last_used': None,
+                'created_at': None,
+                'updated_at': None,
+                'color': None,
+                'description': None
+            }
+        return tag
+
+    def get_top_tags(self, limit: int = 10) -> List[Dict]:
+        """
+        Get top tags by usage count
+
+        Args:
+            limit: Maximum number of tags to return (default: 10)
+
+        Returns:
+            List[Dict]: List of tags ordered by usage_count DESC
+        """
+        query = """
+            SELECT * FROM tags
+            WHERE usage_count > 0
+            ORDER BY usage_count DESC, name ASC
+            LIMIT ?
+        """
+        return self.execute_query(query, (limit,))
+
+    # ========== CRUD TABLA LISTAS (NUEVA - v3.1.0) ==========
+
+    def create_lista(self, category_id: int, name: str, description: str = None) -> int:
+        """
+        Crea una nueva lista en la tabla listas
+
+        Args:
+            category_id: ID de la categoría
+            name: Nombre de la lista
+            description: Descripción opcional
+
+        Returns:
+            int: ID de la lista creada
+
+        Raises:
+            ValueError: Si el nombre ya existe en la categoría
+        """
+        # Validar unicidad (el constraint UNIQUE en BD también lo garantiza)
+        if not self.is_list_name_unique_v2(category_id, name):
+            raise ValueError(f"Ya existe una lista con el nombre '{name}' en esta categoría")
+
+        with self.transaction() as conn:
+            cursor = conn.execute('''
+                INSERT INTO listas (category_id, name, description, created_at, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            ''', (category_id, name, description))
+
+            lista_id = cursor.lastrowid
+            logger.info(f"Lista creada: id={lista_id}, name='{name}', category={category_id}")
+            return lista_id
+
+    def get_lista(self, lista_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene una lista por ID
+
+        Args:
+            lista_id: ID de la lista
+
+        Returns:
+            Dict con datos de la lista o None si no existe
+        """
+        query = "SELECT * FROM listas WHERE id = ?"
+        results = self.execute_query(query, (lista_id,))
+        return results[0] if results else None
+
+    def get_lista_by_name(self, category_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene una lista por categoría y nombre
+
+        Args:
+            category_id: ID de la categoría
+            name: Nombre de la lista
+
+        Returns:
+            Dict con datos de la lista o None si no existe
+        """
+        query = "SELECT * FROM listas WHERE category_id = ? AND name = ?"
+        results = self.execute_query(query, (category_id, name))
+        return results[0] if results else None
+
+    def get_listas_by_category_new(self, category_id: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las listas de una categoría (desde tabla listas)
+
+        Args:
+            category_id: ID de la categoría
+
+        Returns:
+            List[Dict]: Lista de diccionarios con info completa de cada lista
+        """
+        query = '''
+            SELECT
+                l.*,
+                COUNT(i.id) as item_count,
+                MAX(i.last_used) as last_item_used
+            FROM listas l
+            LEFT JOIN items i ON i.list_id = l.id
+            WHERE l.category_id = ?
+            GROUP BY l.id
+            ORDER BY l.created_at DESC
+        '''
+        results = self.execute_query(query, (category_id,))
+        logger.debug(f"Encontradas {len(results)} listas en categoría {category_id} (tabla listas)")
+        return results
+
+    def update_lista(self, lista_id: int, **kwargs) -> bool:
+        """
+        Actualiza metadata de una lista
+
+        Args:
+            lista_id: ID de la lista
+            **kwargs: Campos a actualizar (name, description, updated_at, last_used, use_count)
+
+        Returns:
+            bool: True si se actualizó exitosamente
+
+        Raises:
+            ValueError: Si el nuevo nombre ya existe en la categoría
+        """
+        allowed_fields = ['name', 'description', 'updated_at', 'last_used', 'use_count']
+        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+
+        if not updates:
+            return False
+
+        # Validar unicidad del nombre si se está actualizando
+        if 'name' in updates:
+            lista_actual = self.get_lista(lista_id)
+            if lista_actual:
+                # Verificar que el nuevo nombre sea único (excluyendo esta lista)
+                if not self.is_list_name_unique_v2(lista_actual['category_id'], updates['name'], exclude_lista_id=lista_id):
+                    raise ValueError(f"Ya existe una lista con el nombre '{updates['name']}' en esta categoría")
+
+        # Auto-actualizar updated_at
+        if 'updated_at' not in updates:
+            from datetime import datetime
+            updates['updated_at'] = datetime.now().isoformat()
+
+        set_clause = ', '.join([f"{k} = ?" for k in updates.keys()])
+        values = list(updates.values()) + [lista_id]
+
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE listas SET {set_clause} WHERE id = ?",
+                values
+            )
+            updated = cursor.rowcount > 0
+
+            if updated:
+                logger.info(f"Lista {lista_id} actualizada: {updates}")
+
+            return updated
+
+    def delete_lista(self, lista_id: int) -> bool:
+        """
+        Elimina una lista (CASCADE elimina items asociados automáticamente)
+
+        Args:
+            lista_id: ID de la lista
+
+        Returns:
+            bool: True si se eliminó exitosamente
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("DELETE FROM listas WHERE id = ?", (lista_id,))
+            deleted = cursor.rowcount > 0
+
+            if deleted:
+                logger.info(f"Lista {lista_id} eliminada (items eliminados en cascada)")
+
+            return deleted
+
+    def is_lista_name_unique(self, category_id: int, name: str, exclude_id: int = None) -> bool:
+        """
+        Verifica si el nombre de lista es único en la categoría
+
+        Args:
+            category_id: ID de la categoría
+            name: Nombre a verificar
+            exclude_id: ID de lista a excluir (para edición)
+
+        Returns:
+            bool: True si el nombre es único
+        """
+        query = "SELECT id FROM listas WHERE category_id = ? AND name = ?"
+        params = [category_id, name]
+
+        if exclude_id:
+            query += " AND id != ?"
+            params.append(exclude_id)
+
+        results = self.execute_query(query, params)
+        return len(results) == 0
+
+    def get_items_by_lista(self, lista_id: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene todos los items de una lista, ordenados por orden_lista
+
+        Args:
+            lista_id: ID de la lista
+
+        Returns:
+            List[Dict]: Items de la lista ordenados
+        """
+        query = '''
+            SELECT i.*, l.name as lista_name
+            FROM items i
+            JOIN listas l ON i.list_id = l.id
+            WHERE i.list_id = ?
+            ORDER BY i.orden_lista ASC
+        '''
+        results = self.execute_query(query, (lista_id,))
+
+        # Cargar tags y descifrar contenido para cada item
+        for item in results:
+            # Cargar tags desde tabla relacional
+            item['tags'] = self.get_tags_by_item(item['id'])
+
+            # Descifrar contenido si es necesario
+            if item.get('is_sensitive'):
+                try:
+                    item['content'] = self.encryption_manager.decrypt(item['content'])
+                except Exception as e:
+                    logger.error(f"Error al descifrar item {item['id']}: {e}")
+                    item['content'] = '[ERROR: No se pudo descifrar]'
+
+        logger.debug(f"Obtenidos {len(results)} items de lista {lista_id}")
+        return results
+
+    # ========== LISTAS AVANZADAS (MÉTODOS LEGACY - mantener por compatibilidad) ==========
+
+    def create_list(self, category_id: int, list_name: str, items_data: List[Dict[str, Any]]) -> List[int]:
+        """
+        Crea una lista completa con múltiples items
+
+        Args:
+            category_id: ID de la categoría
+            list_name: Nombre de la lista (list_group)
+            items_data: Lista de dicts con datos de cada paso
+                [
+                    {'label': 'Paso 1', 'content': '...', 'type': 'TEXT'},
+                    {'label': 'Paso 2', 'content': '...', 'type': 'CODE'},
+                ]
+
+        Returns:
+            List[int]: Lista de IDs de los items creados
+        """
+        if not items_data or len(items_data) < 1:
+            raise ValueError("La lista debe tener al menos 1 item")
+
+        # Validar que el nombre de lista sea único
+        if not self.is_list_name_unique(category_id, list_name):
+            raise ValueError(f"El nombre de lista '{list_name}' ya existe en esta categoría")
+
+        item_ids = []
+
+        try:
+            with self.transaction() as conn:
+                for orden, item_data in enumerate(items_data, start=1):
+                    # Agregar item con campos de lista
+                    item_id = self.add_item(
+                        category_id=category_id,
+                        label=item_data.get('label', f'Paso {orden}'),
+                        content=item_data.get('content', ''),
+                        item_type=item_data.get('type', 'TEXT'),
+                        icon=item_data.get('icon'),
+                        is_sensitive=item_data.get('is_sensitive', False),
+                        tags=item_data.get('tags'),
+                        description=item_data.get('description'),
+                        working_dir=item_data.get('working_dir'),
+                        color=item_data.get('color'),
+                        # Campos de lista
+                        is_list=True,
+                        list_group=list_name,
+                        orden_lista=orden
+                    )
+                    item_ids.append(item_id)
+
+                logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
+
+            return item_ids
+
+        except Exception as e:
+            logger.error(f"Error al crear lista '{list_name}': {e}")
+            raise
+
+    def get_lists_by_category(self, category_id: int) -> List[Dict[str, Any]]:
+        """
+        Obtiene resumen de todas las listas en una categoría
+
+        Args:
+            category_id: ID de la categoría
+
+        Returns:
+            List[Dict]: Lista de diccionarios con info de cada lista
+                [
+                    {
+                        'list_group': 'Deploy Producción',
+                        'item_count': 5,
+                        'first_label': 'Pull cambios',
+                        'created_at': '2025-10-31 10:00:00'
+                    },
+                    ...
+                ]
+        """
+        query = """
+            SELECT
+                list_group,
+                COUNT(*) as item_count,
+                MIN(label) as first_label,
+                MIN(created_at) as created_at,
+                MAX(last_used) as last_used
+            FROM items
+            WHERE category_id = ?
+            AND is_list = 1
+            AND is_active = 1
+            GROUP BY list_group
+            ORDER BY created_at DESC
+        """
+        results = self.execute_query(query, (category_id,))
+        logger.debug(f"Encontradas {len(results)} listas en categoría {category_id}")
+        return results
+
+    def get_list_items(self, category_id: int, list_group: str) -> List[Dict[str, Any]]:
+        """
+        Obtiene todos los items de una lista específica, ordenados por orden_lista
+
+        Args:
+            category_id: ID de la categoría
+            list_group: Nombre de la lista
+
+        Returns:
+            List[Dict]: Lista de items ordenados (con contenido desencriptado si es sensible)
+        """
+        query = """
+            SELECT * FROM items
+            WHERE category_id = ?
+            AND is_list = 1
+            AND list_group = ?
+            AND is_active = 1
+            ORDER BY orden_lista ASC
+        """
+        results = self.execute_query(query, (category_id, list_group))
+
+        # Desencriptar y parsear tags (mismo proceso que en get_items_by_category)
+        from src.core.encryption_manager import EncryptionManager
+        encryption_manager = EncryptionManager()
+
+        for item in results:
+            # Parse tags
+            if item['tags']:
+                try:
+                    item['tags'] = json.loads(item['tags'])
+                except json.JSONDecodeError:
+                    if isinstance(item['tags'], str):
+                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+                    else:
+                        item['tags'] = []
+            else:
+                item['tags'] = []
+
+            # Decrypt sensitive content
+            if item.get('is_sensitive') and item.get('content'):
+                try:
+                    item['content'] = encryption_manager.decrypt(item['content'])
+                    logger.debug(f"Content decrypted for item ID: {item['id']}")
+                except Exception as e:
+                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
+                    item['content'] = "[DECRYPTION ERROR]"
+
+        logger.debug(f"Obtenidos {len(results)} items de lista '{list_group}'")
+        return results
+
+    def reorder_list_item(self, item_id: int, new_orden: int) -> bool:
+        """
+        Cambia el orden de un item dentro de su lista
+        También reordena los demás items afectados
+
+        Args:
+            item_id: ID del item a reordenar
+            new_orden: Nueva posición (1, 2, 3...)
+
+        Returns:
+            bool: True si se reordenó exitosamente
+        """
+        # Obtener info del item
+        item = self.get_item(item_id)
+        if not item or not item.get('is_list'):
+            logger.warning(f"Item {item_id} no encontrado o no es parte de una lista")
+            return False
+
+        category_id = item['category_id']
+        list_group = item['list_group']
+        old_orden = item['orden_lista']
+
+        if old_orden == new_orden:
+            logger.debug(f"Item {item_id} ya está en la posición {new_orden}")
+            return True
+
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Si movemos hacia arriba (new_orden < old_orden)
+                # Incrementar orden de los items entre new_orden y old_orden
+                if new_orden < old_orden:
+                    cursor.execute("""
+                        UPDATE items
+                        SET orden_lista = orden_lista + 1
+                        WHERE category_id = ?
+                        AND list_group = ?
+                        AND orden_lista >= ?
+                        AND orden_lista < ?
+                    """, (category_id, list_group, new_orden, old_orden))
+
+                # Si movemos hacia abajo (new_orden > old_orden)
+                # Decrementar orden de los items entre old_orden y new_orden
+                else:
+                    cursor.execute("""
+                        UPDATE items
+                        SET orden_lista = orden_lista - 1
+                        WHERE category_id = ?
+                        AND list_group = ?
+                        AND orden_lista > ?
+                        AND orden_lista <= ?
+                    """, (category_id, list_group, old_orden, new_orden))
+
+                # Actualizar el item movido
+                cursor.execute("""
+                    UPDATE items
+                    SET orden_lista = ?
+                    WHERE id = ?
+                """, (new_orden, item_id))
+
+                logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error al reordenar item {item_id}: {e}")
+            return False
+
+    def delete_list(self, category_id: int, list_group: str) -> bool:
+        """
+        Elimina TODOS los items de una lista
+
+        Args:
+            category_id: ID de la categoría
+            list_group: Nombre de la lista a eliminar
+
+        Returns:
+            bool: True si se eliminó exitosamente
+        """
+        try:
+            query = """
+                DELETE FROM items
+                WHERE category_id = ?
+                AND list_group = ?
+                AND is_list = 1
+            """
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (category_id, list_group))
+                deleted_count = cursor.rowcount
+
+                logger.info(f"Lista '{list_group}' eliminada ({deleted_count} items) de categoría {category_id}")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error al eliminar lista '{list_group}': {e}")
+            return False
+
+    def update_list(self, category_id: int, old_list_group: str,
+                   new_list_group: str = None, items_data: List[Dict[str, Any]] = None) -> bool:
+        """
+        Actualiza una lista existente
+
+        Permite:
+        - Renombrar la lista (cambiar list_group)
+        - Actualizar los items de la lista (agregar/eliminar/modificar pasos)
+
+        Args:
+            category_id: ID de la categoría
+            old_list_group: Nombre actual de la lista
+            new_list_group: Nuevo nombre (opcional, si se quiere renombrar)
+            items_data: Nuevos datos de items (opcional, si se quiere actualizar contenido)
+
+        Returns:
+            bool: True si se actualizó exitosamente
+        """
+        try:
+            with self.transaction() as conn:
+                # Caso 1: Solo renombrar
+                if new_list_group and new_list_group != old_list_group:
+                    # Validar que el nuevo nombre sea único
+                    if not self.is_list_name_unique(category_id, new_list_group, exclude_list=old_list_group):
+                        raise ValueError(f"El nombre '{new_list_group}' ya existe en esta categoría")
+
+                    cursor = conn.cursor()
+                    cursor.execute("""
+                        UPDATE items
+                        SET list_group = ?
+                        WHERE category_id = ?
+                        AND list_group = ?
+                        AND is_list = 1
+                    """, (new_list_group, category_id, old_list_group))
+
+                    logger.info(f"Lista renombrada: '{old_list_group}' → '{new_list_group}'")
+
+                # Caso 2: Actualizar items de la lista
+                if items_data is not None:
+                    # Eliminar items actuales
+                    final_list_name = new_list_group if new_list_group else old_list_group
+                    self.delete_list(category_id, final_list_name)
+
+                    # Crear nuevos items
+                    self.create_list(category_id, final_list_name, items_data)
+
+                    logger.info(f"Lista '{final_list_name}' actualizada con {len(items_data)} items")
+
+                return True
+
+        except Exception as e:
+            logger.error(f"Error al actualizar lista '{old_list_group}': {e}")
+            return False
+
+    def is_list_name_unique(self, category_id: int, list_name: str, exclude_list: str = None) -> bool:
+        """
+        DEPRECADO: Usar is_list_name_unique_v2() en su lugar
+
+        Verifica si el nombre de lista es único en la categoría (método legacy)
+
+        Args:
+            category_id: ID de la categoría
+            list_name: Nombre de lista a verificar
+            exclude_list: Nombre de lista a excluir (útil para edición)
+
+        Returns:
+            bool: True si el nombre es único, False si ya existe
+        """
+        # Redirigir al nuevo método
+        logger.warning("is_list_name_unique() is DEPRECATED - use is_list_name_unique_v2() instead")
+        return self.is_list_name_unique_v2(category_id, list_name, exclude_lista_id=None)
+
+    def __is_list_name_unique_legacy(self, category_id: int, list_name: str, exclude_list: str = None) -> bool:
+        """Implementación legacy original - NO USAR"""
+        if exclude_list:
+            query = """
+                SELECT COUNT(*) as count
+                FROM items
+                WHERE category_id = ?
+                AND list_group = ?
+                AND is_list = 1
+                AND list_group != ?
+            """
+            result = self.execute_query(query, (category_id, list_name, exclude_list))
+        else:
+            query = """
+                SELECT COUNT(*) as count
+                FROM items
+                WHERE category_id = ?
+                AND list_group = ?
+                AND is_list = 1
+            """
+            result = self.execute_query(query, (category_id, list_name))
+
+        count = result[0]['count'] if result else 0
+        is_unique = count == 0
+
+        logger.debug(f"Nombre de lista '{list_name}' en categoría {category_id}: {'único' if is_unique else 'ya existe'}")
+        return is_unique
+
+    def is_list_name_unique_v2(self, category_id: int, list_name: str, exclude_lista_id: int = None) -> bool:
+        """
+        Verifica si el nombre de lista es único en la categoría (nueva arquitectura v3.1.0)
+
+        Args:
+            category_id: ID de la categoría
+            list_name: Nombre de lista a verificar
+            exclude_lista_id: ID de lista a excluir (útil para edición)
+
+        Returns:
+            bool: True si el nombre es único, False si ya existe
+        """
+        if exclude_lista_id:
+            query = """
+                SELECT COUNT(*) as count
+                FROM listas
+                WHERE category_id = ?
+                AND name = ?
+                AND id != ?
+            """
+            result = self.execute_query(query, (category_id, list_name, exclude_lista_id))
+        else:
+            query = """
+                SELECT COUNT(*) as count
+                FROM listas
+                WHERE category_id = ?
+                AND name = ?
+            """
+            result = self.execute_query(query, (category_id, list_name))
+
+        count = result[0]['count'] if result else 0
+        is_unique = count == 0
+
+        logger.debug(f"Nombre de lista '{list_name}' en categoría {category_id}: {'único' if is_unique else 'ya existe'}")
+        return is_unique
+
+    # ========== IMAGE GALLERY ==========
+
+    def get_image_items(
+        self,
+        category_id: Optional[int] = None,
+        search_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        is_favorite: Optional[bool] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        Obtener items de tipo PATH que son imágenes con filtros opcionales
+
+        Args:
+            category_id: Filtrar por categoría específica (opcional)
+            search_text: Búsqueda en nombre/descripción (opcional)
+            tags: Lista de tags para filtrar (opcional)
+            is_favorite: Filtrar solo favoritos (opcional)
+            date_from: Fecha desde (formato: YYYY-MM-DD, opcional)
+            date_to: Fecha hasta (formato: YYYY-MM-DD, opcional)
+            min_size: Tamaño mínimo en bytes (opcional)
+            max_size: Tamaño máximo en bytes (opcional)
+            limit: Máximo de resultados (default: 50)
+            offset: Offset para paginación (default: 0)
+
+        Returns:
+            List[Dict]: Lista de items de imagen con metadatos completos
+        """
+        # Extensiones de imagen soportadas
+        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+
+        # Construcción dinámica de query con filtros
+        conditions = ["i.type = 'PATH'"]
+        params = []
+
+        # Filtro por extensiones de imagen
+        ext_placeholders = ','.join(['?' for _ in image_extensions])
+        conditions.append(f"i.file_extension IN ({ext_placeholders})")
+        params.extend(image_extensions)
+
+        # Filtro por categoría
+        if category_id is not None:
+            conditions.append("i.category_id = ?")
+            params.append(category_id)
+
+        # Filtro por búsqueda de texto
+        if search_text:
+            conditions.append("(i.label LIKE ? OR i.description LIKE ?)")
+            search_pattern = f"%{search_text}%"
+            params.extend([search_pattern, search_pattern])
+
+        # Filtro por favoritos
+        if is_favorite is not None:
+            conditions.append("i.is_favorite = ?")
+            params.append(1 if is_favorite else 0)
+
+        # Filtro por rango de fechas
+        if date_from:
+            conditions.append("DATE(i.created_at) >= ?")
+            params.append(date_from)
+
+        if date_to:
+            conditions.append("DATE(i.created_at) <= ?")
+            params.append(date_to)
+
+        # Filtro por tamaño de archivo
+        if min_size is not None:
+            conditions.append("i.file_size >= ?")
+            params.append(min_size)
+
+        if max_size is not None:
+            conditions.append("i.file_size <= ?")
+            params.append(max_size)
+
+        # Construir query principal
+        where_clause = " AND ".join(conditions)
+        query = f"""
+            SELECT
+                i.*,
+                c.name as category_name,
+                c.icon as category_icon,
+                c.color as category_color
+            FROM items i
+            LEFT JOIN categories c ON i.category_id = c.id
+            WHERE {where_clause}
+            ORDER BY i.created_at DESC
+            LIMIT ? OFFSET ?
+        """
+        params.extend([limit, offset])
+
+        results = self.execute_query(query, tuple(params))
+
+        # Cargar tags desde estructura relacional y filtrar por tags si se especificaron
+        filtered_results = []
+        for item in results:
+            # Cargar tags desde estructura relacional
+            item['tags'] = self.get_tags_by_item(item['id'])
+
+            # Filtrar por tags si se especificaron
+            if tags:
+                # Verificar que al menos uno de los tags especificados esté presente
+                if any(tag.lower() in [t.lower() for t in item['tags']] for tag in tags):
+                    filtered_results.append(item)
+            else:
+                filtered_results.append(item)
+
+        logger.debug(f"Retrieved {len(filtered_results)} image items")
+        return filtered_results
+
+    def get_image_count(
+        self,
+        category_id: Optional[int] = None,
+        search_text: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        is_favorite: Optional[bool] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None
+    ) -> int:
+        """
+        Contar items de imagen que coinciden con los filtros
+
+        Args:
+            Mismos parámetros que get_image_items (excepto limit/offset)
+
+        Returns:
+            int: Número total de imágenes que coinciden con filtros
+        """
+        # Extensiones de imagen soportadas
+        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+
+        # Construcción dinámica de query con filtros
+        conditions = ["type = 'PATH'"]
+        params = []
+
+        # Filtro por extensiones de imagen
+        ext_placeholders = ','.join(['?' for _ in image_extensions])
+        conditions.append(f"file_extension IN ({ext_placeholders})")
+        params.extend(image_extensions)
+
+        # Filtro por categoría
+        if category_id is not None:
+            conditions.append("category_id = ?")
+            params.append(category_id)
+
+        # Filtro por búsqueda de texto
+        if search_text:
+            conditions.append("(label LIKE ? OR description LIKE ?)")
+            search_pattern = f"%{search_text}%"
+            params.extend([search_pattern, search_pattern])
+
+        # Filtro por favoritos
+        if is_favorite is not None:
+            conditions.append("is_favorite = ?")
+            params.append(1 if is_favorite else 0)
+
+        # Filtro por rango de fechas
+        if date_from:
+            conditions.append("DATE(created_at) >= ?")
+            params.append(date_from)
+
+        if date_to:
+            conditions.append("DATE(created_at) <= ?")
+            params.append(date_to)
+
+        # Filtro por tamaño de archivo
+        if min_size is not None:
+            conditions.append("file_size >= ?")
+            params.append(min_size)
+
+        if max_size is not None:
+            conditions.append("file_size <= ?")
+            params.append(max_size)
+
+        # Construir query
+        where_clause = " AND ".join(conditions)
+        query = f"SELECT COUNT(*) as count FROM items WHERE {where_clause}"
+
+        result = self.execute_query(query, tuple(params))
+        count = result[0]['count'] if result else 0
+
+        # Si hay filtro de tags, necesitamos obtener items y filtrar usando la tabla tags
+        if tags:
+            # Construir query con JOINs a tags e item_tags
+            tag_placeholders = ','.join(['?' for _ in tags])
+            tags_query = f"""
+                SELECT COUNT(DISTINCT i.id) as count
+                FROM items i
+                JOIN item_tags it ON i.id = it.item_id
+                JOIN tags t ON it.tag_id = t.id
+                WHERE {where_clause}
+                AND t.name IN ({tag_placeholders})
+            """
+
+            # Combinar parámetros
+            tag_params = list(params) + [tag.lower() for tag in tags]
+
+            tag_result = self.execute_query(tags_query, tuple(tag_params))
+            count = tag_result[0]['count'] if tag_result else 0
+
+        logger.debug(f"Image count: {count}")
+        return count
+
+    def get_image_categories(self) -> List[Dict]:
+        """
+        Obtener categorías que contienen imágenes
+
+        Returns:
+            List[Dict]: Lista de categorías con conteo de imágenes
+        """
+        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+        ext_placeholders = ','.join(['?' for _ in image_extensions])
+
+        query = f"""
+            SELECT
+                c.id,
+                c.name,
+                c.icon,
+                c.color,
+                COUNT(i.id) as image_count
+            FROM categories c
+            LEFT JOIN items i ON c.id = i.category_id
+                AND i.type = 'PATH'
+                AND i.file_extension IN ({ext_placeholders})
+            GROUP BY c.id, c.name, c.icon, c.color
+            HAVING image_count > 0
+            ORDER BY c.name
+        """
+
+        results = self.execute_query(query, tuple(image_extensions))
+        logger.debug(f"Found {len(results)} categories with images")
+        return results
+
+    def get_image_tags(self) -> List[str]:
+        """
+        Obtener todos los tags únicos de items de imagen
+
+        Returns:
+            List[str]: Lista de tags únicos ordenados alfabéticamente
+        """
+        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.ico', '.svg']
+        ext_placeholders = ','.join(['?' for _ in image_extensions])
+
+        query = f"""
+            SELECT DISTINCT tags
+            FROM items
+            WHERE type = 'PATH'
+            AND file_extension IN ({ext_placeholders})
+            AND tags IS NOT NULL
+            AND tags != ''
+        """
+
+        results = self.execute_query(query, tuple(image_extensions))
+
+        # Extraer y consolidar todos los tags
+        all_tags = set()
+        for item in results:
+            if item['tags']:
+                try:
+                    tags = json.loads(item['tags'])
+                    all_tags.update(tags)
+                except json.JSONDecodeError:
+                    if isinstance(item['tags'], str):
+                        tags = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+                        all_tags.update(tags)
+
+        sorted_tags = sorted(list(all_tags))
+        logger.debug(f"Found {len(sorted_tags)} unique image tags")
+        return sorted_tags
+
+    # ========== CLIPBOARD HISTORY ==========
+
+    def add_to_history(self, item_id: Optional[int], content: str) -> int:
+        """
+        Add entry to clipboard history
+
+        Args:
+            item_id: Associated item ID (optional)
+            content: Copied content
+
+        Returns:
+            int: History entry ID
+        """
+        query = """
+            INSERT INTO clipboard_history (item_id, content)
+            VALUES (?, ?)
+        """
+        history_id = self.execute_update(query, (item_id, content))
+        logger.debug(f"History entry added: ID {history_id}")
+
+        # Auto-trim history to max_history setting
+        max_history = self.get_setting('max_history', 20)
+        self.trim_history(keep_latest=max_history)
+
+        return history_id
+
+    def get_history(self, limit: int = 20) -> List[Dict]:
+        """
+        Get recent clipboard history
+
+        Args:
+            limit: Maximum entries to retrieve
+
+        Returns:
+            List[Dict]: List of history entries
+        """
+        query = """
+            SELECT h.*, i.label, i.type
+            FROM clipboard_history h
+            LEFT JOIN items i ON h.item_id = i.id
+            ORDER BY h.copied_at DESC
+            LIMIT ?
+        """
+        return self.execute_query(query, (limit,))
+
+    def clear_history(self) -> None:
+        """Clear all clipboard history"""
+        query = "DELETE FROM clipboard_history"
+        self.execute_update(query)
+        logger.info("Clipboard history cleared")
+
+    def trim_history(self, keep_latest: int = 20) -> None:
+        """
+        Keep only the latest N history entries
+
+        Args:
+            keep_latest: Number of entries to keep
+        """
+        query = """
+            DELETE FROM clipboard_history
+            WHERE id NOT IN (
+                SELECT id FROM clipboard_history
+                ORDER BY copied_at DESC
+                LIMIT ?
+            )
+        """
+        self.execute_update(query, (keep_latest,))
+        logger.debug(f"History trimmed to {keep_latest} entries")
+
+    # ========== PINNED PANELS ==========
+
+    def save_pinned_panel(self, category_id: int = None, x_pos: int = 0, y_pos: int = 0,
+                         width: int = 350, height: int = 500, is_minimized: bool = False,
+                         custom_name: str = None, custom_color: str = None,
+                         filter_config: str = None, keyboard_shortcut: str = None,
+                         panel_type: str = 'category', search_query: str = None,
+                         advanced_filters: str = None, state_filter: str = 'normal') -> int:
+        """
+        Save a pinned panel configuration to database
+
+        Args:
+            category_id: Category ID for category panels (None for global_search)
+            x_pos: X position on screen
+            y_pos: Y position on screen
+            width: Panel width
+            height: Panel height
+            is_minimized: Whether panel is minimized
+            custom_name: Custom name for panel (optional)
+            custom_color: Custom header color (optional, hex format)
+            filter_config: Filter configuration as JSON string (optional)
+            keyboard_shortcut: Keyboard shortcut string like 'Ctrl+Shift+1' (optional)
+            panel_type: Panel type ('category' or 'global_search')
+            search_query: Search query text for global_search panels (optional)
+            advanced_filters: Advanced filters as JSON string (optional)
+            state_filter: State filter ('normal', 'archived', 'inactive', 'all')
+
+        Returns:
+            int: New panel ID
+        """
+        query = """
+            INSERT INTO pinned_panels
+            (category_id, x_position, y_position, width, height, is_minimized,
+             custom_name, custom_color, filter_config, keyboard_shortcut,
+             panel_type, search_query, advanced_filters, state_filter, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+        """
+        panel_id = self.execute_update(
+            query,
+            (category_id, x_pos, y_pos, width, height, is_minimized, custom_name,
+             custom_color, filter_config, keyboard_shortcut, panel_type, search_query,
+             advanced_filters, state_filter)
+        )
+        logger.info(f"Pinned panel saved: Type={panel_type}, Category={category_id}, Query='{search_query}' (ID: {panel_id})")
+        return panel_id
+
+    def get_pinned_panels(self, active_only: bool = True) -> List[Dict]:
+        """
+        Retrieve all pinned panels
+
+        Args:
+            active_only: Only return panels marked as active
+
+        Returns:
+            List[Dict]: List of panel dictionaries with category info
+        """
+        if active_only:
+            query = """
+                SELECT p.*, c.name as category_name, c.icon as category_icon
+                FROM pinned_panels p
+                LEFT JOIN categories c ON p.category_id = c.id
+                WHERE p.is_active = 1
+                ORDER BY p.last_opened DESC
+            """
+            panels = self.execute_query(query)
+        else:
+            query = """
+                SELECT p.*, c.name as category_name, c.icon as category_icon
+                FROM pinned_panels p
+                LEFT JOIN categories c ON p.category_id = c.id
+                ORDER BY p.last_opened DESC
+            """
+            panels = self.execute_query(query)
+        logger.debug(f"Retrieved {len(panels)} pinned panels (active_only={active_only})")
+        return panels
+
+    def get_panel_by_id(self, panel_id: int) -> Optional[Dict]:
+        """
+        Get specific panel by ID
+
+        Args:
+            panel_id: Panel ID
+
+        Returns:
+            Optional[Dict]: Panel dictionary with category info, or None
+        """
+        query = """
+            SELECT p.*, c.name as category_name, c.icon as category_icon
+            FROM pinned_panels p
+            LEFT JOIN categories c ON p.category_id = c.id
+            WHERE p.id = ?
+        """
+        result = self.execute_query(query, (panel_id,))
+        return result[0] if result else None
+
+    def update_pinned_panel(self, panel_id: int, **kwargs) -> bool:
+        """
+        Update panel configuration
+
+        Args:
+            panel_id: Panel ID to update
+            **kwargs: Fields to update (x_position, y_position, width, height,
+                     is_minimized, custom_name, custom_color, filter_config,
+                     keyboard_shortcut, panel_type, search_query, advanced_filters,
+                     state_filter, is_active)
+
+        Returns:
+            bool: True if update successful
+        """
+        allowed_fields = [
+            'x_position', 'y_position', 'width', 'height', 'is_minimized',
+            'custom_name', 'custom_color', 'filter_config', 'keyboard_shortcut',
+            'panel_type', 'search_query', 'advanced_filters', 'state_filter', 'is_active'
+        ]
+        updates = []
+        params = []
+
+        for field, value in kwargs.items():
+            if field in allowed_fields:
+                updates.append(f"{field} = ?")
+                params.append(value)
+
+        if updates:
+            params.append(panel_id)
+            query = f"UPDATE pinned_panels SET {', '.join(updates)} WHERE id = ?"
+            self.execute_update(query, tuple(params))
+            logger.info(f"Pinned panel updated: ID {panel_id}")
+            return True
+        return False
+
+    def update_panel_last_opened(self, panel_id: int) -> None:
+        """
+        Update last_opened timestamp and increment open_count
+
+        Args:
+            panel_id: Panel ID
+        """
+        query = """
+            UPDATE pinned_panels
+            SET last_opened = CURRENT_TIMESTAMP,
+                open_count = open_count + 1
+            WHERE id = ?
+        """
+        self.execute_update(query, (panel_id,))
+        logger.debug(f"Panel {panel_id} opened - statistics updated")
+
+    def delete_pinned_panel(self, panel_id: int) -> bool:
+        """
+        Remove a pinned panel from database
+
+        Args:
+            panel_id: Panel ID to delete
+
+        Returns:
+            bool: True if deletion successful
+        """
+        query = "DELETE FROM pinned_panels WHERE id = ?"
+        self.execute_update(query, (panel_id,))
+        logger.info(f"Pinned panel deleted: ID {panel_id}")
+        return True
+
+    def get_recent_panels(self, limit: int = 10) -> List[Dict]:
+        """
+        Get recently opened panels ordered by last_opened DESC
+
+        Args:
+            limit: Maximum number of panels to return
+
+        Returns:
+            List[Dict]: List of panel dictionaries with category info
+        """
+        query = """
+            SELECT p.*, c.name as category_name, c.icon as category_icon
+            FROM pinned_panels p
+            LEFT JOIN categories c ON p.category_id = c.id
+            ORDER BY p.last_opened DESC
+            LIMIT ?
+        """
+        panels = self.execute_query(query, (limit,))
+        logger.debug(f"Retrieved {len(panels)} recent panels")
+        return panels
+
+    def deactivate_all_panels(self) -> None:
+        """
+        Set is_active=0 for all panels (called on app shutdown)
+        """
+        query = "UPDATE pinned_panels SET is_active = 0"
+        self.execute_update(query)
+        logger.info("All pinned panels marked as inactive")
+
+    # ========== FLOATING PANELS STATE (Related Items Panels) ==========
+
+    def save_floating_panel_state(self, panel_type: str, entity_id: int, position_x: int,
+                                   position_y: int, width: int, height: int,
+                                   is_maximized: bool = False) -> None:
+        """
+        Guardar o actualizar el estado de un panel flotante de items relacionados
+
+        Args:
+            panel_type: Tipo de panel ('tag', 'category', 'list', 'project')
+            entity_id: ID de la entidad relacionada
+            position_x: Posición X en pantalla
+            position_y: Posición Y en pantalla
+            width: Ancho del panel
+            height: Alto del panel
+            is_maximized: Si el panel está maximizado
+        """
+        query = """
+            INSERT OR REPLACE INTO floating_panels_state
+            (panel_type, entity_id, position_x, position_y, width, height, is_maximized, last_opened)
+            VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """
+        self.execute_update(query, (panel_type, entity_id, position_x, position_y,
+                                    width, height, is_maximized))
+        logger.debug(f"Saved floating panel state: {panel_type} - {entity_id}")
+
+    def get_floating_panel_state(self, panel_type: str, entity_id: int) -> Optional[Dict]:
+        """
+        Obtener el estado guardado de un panel flotante
+
+        Args:
+            panel_type: Tipo de panel
+            entity_id: ID de la entidad relacionada
+
+        Returns:
+            Dict con el estado del panel o None si no existe
+        """
+        query = """
+            SELECT * FROM floating_panels_state
+            WHERE panel_type = ? AND entity_id = ?
+        """
+        results = self.execute_query(query, (panel_type, entity_id))
+        return results[0] if results else None
+
+    def delete_floating_panel_state(self, panel_type: str, entity_id: int) -> bool:
+        """
+        Eliminar el estado guardado de un panel flotante
+
+        Args:
+            panel_type: Tipo de panel
+            entity_id: ID de la entidad relacionada
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = "DELETE FROM floating_panels_state WHERE panel_type = ? AND entity_id = ?"
+        self.execute_update(query, (panel_type, entity_id))
+        logger.debug(f"Deleted floating panel state: {panel_type} - {entity_id}")
+        return True
+
+    # ========== PINNED PROCESS PANELS ==========
+
+    def save_pinned_process_panel(self, process_id: int, x_pos: int = 0, y_pos: int = 0,
+                                   width: int = 500, height: int = 600,
+                                   is_minimized: bool = False) -> int:
+        """
+        Save a pinned process panel configuration to database
+
+        Args:
+            process_id: Process ID
+            x_pos: X position on screen
+            y_pos: Y position on screen
+            width: Panel width
+            height: Panel height
+            is_minimized: Whether panel is minimized
+
+        Returns:
+            int: New panel ID
+        """
+        query = """
+            INSERT INTO pinned_process_panels
+            (process_id, x_position, y_position, width, height, is_minimized, is_active)
+            VALUES (?, ?, ?, ?, ?, ?, 1)
+        """
+        panel_id = self.execute_update(
+            query,
+            (process_id, x_pos, y_pos, width, height, is_minimized)
+        )
+        logger.info(f"Pinned process panel saved: Process={process_id} (ID: {panel_id})")
+        return panel_id
+
+    def get_pinned_process_panels(self, active_only: bool = True) -> List[Dict]:
+        """
+        Retrieve all pinned process panels
+
+        Args:
+            active_only: Only return panels marked as active
+
+        Returns:
+            List[Dict]: List of panel dictionaries with process info
+        """
+        query = """
+            SELECT pp.*, p.name as process_name, p.icon as process_icon
+            FROM pinned_process_panels pp
+            INNER JOIN processes p ON pp.process_id = p.id
+        """
+        if active_only:
+            query += " WHERE pp.is_active = 1"
+
+        query += " ORDER BY pp.last_opened DESC"
+
+        panels = self.execute_query(query)
+        logger.debug(f"Retrieved {len(panels)} pinned process panels")
+        return panels
+
+    def update_pinned_process_panel(self, panel_id: int, **kwargs) -> bool:
+        """
+        Update pinned process panel configuration
+
+        Args:
+            panel_id: Panel ID to update
+            **kwargs: Fields to update (x_position, y_position, width, height, is_minimized)
+
+        Returns:
+            bool: True if update successful
+        """
+        allowed_fields = {'x_position', 'y_position', 'width', 'height', 'is_minimized'}
+        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+
+        if not updates:
+            return False
+
+        set_clause = ', '.join(f"{k} = ?" for k in updates.keys())
+        query = f"UPDATE pinned_process_panels SET {set_clause} WHERE id = ?"
+        params = list(updates.values()) + [panel_id]
+
+        self.execute_update(query, tuple(params))
+        logger.info(f"Pinned process panel updated: ID {panel_id}")
+        return True
+
+    def update_process_panel_last_opened(self, panel_id: int) -> None:
+        """
+        Update last_opened timestamp and increment open_count
+
+        Args:
+            panel_id: Panel ID
+        """
+        query = """
+            UPDATE pinned_process_panels
+            SET last_opened = CURRENT_TIMESTAMP,
+                open_count = open_count + 1
+            WHERE id = ?
+        """
+        self.execute_update(query, (panel_id,))
+        logger.debug(f"Process panel {panel_id} opened - statistics updated")
+
+    def delete_pinned_process_panel(self, panel_id: int) -> bool:
+        """
+        Remove a pinned process panel from database
+
+        Args:
+            panel_id: Panel ID to delete
+
+        Returns:
+            bool: True if deletion successful
+        """
+        query = "DELETE FROM pinned_process_panels WHERE id = ?"
+        self.execute_update(query, (panel_id,))
+        logger.info(f"Pinned process panel deleted: ID {panel_id}")
+        return True
+
+    def deactivate_all_process_panels(self) -> None:
+        """
+        Set is_active=0 for all process panels (called on app shutdown)
+        """
+        query = "UPDATE pinned_process_panels SET is_active = 0"
+        self.execute_update(query)
+        logger.info("All pinned process panels marked as inactive")
+
+    def get_panel_by_category(self, category_id: int) -> Optional[Dict]:
+        """
+        Check if an active panel for this category already exists
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            Optional[Dict]: Panel dictionary if exists, None otherwise
+        """
+        query = """
+            SELECT p.*, c.name as category_name, c.icon as category_icon
+            FROM pinned_panels p
+            JOIN categories c ON p.category_id = c.id
+            WHERE p.category_id = ? AND p.is_active = 1
+            LIMIT 1
+        """
+        result = self.execute_query(query, (category_id,))
+        return result[0] if result else None
+
+    # ========== BROWSER CONFIG ==========
+
+    def get_browser_config(self) -> Dict:
+        """
+        Get browser configuration from database.
+
+        Returns:
+            Dict: Browser configuration or default values if not exists
+        """
+        query = "SELECT * FROM browser_config LIMIT 1"
+        try:
+            result = self.execute_query(query)
+            if result:
+                config = result[0]
+                logger.debug(f"Browser config loaded: {config}")
+                return config
+            else:
+                # No config exists, insert default
+                logger.info("No browser config found, creating default")
+                default_config = {
+                    'home_url': 'https://www.google.com',
+                    'is_visible': False,
+                    'width': 500,
+                    'height': 700
+                }
+                self.save_browser_config(default_config)
+                return default_config
+        except Exception as e:
+            logger.error(f"Error loading browser config: {e}")
+            # Return default config on error
+            return {
+                'home_url': 'https://www.google.com',
+                'is_visible': False,
+                'width': 500,
+                'height': 700
+            }
+
+    def save_browser_config(self, config: Dict) -> bool:
+        """
+        Save browser configuration to database.
+
+        Args:
+            config: Dictionary with browser settings
+                   (home_url, is_visible, width, height)
+
+        Returns:
+            bool: True if save successful
+        """
+        try:
+            # Check if config exists
+            query = "SELECT id FROM browser_config LIMIT 1"
+            result = self.execute_query(query)
+
+            if result:
+                # Update existing config
+                config_id = result[0]['id']
+                update_query = """
+                    UPDATE browser_config
+                    SET home_url = ?,
+                        is_visible = ?,
+                        width = ?,
+                        height = ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """
+                self.execute_update(
+                    update_query,
+                    (
+                        config.get('home_url', 'https://www.google.com'),
+                        config.get('is_visible', False),
+                        config.get('width', 500),
+                        config.get('height', 700),
+                        config_id
+                    )
+                )
+                logger.info(f"Browser config updated: ID {config_id}")
+            else:
+                # Insert new config
+                insert_query = """
+                    INSERT INTO browser_config (home_url, is_visible, width, height)
+                    VALUES (?, ?, ?, ?)
+                """
+                self.execute_update(
+                    insert_query,
+                    (
+                        config.get('home_url', 'https://www.google.com'),
+                        config.get('is_visible', False),
+                        config.get('width', 500),
+                        config.get('height', 700)
+                    )
+                )
+                logger.info("Browser config created")
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving browser config: {e}")
+            return False
+
+    # ==================== Browser Profiles Management ====================
+
+    def get_browser_profiles(self) -> List[Dict]:
+        """
+        Get all browser profiles.
+
+        Returns:
+            List[Dict]: List of browser profiles
+        """
+        query = """
+            SELECT id, name, storage_path, is_default, created_at, last_used
+            FROM browser_profiles
+            ORDER BY is_default DESC, last_used DESC
+        """
+        try:
+            result = self.execute_query(query)
+            logger.debug(f"Retrieved {len(result) if result else 0} browser profiles")
+            return result if result else []
+        except Exception as e:
+            logger.error(f"Error getting browser profiles: {e}")
+            return []
+
+    def get_default_profile(self) -> Optional[Dict]:
+        """
+        Get the default browser profile.
+
+        Returns:
+            Dict: Default profile or None
+        """
+        query = """
+            SELECT id, name, storage_path, is_default, created_at, last_used
+            FROM browser_profiles
+            WHERE is_default = 1
+            LIMIT 1
+        """
+        try:
+            result = self.execute_query(query)
+            if result:
+                logger.debug(f"Default profile: {result[0]['name']}")
+                return result[0]
+            else:
+                logger.warning("No default profile found")
+                return None
+        except Exception as e:
+            logger.error(f"Error getting default profile: {e}")
+            return None
+
+    def get_profile_by_id(self, profile_id: int) -> Optional[Dict]:
+        """
+        Get browser profile by ID.
+
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            Dict: Profile data or None
+        """
+        query = """
+            SELECT id, name, storage_path, is_default, created_at, last_used
+            FROM browser_profiles
+            WHERE id = ?
+        """
+        try:
+            result = self.execute_query(query, (profile_id,))
+            return result[0] if result else None
+        except Exception as e:
+            logger.error(f"Error getting profile {profile_id}: {e}")
+            return None
+
+    def add_browser_profile(self, name: str, storage_path: str = None) -> Optional[int]:
+        """
+        Add a new browser profile.
+
+        Args:
+            name: Profile name
+            storage_path: Custom storage path (optional, auto-generated if None)
+
+        Returns:
+            int: Profile ID or None if failed
+        """
+        try:
+            # Auto-generate storage path if not provided
+            if not storage_path:
+                # Sanitize name for path
+                import re
+                safe_name = re.sub(r'[^\w\-]', '_', name.lower())
+                storage_path = f"browser_data/{safe_name}"
+
+            # Check if name already exists
+            check_query = "SELECT id FROM browser_profiles WHERE name = ?"
+            existing = self.execute_query(check_query, (name,))
+
+            if existing:
+                logger.warning(f"Profile with name '{name}' already exists")
+                return None
+
+            # Insert new profile
+            insert_query = """
+                INSERT INTO browser_profiles (name, storage_path, is_default)
+                VALUES (?, ?, 0)
+            """
+            self.execute_update(insert_query, (name, storage_path))
+
+            # Get inserted ID
+            last_id_query = "SELECT last_insert_rowid() as id"
+            result = self.execute_query(last_id_query)
+            profile_id = result[0]['id'] if result else None
+
+            logger.info(f"Browser profile created: '{name}' (ID: {profile_id})")
+            return profile_id
+
+        except Exception as e:
+            logger.error(f"Error adding browser profile: {e}")
+            return None
+
+    def delete_browser_profile(self, profile_id: int) -> bool:
+        """
+        Delete a browser profile.
+
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            bool: True if deleted successfully
+        """
+        try:
+            # Check if it's the default profile
+            profile = self.get_profile_by_id(profile_id)
+            if not profile:
+                logger.warning(f"Profile {profile_id} not found")
+                return False
+
+            if profile['is_default']:
+                logger.warning("Cannot delete default profile")
+                return False
+
+            # Delete profile
+            delete_query = "DELETE FROM browser_profiles WHERE id = ?"
+            self.execute_update(delete_query, (profile_id,))
+
+            logger.info(f"Browser profile {profile_id} deleted")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting browser profile: {e}")
+            return False
+
+    def set_default_profile(self, profile_id: int) -> bool:
+        """
+        Set a profile as default.
+
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            # Remove default from all profiles
+            update_all_query = "UPDATE browser_profiles SET is_default = 0"
+            self.execute_update(update_all_query)
+
+            # Set new default
+            update_query = "UPDATE browser_profiles SET is_default = 1 WHERE id = ?"
+            self.execute_update(update_query, (profile_id,))
+
+            logger.info(f"Profile {profile_id} set as default")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error setting default profile: {e}")
+            return False
+
+    def update_profile_last_used(self, profile_id: int) -> bool:
+        """
+        Update the last_used timestamp for a profile.
+
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            bool: True if successful
+        """
+        try:
+            update_query = """
+                UPDATE browser_profiles
+                SET last_used = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """
+            self.execute_update(update_query, (profile_id,))
+            logger.debug(f"Profile {profile_id} last_used updated")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating profile last_used: {e}")
+            return False
+
+    # ==================== Bookmarks Management ====================
+
+    def add_bookmark(self, title: str, url: str, folder: str = None) -> Optional[int]:
+        """
+        Agrega un marcador a la base de datos.
+
+        Args:
+            title: Título de la página
+            url: URL completa
+            folder: Carpeta/grupo opcional
+
+        Returns:
+            int: ID del marcador creado, o None si falla
+        """
+        try:
+            # Verificar si el marcador ya existe
+            check_query = "SELECT id FROM bookmarks WHERE url = ?"
+            existing = self.execute_query(check_query, (url,))
+
+            if existing:
+                logger.warning(f"Marcador ya existe para URL: {url}")
+                return existing[0]['id']
+
+            # Obtener el siguiente order_index
+            max_order_query = "SELECT COALESCE(MAX(order_index), -1) + 1 as next_order FROM bookmarks"
+            result = self.execute_query(max_order_query)
+            next_order = result[0]['next_order'] if result else 0
+
+            # Insertar marcador
+            insert_query = """
+                INSERT INTO bookmarks (title, url, folder, order_index)
+                VALUES (?, ?, ?, ?)
+            """
+            self.execute_update(insert_query, (title, url, folder, next_order))
+
+            # Obtener el ID insertado
+            last_id_query = "SELECT last_insert_rowid() as id"
+            result = self.execute_query(last_id_query)
+            bookmark_id = result[0]['id'] if result else None
+
+            logger.info(f"Marcador agregado: '{title}' - {url}")
+            return bookmark_id
+
+        except Exception as e:
+            logger.error(f"Error al agregar marcador: {e}")
+            return None
+
+    def get_bookmarks(self, folder: str = None) -> List[Dict]:
+        """
+        Obtiene todos los marcadores, opcionalmente filtrados por carpeta.
+
+        Args:
+            folder: Carpeta para filtrar (None = todos)
+
+        Returns:
+            List[Dict]: Lista de marcadores
+        """
+        try:
+            if folder is not None:
+                query = """
+                    SELECT id, title, url, folder, icon, created_at, order_index
+                    FROM bookmarks
+                    WHERE folder = ?
+                    ORDER BY order_index ASC, created_at DESC
+                """
+                result = self.execute_query(query, (folder,))
+            else:
+                query = """
+                    SELECT id, title, url, folder, icon, created_at, order_index
+                    FROM bookmarks
+                    ORDER BY order_index ASC, created_at DESC
+                """
+                result = self.execute_query(query)
+
+            return result if result else []
+
+        except Exception as e:
+            logger.error(f"Error al obtener marcadores: {e}")
+            return []
+
+    def delete_bookmark(self, bookmark_id: int) -> bool:
+        """
+        Elimina un marcador por su ID.
+
+        Args:
+            bookmark_id: ID del marcador
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        try:
+            delete_query = "DELETE FROM bookmarks WHERE id = ?"
+            self.execute_update(delete_query, (bookmark_id,))
+            logger.info(f"Marcador eliminado: ID {bookmark_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al eliminar marcador: {e}")
+            return False
+
+    def update_bookmark(self, bookmark_id: int, title: str = None, url: str = None,
+                       folder: str = None) -> bool:
+        """
+        Actualiza un marcador existente.
+
+        Args:
+            bookmark_id: ID del marcador
+            title: Nuevo título (opcional)
+            url: Nueva URL (opcional)
+            folder: Nueva carpeta (opcional)
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        try:
+            # Construir query dinámicamente solo con campos no-None
+            updates = []
+            params = []
+
+            if title is not None:
+                updates.append("title = ?")
+                params.append(title)
+
+            if url is not None:
+                updates.append("url = ?")
+                params.append(url)
+
+            if folder is not None:
+                updates.append("folder = ?")
+                params.append(folder)
+
+            if not updates:
+                logger.warning("No se especificaron campos para actualizar")
+                return False
+
+            params.append(bookmark_id)
+            update_query = f"UPDATE bookmarks SET {', '.join(updates)} WHERE id = ?"
+
+            self.execute_update(update_query, tuple(params))
+            logger.info(f"Marcador actualizado: ID {bookmark_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al actualizar marcador: {e}")
+            return False
+
+    def is_bookmark_exists(self, url: str) -> bool:
+        """
+        Verifica si ya existe un marcador con la URL dada.
+
+        Args:
+            url: URL a verificar
+
+        Returns:
+            bool: True si el marcador existe
+        """
+        try:
+            query = "SELECT id FROM bookmarks WHERE url = ?"
+            result = self.execute_query(query, (url,))
+            return len(result) > 0 if result else False
+
+        except Exception as e:
+            logger.error(f"Error al verificar marcador: {e}")
+            return False
+
+    # ==================== Speed Dial Management ====================
+
+    def add_speed_dial(self, title: str, url: str, icon: str = '🌐',
+                      background_color: str = '#16213e', thumbnail_path: str = None) -> Optional[int]:
+        """
+        Agrega un acceso rápido (speed dial) a la base de datos.
+
+        Args:
+            title: Título del sitio
+            url: URL completa
+            icon: Emoji o icono (default: 🌐)
+            background_color: Color de fondo del tile (default: #16213e)
+            thumbnail_path: Ruta a thumbnail/screenshot (opcional)
+
+        Returns:
+            int: ID del speed dial creado, o None si falla
+        """
+        try:
+            # Obtener la siguiente posición
+            max_pos_query = "SELECT COALESCE(MAX(position), -1) + 1 as next_pos FROM speed_dials"
+            result = self.execute_query(max_pos_query)
+            next_position = result[0]['next_pos'] if result else 0
+
+            # Insertar speed dial
+            insert_query = """
+                INSERT INTO speed_dials (title, url, icon, background_color, thumbnail_path, position)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """
+            self.execute_update(insert_query, (title, url, icon, background_color, thumbnail_path, next_position))
+
+            # Obtener el ID insertado
+            last_id_query = "SELECT last_insert_rowid() as id"
+            result = self.execute_query(last_id_query)
+            speed_dial_id = result[0]['id'] if result else None
+
+            logger.info(f"Speed dial agregado: '{title}' - {url}")
+            return speed_dial_id
+
+        except Exception as e:
+            logger.error(f"Error al agregar speed dial: {e}")
+            return None
+
+    def get_speed_dials(self) -> List[Dict]:
+        """
+        Obtiene todos los accesos rápidos ordenados por posición.
+
+        Returns:
+            List[Dict]: Lista de speed dials
+        """
+        try:
+            query = """
+                SELECT id, title, url, icon, background_color, thumbnail_path, position, created_at
+                FROM speed_dials
+                ORDER BY position ASC
+            """
+            result = self.execute_query(query)
+            return result if result else []
+
+        except Exception as e:
+            logger.error(f"Error al obtener speed dials: {e}")
+            return []
+
+    def update_speed_dial(self, speed_dial_id: int, title: str = None, url: str = None,
+                         icon: str = None, background_color: str = None,
+                         thumbnail_path: str = None) -> bool:
+        """
+        Actualiza un speed dial existente.
+
+        Args:
+            speed_dial_id: ID del speed dial
+            title: Nuevo título (opcional)
+            url: Nueva URL (opcional)
+            icon: Nuevo icono (opcional)
+            background_color: Nuevo color de fondo (opcional)
+            thumbnail_path: Nueva ruta de thumbnail (opcional)
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        try:
+            # Construir query dinámicamente solo con campos no-None
+            updates = []
+            params = []
+
+            if title is not None:
+                updates.append("title = ?")
+                params.append(title)
+
+            if url is not None:
+                updates.append("url = ?")
+                params.append(url)
+
+            if icon is not None:
+                updates.append("icon = ?")
+                params.append(icon)
+
+            if background_color is not None:
+                updates.append("background_color = ?")
+                params.append(background_color)
+
+            if thumbnail_path is not None:
+                updates.append("thumbnail_path = ?")
+                params.append(thumbnail_path)
+
+            if not updates:
+                logger.warning("No se especificaron campos para actualizar")
+                return False
+
+            updates.append("updated_at = CURRENT_TIMESTAMP")
+            params.append(speed_dial_id)
+
+            update_query = f"UPDATE speed_dials SET {', '.join(updates)} WHERE id = ?"
+            self.execute_update(update_query, tuple(params))
+            logger.info(f"Speed dial actualizado: ID {speed_dial_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al actualizar speed dial: {e}")
+            return False
+
+    def delete_speed_dial(self, speed_dial_id: int) -> bool:
+        """
+        Elimina un speed dial por su ID.
+
+        Args:
+            speed_dial_id: ID del speed dial
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        try:
+            delete_query = "DELETE FROM speed_dials WHERE id = ?"
+            self.execute_update(delete_query, (speed_dial_id,))
+            logger.info(f"Speed dial eliminado: ID {speed_dial_id}")
+
+            # Reorganizar posiciones
+            self._reorder_speed_dials()
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al eliminar speed dial: {e}")
+            return False
+
+    def reorder_speed_dial(self, speed_dial_id: int, new_position: int) -> bool:
+        """
+        Cambia la posición de un speed dial.
+
+        Args:
+            speed_dial_id: ID del speed dial
+            new_position: Nueva posición (0-based)
+
+        Returns:
+            bool: True si se reordenó correctamente
+        """
+        try:
+            update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
+            self.execute_update(update_query, (new_position, speed_dial_id))
+            self._reorder_speed_dials()
+            logger.info(f"Speed dial reordenado: ID {speed_dial_id} -> posición {new_position}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al reordenar speed dial: {e}")
+            return False
+
+    def _reorder_speed_dials(self):
+        """Reorganiza las posiciones de speed dials para que sean consecutivas (0, 1, 2, ...)."""
+        try:
+            # Obtener todos los speed dials ordenados por posición actual
+            speed_dials = self.get_speed_dials()
+
+            # Actualizar posiciones para que sean consecutivas
+            for index, sd in enumerate(speed_dials):
+                if sd['position'] != index:
+                    update_query = "UPDATE speed_dials SET position = ? WHERE id = ?"
+                    self.execute_update(update_query, (index, sd['id']))
+
+        except Exception as e:
+            logger.error(f"Error al reorganizar speed dials: {e}")
+
+    # ==================== Browser Sessions Management ====================
+
+    def save_session(self, name: str, tabs_data: list, is_auto_save: bool = False) -> Optional[int]:
+        """
+        Guarda una sesión del navegador con todas sus pestañas.
+
+        Args:
+            name: Nombre de la sesión
+            tabs_data: Lista de diccionarios con datos de pestañas [{url, title, position, is_active}]
+            is_auto_save: Si es una sesión de auto-guardado (True) o guardada manualmente (False)
+
+        Returns:
+            int: ID de la sesión creada o None si falla
+        """
+        try:
+            # Si es auto-save, eliminar sesiones auto-save anteriores
+            if is_auto_save:
+                delete_query = "DELETE FROM browser_sessions WHERE is_auto_save = 1"
+                self.execute_update(delete_query)
+
+            # Crear sesión
+            insert_query = """
+                INSERT INTO browser_sessions (name, is_auto_save)
+                VALUES (?, ?)
+            """
+            self.execute_update(insert_query, (name, 1 if is_auto_save else 0))
+
+            # Obtener ID de la sesión creada
+            session_id_query = "SELECT last_insert_rowid() as id"
+            result = self.execute_query(session_id_query)
+            if not result:
+                logger.error("No se pudo obtener el ID de la sesión")
+                return None
+
+            session_id = result[0]['id']
+
+            # Guardar pestañas
+            for tab in tabs_data:
+                tab_query = """
+                    INSERT INTO session_tabs (session_id, url, title, position, is_active)
+                    VALUES (?, ?, ?, ?, ?)
+                """
+                self.execute_update(tab_query, (
+                    session_id,
+                    tab.get('url', ''),
+                    tab.get('title', 'Nueva pestaña'),
+                    tab.get('position', 0),
+                    1 if tab.get('is_active', False) else 0
+                ))
+
+            logger.info(f"Sesión guardada: {name} (ID: {session_id}) con {len(tabs_data)} pestañas")
+            return session_id
+
+        except Exception as e:
+            logger.error(f"Error al guardar sesión: {e}")
+            return None
+
+    def get_sessions(self, include_auto_save: bool = False) -> List[Dict]:
+        """
+        Obtiene todas las sesiones guardadas.
+
+        Args:
+            include_auto_save: Si incluir sesiones de auto-guardado
+
+        Returns:
+            Lista de diccionarios con información de sesiones
+        """
+        try:
+            if include_auto_save:
+                query = """
+                    SELECT id, name, is_auto_save, created_at, updated_at,
+                           (SELECT COUNT(*) FROM session_tabs WHERE session_id = browser_sessions.id) as tab_count
+                    FROM browser_sessions
+                    ORDER BY created_at DESC
+                """
+            else:
+                query = """
+                    SELECT id, name, is_auto_save, created_at, updated_at,
+                           (SELECT COUNT(*) FROM session_tabs WHERE session_id = browser_sessions.id) as tab_count
+                    FROM browser_sessions
+                    WHERE is_auto_save = 0
+                    ORDER BY created_at DESC
+                """
+
+            result = self.execute_query(query)
+            return result if result else []
+
+        except Exception as e:
+            logger.error(f"Error al obtener sesiones: {e}")
+            return []
+
+    def get_session_tabs(self, session_id: int) -> List[Dict]:
+        """
+        Obtiene todas las pestañas de una sesión.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            Lista de diccionarios con información de pestañas
+        """
+        try:
+            query = """
+                SELECT id, url, title, position, is_active
+                FROM session_tabs
+                WHERE session_id = ?
+                ORDER BY position ASC
+            """
+            result = self.execute_query(query, (session_id,))
+            return result if result else []
+
+        except Exception as e:
+            logger.error(f"Error al obtener pestañas de sesión: {e}")
+            return []
+
+    def get_last_auto_save_session(self) -> Optional[Dict]:
+        """
+        Obtiene la última sesión guardada automáticamente.
+
+        Returns:
+            Diccionario con información de la sesión o None
+        """
+        try:
+            query = """
+                SELECT id, name, is_auto_save, created_at, updated_at
+                FROM browser_sessions
+                WHERE is_auto_save = 1
+                ORDER BY created_at DESC
+                LIMIT 1
+            """
+            result = self.execute_query(query)
+            return result[0] if result else None
+
+        except Exception as e:
+            logger.error(f"Error al obtener última sesión auto-guardada: {e}")
+            return None
+
+    def delete_session(self, session_id: int) -> bool:
+        """
+        Elimina una sesión y todas sus pestañas.
+
+        Args:
+            session_id: ID de la sesión
+
+        Returns:
+            True si se eliminó correctamente, False en caso contrario
+        """
+        try:
+            # Las pestañas se eliminan automáticamente por la cláusula ON DELETE CASCADE
+            delete_query = "DELETE FROM browser_sessions WHERE id = ?"
+            self.execute_update(delete_query, (session_id,))
+            logger.info(f"Sesión eliminada: {session_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al eliminar sesión: {e}")
+            return False
+
+    def rename_session(self, session_id: int, new_name: str) -> bool:
+        """
+        Renombra una sesión.
+
+        Args:
+            session_id: ID de la sesión
+            new_name: Nuevo nombre de la sesión
+
+        Returns:
+            True si se renombró correctamente, False en caso contrario
+        """
+        try:
+            update_query = """
+                UPDATE browser_sessions
+                SET name = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """
+            self.execute_update(update_query, (new_name, session_id))
+            logger.info(f"Sesión {session_id} renombrada a: {new_name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error al renombrar sesión: {e}")
+            return False
+
+    # ==================== NOTEBOOK TABS MANAGEMENT ====================
+
+    def get_notebook_tabs(self, order_by='position'):
+        """
+        Obtener todas las pestañas del notebook ordenadas
+
+        Args:
+            order_by: Campo por el cual ordenar (default: 'position')
+
+        Returns:
+            List[Dict]: Lista de pestañas
+        """
+        query = f"SELECT * FROM notebook_tabs ORDER BY {order_by} ASC"
+        return self.execute_query(query)
+
+    def get_notebook_tab(self, tab_id):
+        """
+        Obtener una pestaña específica
+
+        Args:
+            tab_id: ID de la pestaña
+
+        Returns:
+            Optional[Dict]: Datos de la pestaña o None
+        """
+        query = "SELECT * FROM notebook_tabs WHERE id = ?"
+        result = self.execute_query(query, (tab_id,))
+        return result[0] if result else None
+
+    def add_notebook_tab(self, title='Sin título', position=None):
+        """
+        Crear nueva pestaña del notebook
+
+        Args:
+            title: Título de la pestaña
+            position: Posición de la pestaña (auto-calculada si es None)
+
+        Returns:
+            int: ID de la pestaña creada
+        """
+        if position is None:
+            # Obtener última posición
+            result = self.execute_query(
+                "SELECT MAX(position) as max_pos FROM notebook_tabs"
+            )
+            max_pos = result[0]['max_pos'] if result and result[0]['max_pos'] is not None else -1
+            position = max_pos + 1
+
+        query = """
+            INSERT INTO notebook_tabs (title, position, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """
+        tab_id = self.execute_update(query, (title, position))
+        logger.info(f"Notebook tab created: '{title}' (ID: {tab_id}, position: {position})")
+        return tab_id
+
+    def update_notebook_tab(self, tab_id, **fields):
+        """
+        Actualizar campos de una pestaña del notebook
+
+        Args:
+            tab_id: ID de la pestaña
+            **fields: Campos a actualizar (title, content, category_id, item_type,
+                     tags, description, is_sensitive, is_active, is_archived, position)
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        allowed_fields = [
+            'title', 'content', 'category_id', 'item_type', 'tags',
+            'description', 'is_sensitive', 'is_active', 'is_archived', 'position'
+        ]
+
+        updates = []
+        values = []
+
+        for field, value in fields.items():
+            if field in allowed_fields:
+                updates.append(f"{field} = ?")
+                values.append(value)
+
+        if not updates:
+            logger.warning(f"No valid fields to update for notebook tab {tab_id}")
+            return False
+
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        values.append(tab_id)
+
+        query = f"UPDATE notebook_tabs SET {', '.join(updates)} WHERE id = ?"
+
+        try:
+            self.execute_update(query, tuple(values))
+            logger.debug(f"Notebook tab updated: ID {tab_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error updating notebook tab {tab_id}: {e}")
+            return False
+
+    def delete_notebook_tab(self, tab_id):
+        """
+        Eliminar una pestaña del notebook
+
+        Args:
+            tab_id: ID de la pestaña
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = "DELETE FROM notebook_tabs WHERE id = ?"
+        try:
+            self.execute_update(query, (tab_id,))
+            logger.info(f"Notebook tab deleted: ID {tab_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting notebook tab {tab_id}: {e}")
+            return False
+
+    def reorder_notebook_tabs(self, tab_ids_in_order):
+        """
+        Reordenar pestañas según lista de IDs
+
+        Args:
+            tab_ids_in_order: Lista de IDs en el orden deseado
+
+        Returns:
+            bool: True si se reordenó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+                for position, tab_id in enumerate(tab_ids_in_order):
+                    cursor.execute(
+                        "UPDATE notebook_tabs SET position = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                        (position, tab_id)
+                    )
+            logger.info(f"Notebook tabs reordered: {len(tab_ids_in_order)} tabs")
+            return True
+        except Exception as e:
+            logger.error(f"Error reordering notebook tabs: {e}")
+            return False
+
+    def count_notebook_tabs(self):
+        """
+        Contar número de pestañas del notebook
+
+        Returns:
+            int: Número de pestañas
+        """
+        query = "SELECT COUNT(*) as count FROM notebook_tabs"
+        result = self.execute_query(query)
+        return result[0]['count'] if result else 0
+
+    # ==================== AI Bulk Import Support ====================
+
+    def get_category_by_id(self, category_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get category by ID.
+
+        Args:
+            category_id: ID of the category
+
+        Returns:
+            Dictionary with category data or None if not found
+        """
+        query = "SELECT * FROM categories WHERE id = ?"
+        result = self.execute_query(query, (category_id,))
+
+        if result:
+            category = dict(result[0])
+            logger.debug(f"Category found: {category['name']} (ID: {category_id})")
+            return category
+        else:
+            logger.warning(f"Category not found: ID {category_id}")
+            return None
+
+    def update_category_item_count(self, category_id: int) -> None:
+        """
+        Update item_count field of a category based on active items.
+
+        This method counts all active items in the category and updates
+        the item_count field accordingly.
+
+        Args:
+            category_id: ID of the category to update
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Count active items in category
+                cursor.execute(
+                    "SELECT COUNT(*) as count FROM items WHERE category_id = ? AND is_active = 1",
+                    (category_id,)
+                )
+                count = cursor.fetchone()['count']
+
+                # Update category item_count
+                cursor.execute(
+                    "UPDATE categories SET item_count = ? WHERE id = ?",
+                    (count, category_id)
+                )
+
+            logger.info(f"Updated item_count for category {category_id}: {count} items")
+
+        except Exception as e:
+            logger.error(f"Error updating category item_count for {category_id}: {e}")
+            raise
+
+    # ==================== Table Operations ====================
+
+    def add_table_items(self, category_id: str, table_name: str, table_data: list,
+                       column_names: list, tags: list = None, sensitive_columns: list = None,
+                       url_columns: list = None) -> dict:
+        """
+        Create all items for a table in a single transaction
+
+        Args:
+            category_id: Category ID where table belongs
+            table_name: Unique name for the table
+            table_data: 2D list of cell values [[row1_col1, row1_col2], [row2_col1, row2_col2]]
+            column_names: List of column names
+            tags: Optional list of tags to apply to all items
+            sensitive_columns: Optional list of column indices that should be marked as sensitive
+            url_columns: Optional list of column indices that should be marked as type URL
+
+        Returns:
+            dict with 'success', 'items_created', 'table_name', 'errors'
+        """
+        try:
+            logger.info(f"Creating table '{table_name}' in category {category_id}")
+            logger.info(f"  Rows: {len(table_data)}, Columns: {len(column_names)}")
+
+            items_created = 0
+            errors = []
+
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Validate table name is unique
+                cursor.execute(
+                    "SELECT COUNT(*) as count FROM tables WHERE name = ?",
+                    (table_name,)
+                )
+                if cursor.fetchone()['count'] > 0:
+                    logger.error(f"Table name '{table_name}' already exists")
+                    return {
+                        'success': False,
+                        'items_created': 0,
+                        'table_name': table_name,
+                        'errors': [f"Table name '{table_name}' already exists"]
+                    }
+
+                # Create table entry
+                cursor.execute(
+                    "INSERT INTO tables (name, description) VALUES (?, ?)",
+                    (table_name, f"Table created from bulk import")
+                )
+                table_id = cursor.lastrowid
+
+                # Preparar tags base (los que vienen del usuario)
+                base_tags = tags if tags else []
+
+                # Prepare sensitive columns set for fast lookup
+                sensitive_cols_set = set(sensitive_columns) if sensitive_columns else set()
+
+                # Prepare URL columns set for fast lookup
+                url_cols_set = set(url_columns) if url_columns else set()
+
+                # Insert each cell as an item
+                for row_idx, row_data in enumerate(table_data):
+                    # Obtener el valor de la primera celda (nombre de fila)
+                    first_cell_value = ""
+                    first_cell_original = ""  # Valor original sin sanitizar para el tag
+
+                    if len(row_data) > 0 and row_data[0]:
+                        first_cell_original = str(row_data[0]).strip()
+                        first_cell_value = first_cell_original
+
+                        # Sanitizar el valor para usarlo en list_group (remover caracteres especiales)
+                        first_cell_value = first_cell_value.replace(' ', '_')
+                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
+                        # Limitar longitud
+                        if len(first_cell_value) > 50:
+                            first_cell_value = first_cell_value[:50]
+
+                    # Si la primera celda está vacía, usar row_N como fallback
+                    if not first_cell_value:
+                        first_cell_value = f"row_{row_idx}"
+                        first_cell_original = f"row_{row_idx}"
+
+                    # Generar list_group: solo el nombre de la primera celda (sin prefijo de tabla)
+                    list_group_name = first_cell_value
+
+                    for col_idx, cell_value in enumerate(row_data):
+                        # Skip empty cells
+                        if not cell_value or str(cell_value).strip() == '':
+                            continue
+
+                        try:
+                            # Create item for this cell
+                            column_name = column_names[col_idx] if col_idx < len(column_names) else f"COL_{col_idx}"
+
+                            # Generar tags automáticos para esta celda
+                            # Formato: ["tabla", "lista", "nombre_tabla", "nombre_fila", "nombre_columna"]
+                            # Nota: Se incluye "lista" porque cada fila de una tabla también es una lista
+                            cell_tags = ["tabla", "lista", table_name, first_cell_original, column_name]
+
+                            # Agregar tags base del usuario (si existen)
+                            for tag in base_tags:
+                                if tag and tag not in cell_tags:
+                                    cell_tags.append(tag)
+
+                            # Determinar si esta columna es sensible
+                            is_sensitive = 1 if col_idx in sensitive_cols_set else 0
+
+                            # Determinar el tipo de item
+                            item_type = 'URL' if col_idx in url_cols_set else 'TEXT'
+
+                            # Cifrar contenido si es sensible
+                            content_to_store = str(cell_value)
+                            if is_sensitive and content_to_store:
+                                from src.core.encryption_manager import EncryptionManager
+                                encryption_manager = EncryptionManager()
+                                content_to_store = encryption_manager.encrypt(content_to_store)
+                                logger.debug(f"Content encrypted for sensitive column '{column_name}' at [{row_idx}, {col_idx}]")
+
+                            cursor.execute("""
+                                INSERT INTO items (
+                                    category_id, label, content, type,
+                                    table_id, orden_table,
+                                    is_list, list_group, orden_lista,
+                                    is_sensitive, created_at, updated_at
+                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+                            """, (
+                                int(category_id),  # Convert to INTEGER
+                                column_name,  # Label = column name
+                                content_to_store,  # Content = cell value (cifrado si es sensible)
+                                item_type,  # Type (URL si está en url_columns, TEXT por defecto)
+                                table_id,  # table_id (FK a tabla tables)
+                                json.dumps([row_idx, col_idx]),  # orden_table as JSON [row, col]
+                                1,  # is_list = True (for row grouping)
+                                list_group_name,  # list_group = {table_name}_{primera_celda}
+                                col_idx + 1,  # orden_lista = column index + 1 (empieza en 1)
+                                is_sensitive  # is_sensitive (1 si columna marcada como sensible)
+                            ))
+
+                            item_id = cursor.lastrowid
+                            items_created += 1
+
+                            # Crear relaciones en item_tags para cada tag
+                            # Usar la función set_item_tags que ya maneja la tabla tags y item_tags
+                            if cell_tags:
+                                # Necesitamos hacer esto fuera de la transacción actual
+                                # porque set_item_tags usa su propia transacción
+                                # Guardar para procesarlos después
+                                if not hasattr(self, '_pending_tags'):
+                                    self._pending_tags = []
+                                self._pending_tags.append((item_id, cell_tags))
+
+                        except Exception as e:
+                            error_msg = f"Error creating item at [{row_idx}, {col_idx}]: {e}"
+                            logger.error(error_msg)
+                            errors.append(error_msg)
+
+            # Update category item_count (outside transaction)
+            self.update_category_item_count(category_id)
+
+            # Procesar tags pendientes (fuera de la transacción principal)
+            if hasattr(self, '_pending_tags') and self._pending_tags:
+                logger.info(f"Processing {len(self._pending_tags)} pending tag associations...")
+                for item_id, tags_list in self._pending_tags:
+                    try:
+                        self.set_item_tags(item_id, tags_list)
+                    except Exception as e:
+                        error_msg = f"Error setting tags for item {item_id}: {e}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+
+                # Limpiar tags pendientes
+                self._pending_tags = []
+
+            logger.info(f"Table '{table_name}' created: {items_created} items")
+
+            return {
+                'success': items_created > 0,
+                'items_created': items_created,
+                'table_name': table_name,
+                'errors': errors
+            }
+
+        except Exception as e:
+            logger.error(f"Error creating table '{table_name}': {e}", exc_info=True)
+            return {
+                'success': False,
+                'items_created': 0,
+                'table_name': table_name,
+                'errors': [str(e)]
+            }
+
+    def get_table_items(self, table_name: str) -> list:
+        """
+        Retrieve all items belonging to a specific table
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            List of item dictionaries ordered by [row, col]
+        """
+        try:
+            logger.info(f"Retrieving items for table '{table_name}'")
+
+            query = """
+                SELECT i.* FROM items i
+                INNER JOIN tables t ON i.table_id = t.id
+                WHERE t.name = ?
+                ORDER BY i.orden_table
+            """
+            results = self.execute_query(query, (table_name,))
+
+            # Parse tags for each item
+            for item in results:
+                if item['tags']:
+                    try:
+                        item['tags'] = json.loads(item['tags'])
+                    except json.JSONDecodeError:
+                        if isinstance(item['tags'], str):
+                            item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+                        else:
+                            item['tags'] = []
+                else:
+                    item['tags'] = []
+
+            logger.info(f"Found {len(results)} items for table '{table_name}'")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error retrieving table items for '{table_name}': {e}")
+            return []
+
+    def get_tables_by_category_legacy(self, category_id: str) -> list:
+        """
+        Get list of all tables in a category (legacy version - refactored)
+
+        Args:
+            category_id: Category ID
+
+        Returns:
+            List of dicts with table info: {'name', 'rows', 'cols', 'item_count', 'created_at'}
+        """
+        try:
+            logger.info(f"Getting tables for category {category_id}")
+
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Get unique tables in this category
+                cursor.execute("""
+                    SELECT
+                        t.name,
+                        t.id,
+                        COUNT(i.id) as item_count,
+                        MIN(i.created_at) as created_at
+                    FROM tables t
+                    INNER JOIN items i ON t.id = i.table_id
+                    WHERE i.category_id = ?
+                    GROUP BY t.id, t.name
+                    ORDER BY created_at DESC
+                """, (category_id,))
+
+                tables = []
+                for row in cursor.fetchall():
+                    table_name = row['name']
+                    table_id = row['id']
+
+                    # Get dimensions (max row and col from orden_table)
+                    cursor.execute("""
+                        SELECT orden_table FROM items
+                        WHERE table_id = ?
+                    """, (table_id,))
+
+                    coords = []
+                    for item_row in cursor.fetchall():
+                        try:
+                            coord = json.loads(item_row['orden_table'])
+                            coords.append(coord)
+                        except:
+                            continue
+
+                    max_row = max([c[0] for c in coords]) + 1 if coords else 0
+                    max_col = max([c[1] for c in coords]) + 1 if coords else 0
+
+                    tables.append({
+                        'name': table_name,
+                        'rows': max_row,
+                        'cols': max_col,
+                        'item_count': row['item_count'],
+                        'created_at': row['created_at']
+                    })
+
+                logger.info(f"Found {len(tables)} tables in category {category_id}")
+                return tables
+
+        except Exception as e:
+            logger.error(f"Error getting tables for category {category_id}: {e}")
+            return []
+
+    def update_table_cell(self, table_name: str, row: int, col: int, new_content: str) -> bool:
+        """
+        Update content of a specific table cell
+
+        Args:
+            table_name: Name of the table
+            row: Row index (0-based)
+            col: Column index (0-based)
+            new_content: New content for the cell
+
+        Returns:
+            True if successful
+        """
+        try:
+            logger.info(f"Updating table '{table_name}' cell [{row}, {col}]")
+
+            orden_json = json.dumps([row, col])
+
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Find item at this position
+                cursor.execute("""
+                    SELECT i.id FROM items i
+                    INNER JOIN tables t ON i.table_id = t.id
+                    WHERE t.name = ? AND i.orden_table = ?
+                """, (table_name, orden_json))
+
+                result = cursor.fetchone()
+
+                if result:
+                    # Update existing item
+                    item_id = result['id']
+                    cursor.execute("""
+                        UPDATE items
+                        SET content = ?, updated_at = datetime('now')
+                        WHERE id = ?
+                    """, (new_content, item_id))
+
+                    # Si se actualizó la primera columna, actualizar list_group de toda la fila
+                    if col == 0 and new_content and new_content.strip():
+                        # Sanitizar el nuevo valor para list_group
+                        first_cell_value = new_content.strip()
+                        first_cell_value = first_cell_value.replace(' ', '_')
+                        first_cell_value = ''.join(c for c in first_cell_value if c.isalnum() or c in ('_', '-'))
+                        if len(first_cell_value) > 50:
+                            first_cell_value = first_cell_value[:50]
+
+                        if first_cell_value:
+                            new_list_group = first_cell_value  # Solo el valor de la primera celda
+
+                            # Actualizar list_group de todos los items de esta fila
+                            cursor.execute("""
+                                UPDATE items
+                                SET list_group = ?, updated_at = datetime('now')
+                                WHERE table_id = (SELECT id FROM tables WHERE name = ?)
+                                AND json_extract(orden_table, '$[0]') = ?
+                            """, (new_list_group, table_name, row))
+
+                            logger.info(f"Updated list_group for row {row} to '{new_list_group}'")
+
+                    logger.info(f"✓ Cell updated successfully")
+                    return True
+                else:
+                    logger.warning(f"No item found at table '{table_name}' position [{row}, {col}]")
+                    return False
+
+        except Exception as e:
+            logger.error(f"Error updating table cell: {e}")
+            return False
+
+    def delete_table_by_name(self, table_name: str) -> bool:
+        """
+        Delete all items belonging to a table (legacy method)
+
+        Args:
+            table_name: Name of the table to delete
+
+        Returns:
+            True if successful
+        """
+        try:
+            logger.info(f"Deleting table '{table_name}'")
+
+            with self.transaction() as conn:
+                cursor = conn.cursor()
+
+                # Get category_id before deleting (for updating item_count)
+                cursor.execute("""
+                    SELECT DISTINCT i.category_id FROM items i
+                    INNER JOIN tables t ON i.table_id = t.id
+                    WHERE t.name = ?
+                    LIMIT 1
+                """, (table_name,))
+
+                result = cursor.fetchone()
+                category_id = result['category_id'] if result else None
+
+                # Delete table (CASCADE will delete items)
+                cursor.execute("""
+                    DELETE FROM tables
+                    WHERE name = ?
+                """, (table_name,))
+
+                deleted_count = cursor.rowcount
+
+            # Update category item_count if needed (outside transaction)
+            if category_id:
+                self.update_category_item_count(category_id)
+
+            logger.info(f"✓ Table '{table_name}' deleted: {deleted_count} items removed")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting table '{table_name}': {e}")
+            return False
+
+    def export_table_to_dict(self, table_name: str) -> dict:
+        """
+        Export table structure and data to dictionary
+
+        Args:
+            table_name: Name of the table
+
+        Returns:
+            Dict with table metadata and data:
+            {
+                'table_name': str,
+                'columns': list[str],
+                'rows': list[list[str]],
+                'metadata': {
+                    'created_at': str,
+                    'total_rows': int,
+                    'total_cols': int,
+                    'total_items': int
+                }
+            }
+        """
+        try:
+            logger.info(f"Exporting table '{table_name}' to dict")
+
+            items = self.get_table_items(table_name)
+
+            if not items:
+                logger.warning(f"No items found for table '{table_name}'")
+                return {
+                    'table_name': table_name,
+                    'columns': [],
+                    'rows': [],
+                    'metadata': {
+                        'created_at': None,
+                        'total_rows': 0,
+                        'total_cols': 0,
+                        'total_items': 0
+                    }
+                }
+
+            # Build coordinate map
+            cells = {}  # {(row, col): {'label': str, 'content': str}}
+            max_row = 0
+            max_col = 0
+            created_at = None
+
+            for item in items:
+                try:
+                    coord = json.loads(item['orden_table'])
+                    row, col = coord[0], coord[1]
+                    cells[(row, col)] = {
+                        'label': item['label'],
+                        'content': item['content']
+                    }
+                    max_row = max(max_row, row)
+                    max_col = max(max_col, col)
+
+                    if created_at is None or item['created_at'] < created_at:
+                        created_at = item['created_at']
+                except Exception as e:
+                    logger.warning(f"Error parsing item coordinates: {e}")
+                    continue
+
+            # Extract column names (from row 0 labels or generate)
+            columns = []
+            for col in range(max_col + 1):
+                if (0, col) in cells:
+                    columns.append(cells[(0, col)]['label'])
+                else:
+                    columns.append(f"COL_{col}")
+
+            # Build rows matrix
+            rows = []
+            for row in range(max_row + 1):
+                row_data = []
+                for col in range(max_col + 1):
+                    if (row, col) in cells:
+                        row_data.append(cells[(row, col)]['content'])
+                    else:
+                        row_data.append('')  # Empty cell
+                rows.append(row_data)
+
+            result = {
+                'table_name': table_name,
+                'columns': columns,
+                'rows': rows,
+                'metadata': {
+                    'created_at': str(created_at) if created_at else None,
+                    'total_rows': max_row + 1,
+                    'total_cols': max_col + 1,
+                    'total_items': len(items)
+                }
+            }
+
+            logger.info(f"✓ Table '{table_name}' exported: {len(rows)} rows × {len(columns)} cols")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error exporting table '{table_name}': {e}", exc_info=True)
+            return {
+                'table_name': table_name,
+                'columns': [],
+                'rows': [],
+                'metadata': {
+                    'created_at': None,
+                    'total_rows': 0,
+                    'total_cols': 0,
+                    'total_items': 0
+                }
+            }
+
+    # ==================== PROCESSES CRUD ====================
+
+    def add_process(self, name: str, description: str = None, icon: str = None,
+                    color: str = None, execution_mode: str = 'sequential',
+                    delay_between_steps: int = 500, tags: str = None,
+                    category: str = None) -> int:
+        """
+        Create a new process
+
+        Args:
+            name: Process name
+            description: Process description
+            icon: Process icon (emoji)
+            color: Process color (hex)
+            execution_mode: Execution mode (sequential, parallel, manual)
+            delay_between_steps: Delay in milliseconds between steps
+            tags: Comma-separated tags
+            category: Category name
+
+        Returns:
+            int: ID of created process
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO processes (
+                    name, description, icon, color, execution_mode,
+                    delay_between_steps, tags, category
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (name, description, icon or '⚙️', color, execution_mode,
+                  delay_between_steps, tags, category))
+
+            process_id = cursor.lastrowid
+            logger.info(f"Process created: {name} (ID: {process_id})")
+            return process_id
+
+    def get_process(self, process_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get process by ID
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            Dict with process data or None
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT * FROM processes WHERE id = ?
+        """, (process_id,))
+
+        row = cursor.fetchone()
+        if row:
+            return dict(row)
+        return None
+
+    def get_all_processes(self, include_archived: bool = False,
+                          include_inactive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all processes
+
+        Args:
+            include_archived: Include archived processes
+            include_inactive: Include inactive processes
+
+        Returns:
+            List of process dicts
+        """
+        conn = self.connect()
+
+        query = "SELECT * FROM processes WHERE 1=1"
+        params = []
+
+        if not include_archived:
+            query += " AND is_archived = 0"
+
+        if not include_inactive:
+            query += " AND is_active = 1"
+
+        query += " ORDER BY pinned_order ASC, order_index ASC, name ASC"
+
+        cursor = conn.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def update_process(self, process_id: int, **kwargs) -> bool:
+        """
+        Update process fields
+
+        Args:
+            process_id: Process ID
+            **kwargs: Fields to update
+
+        Returns:
+            bool: Success status
+        """
+        if not kwargs:
+            return True
+
+        # Add updated_at timestamp
+        kwargs['updated_at'] = datetime.now().isoformat()
+
+        # Build UPDATE query
+        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
+        values = list(kwargs.values()) + [process_id]
+
+        with self.transaction() as conn:
+            conn.execute(f"""
+                UPDATE processes SET {fields} WHERE id = ?
+            """, values)
+
+        logger.info(f"Process {process_id} updated: {list(kwargs.keys())}")
+        return True
+
+    def delete_process(self, process_id: int) -> bool:
+        """
+        Delete process and all its steps (CASCADE)
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            bool: Success status
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM processes WHERE id = ?", (process_id,))
+
+        logger.info(f"Process {process_id} deleted")
+        return True
+
+    def search_processes(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Search processes by name, description, or tags
+
+        Args:
+            query: Search query
+
+        Returns:
+            List of matching processes
+        """
+        conn = self.connect()
+        search_pattern = f"%{query}%"
+
+        cursor = conn.execute("""
+            SELECT * FROM processes
+            WHERE (name LIKE ? OR description LIKE ? OR tags LIKE ?)
+                AND is_active = 1 AND is_archived = 0
+            ORDER BY use_count DESC, name ASC
+        """, (search_pattern, search_pattern, search_pattern))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_pinned_processes(self) -> List[Dict[str, Any]]:
+        """
+        Get all pinned processes
+
+        Returns:
+            List of pinned processes ordered by pinned_order
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT * FROM processes
+            WHERE is_pinned = 1 AND is_active = 1 AND is_archived = 0
+            ORDER BY pinned_order ASC
+        """)
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    # ==================== PROCESS STEPS (process_items) ====================
+
+    def add_process_step(self, process_id: int, item_id: int, step_order: int,
+                         custom_label: str = None, is_optional: bool = False,
+                         is_enabled: bool = True, wait_for_confirmation: bool = False,
+                         notes: str = None, group_name: str = None) -> int:
+        """
+        Add a step to a process
+
+        Args:
+            process_id: Process ID
+            item_id: Item ID
+            step_order: Order of this step in the process
+            custom_label: Custom label for this step
+            is_optional: Whether this step is optional
+            is_enabled: Whether this step is enabled
+            wait_for_confirmation: Whether to wait for user confirmation
+            notes: Additional notes for this step
+            group_name: Group name for organizing steps
+
+        Returns:
+            int: ID of created process_item
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO process_items (
+                    process_id, item_id, step_order, custom_label,
+                    is_optional, is_enabled, wait_for_confirmation,
+                    notes, group_name
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (process_id, item_id, step_order, custom_label,
+                  int(is_optional), int(is_enabled), int(wait_for_confirmation),
+                  notes, group_name))
+
+            step_id = cursor.lastrowid
+            logger.info(f"Step added to process {process_id}: item {item_id} at order {step_order}")
+            return step_id
+
+    def get_process_steps(self, process_id: int) -> List[Dict[str, Any]]:
+        """
+        Get all steps of a process with item details
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            List of steps with item information
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT
+                pi.*,
+                i.label as item_label,
+                i.content as item_content,
+                i.type as item_type,
+                i.icon as item_icon,
+                i.is_sensitive as item_is_sensitive
+            FROM process_items pi
+            JOIN items i ON pi.item_id = i.id
+            WHERE pi.process_id = ?
+            ORDER BY pi.step_order ASC
+        """, (process_id,))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    def update_process_step(self, step_id: int, **kwargs) -> bool:
+        """
+        Update a process step
+
+        Args:
+            step_id: Process step ID
+            **kwargs: Fields to update
+
+        Returns:
+            bool: Success status
+        """
+        if not kwargs:
+            return True
+
+        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
+        values = list(kwargs.values()) + [step_id]
+
+        with self.transaction() as conn:
+            conn.execute(f"""
+                UPDATE process_items SET {fields} WHERE id = ?
+            """, values)
+
+        logger.info(f"Process step {step_id} updated")
+        return True
+
+    def delete_process_step(self, step_id: int) -> bool:
+        """
+        Delete a process step
+
+        Args:
+            step_id: Process step ID
+
+        Returns:
+            bool: Success status
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM process_items WHERE id = ?", (step_id,))
+
+        logger.info(f"Process step {step_id} deleted")
+        return True
+
+    def delete_process_steps(self, process_id: int) -> bool:
+        """
+        Delete all steps for a process
+
+        Args:
+            process_id: Process ID
+
+        Returns:
+            bool: Success status
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("DELETE FROM process_items WHERE process_id = ?", (process_id,))
+            deleted_count = cursor.rowcount
+
+        logger.info(f"Deleted {deleted_count} steps for process {process_id}")
+        return True
+
+    def reorder_process_steps(self, process_id: int, step_ids_in_order: List[int]) -> bool:
+        """
+        Reorder steps of a process
+
+        Args:
+            process_id: Process ID
+            step_ids_in_order: List of step IDs in desired order
+
+        Returns:
+            bool: Success status
+        """
+        with self.transaction() as conn:
+            for new_order, step_id in enumerate(step_ids_in_order, start=1):
+                conn.execute("""
+                    UPDATE process_items
+                    SET step_order = ?
+                    WHERE id = ? AND process_id = ?
+                """, (new_order, step_id, process_id))
+
+        logger.info(f"Reordered {len(step_ids_in_order)} steps for process {process_id}")
+        return True
+
+    # ==================== PROCESS EXECUTION HISTORY ====================
+
+    def add_execution_history(self, process_id: int, total_steps: int) -> int:
+        """
+        Start tracking a process execution
+
+        Args:
+            process_id: Process ID
+            total_steps: Total number of steps
+
+        Returns:
+            int: Execution history ID
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute("""
+                INSERT INTO process_execution_history (
+                    process_id, total_steps, status
+                ) VALUES (?, ?, 'running')
+            """, (process_id, total_steps))
+
+            execution_id = cursor.lastrowid
+            logger.info(f"Started execution tracking for process {process_id} (ID: {execution_id})")
+            return execution_id
+
+    def update_execution_history(self, execution_id: int, **kwargs) -> bool:
+        """
+        Update execution history
+
+        Args:
+            execution_id: Execution history ID
+            **kwargs: Fields to update (status, completed_steps, failed_steps, error_message, etc.)
+
+        Returns:
+            bool: Success status
+        """
+        if not kwargs:
+            return True
+
+        # If status is being set to completed, set completed_at
+        if 'status' in kwargs and kwargs['status'] in ('completed', 'failed', 'cancelled'):
+            kwargs['completed_at'] = datetime.now().isoformat()
+
+        fields = ', '.join(f"{k} = ?" for k in kwargs.keys())
+        values = list(kwargs.values()) + [execution_id]
+
+        with self.transaction() as conn:
+            conn.execute(f"""
+                UPDATE process_execution_history SET {fields} WHERE id = ?
+            """, values)
+
+        return True
+
+    def get_process_execution_history(self, process_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get execution history for a process
+
+        Args:
+            process_id: Process ID
+            limit: Maximum number of records
+
+        Returns:
+            List of execution history records
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT * FROM process_execution_history
+            WHERE process_id = ?
+            ORDER BY started_at DESC
+            LIMIT ?
+        """, (process_id, limit))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    # ==================== Component Types Management ====================
+
+    def get_component_types(self, active_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get all component types from database
+
+        Args:
+            active_only: If True, return only active component types
+
+        Returns:
+            List of component type dictionaries
+        """
+        conn = self.connect()
+        query = "SELECT * FROM component_types"
+
+        if active_only:
+            query += " WHERE is_active = 1"
+
+        query += " ORDER BY name"
+
+        cursor = conn.execute(query)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_component_type_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific component type by name
+
+        Args:
+            name: Component type name
+
+        Returns:
+            Component type dictionary or None if not found
+        """
+        conn = self.connect()
+        cursor = conn.execute("""
+            SELECT * FROM component_types
+            WHERE name = ?
+        """, (name,))
+
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+    def add_component_type(
+        self,
+        name: str,
+        description: str,
+        default_config: str,
+        is_active: bool = True
+    ) -> Optional[int]:
+        """
+        Add a new component type to database
+
+        Args:
+            name: Component type name
+            description: Description of the component
+            default_config: Default configuration as JSON string
+            is_active: Whether the component is active
+
+        Returns:
+            ID of created component type, or None if failed
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO component_types (name, description, default_config, is_active)
+                    VALUES (?, ?, ?, ?)
+                """, (name, description, default_config, is_active))
+
+                return cursor.lastrowid
+
+        except sqlite3.IntegrityError as e:
+            logger.error(f"Component type '{name}' already exists: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error adding component type: {e}")
+            return None
+
+    def update_component_type(self, component_type_id: int, **kwargs) -> bool:
+        """
+        Update a component type in database
+
+        Args:
+            component_type_id: ID of component type to update
+            **kwargs: Fields to update (name, description, default_config, is_active)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not kwargs:
+            return False
+
+        try:
+            # Build UPDATE query dynamically
+            fields = []
+            values = []
+
+            for key, value in kwargs.items():
+                if key in ['name', 'description', 'default_config', 'is_active']:
+                    fields.append(f"{key} = ?")
+                    values.append(value)
+
+            if not fields:
+                return False
+
+            values.append(component_type_id)
+
+            with self.transaction() as conn:
+                conn.execute(f"""
+                    UPDATE component_types
+                    SET {', '.join(fields)}
+                    WHERE id = ?
+                """, values)
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error updating component type: {e}")
+            return False
+
+    def delete_component_type(self, component_type_id: int) -> bool:
+        """
+        Delete a component type from database
+
+        Args:
+            component_type_id: ID of component type to delete
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    DELETE FROM component_types
+                    WHERE id = ?
+                """, (component_type_id,))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error deleting component type: {e}")
+            return False
+
+    # ==================== Panel Settings (Dimensions & Position) ====================
+
+    def save_panel_settings(self, panel_name: str, width: int, height: int, x: int = None, y: int = None):
+        """
+        Save panel dimensions and position to database
+
+        Args:
+            panel_name: Unique identifier for the panel (e.g., 'floating_panel', 'global_search')
+            width: Panel width in pixels
+            height: Panel height in pixels
+            x: X position (optional)
+            y: Y position (optional)
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO panel_settings (panel_name, width, height, pos_x, pos_y, updated_at)
+                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(panel_name)
+                    DO UPDATE SET
+                        width = excluded.width,
+                        height = excluded.height,
+                        pos_x = COALESCE(excluded.pos_x, pos_x),
+                        pos_y = COALESCE(excluded.pos_y, pos_y),
+                        updated_at = CURRENT_TIMESTAMP
+                """, (panel_name, width, height, x, y))
+
+            logger.info(f"Panel settings saved: {panel_name} ({width}x{height})")
+        except Exception as e:
+            logger.error(f"Error saving panel settings: {e}")
+
+    def get_panel_settings(self, panel_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get panel dimensions and position from database
+
+        Args:
+            panel_name: Unique identifier for the panel
+
+        Returns:
+            Dictionary with panel settings or None if not found
+            Format: {'width': int, 'height': int, 'pos_x': int, 'pos_y': int}
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT width, height, pos_x, pos_y, updated_at
+                FROM panel_settings
+                WHERE panel_name = ?
+            """, (panel_name,))
+
+            row = cursor.fetchone()
+
+            if row:
+                return {
+                    'width': row['width'],
+                    'height': row['height'],
+                    'pos_x': row['pos_x'],
+                    'pos_y': row['pos_y'],
+                    'updated_at': row['updated_at']
+                }
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Error getting panel settings: {e}")
+            return None
+
+    def reset_panel_settings(self, panel_name: str):
+        """
+        Reset panel settings to defaults by removing from database
+
+        Args:
+            panel_name: Unique identifier for the panel
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("DELETE FROM panel_settings WHERE panel_name = ?", (panel_name,))
+
+            logger.info(f"Panel settings reset: {panel_name}")
+        except Exception as e:
+            logger.error(f"Error resetting panel settings: {e}")
+
+    # ==================== PROYECTOS ====================
+
+    def add_project(self, name: str, description: str = "", color: str = "#3498db",
+                    icon: str = "📁") -> int:
+        """
+        Crea un nuevo proyecto
+
+        Args:
+            name: Nombre del proyecto (único)
+            description: Descripción del proyecto
+            color: Color del proyecto en formato hex
+            icon: Emoji icono del proyecto
+
+        Returns:
+            ID del proyecto creado
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO proyectos (name, description, color, icon)
+                    VALUES (?, ?, ?, ?)
+                """, (name, description, color, icon))
+                project_id = cursor.lastrowid
+
+            logger.info(f"Proyecto creado: {name} (ID: {project_id})")
+            return project_id
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un proyecto con el nombre: {name}")
+            raise ValueError(f"Ya existe un proyecto con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error creando proyecto: {e}")
+            raise
+
+    def get_project(self, project_id: int) -> Optional[Dict]:
+        """
+        Obtiene un proyecto por su ID
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Diccionario con datos del proyecto o None si no existe
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, name, description, color, icon, is_active,
+                       created_at, updated_at
+                FROM proyectos
+                WHERE id = ?
+            """, (project_id,))
+
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+        except Exception as e:
+            logger.error(f"Error obteniendo proyecto {project_id}: {e}")
+            return None
+
+    def get_all_projects(self, active_only: bool = True) -> List[Dict]:
+        """
+        Obtiene todos los proyectos
+
+        Args:
+            active_only: Si True, solo retorna proyectos activos
+
+        Returns:
+            Lista de diccionarios con datos de proyectos
+        """
+        try:
+            conn = self.connect()
+            query = """
+                SELECT id, name, description, color, icon, is_active,
+                       created_at, updated_at
+                FROM proyectos
+            """
+
+            if active_only:
+                query += " WHERE is_active = 1"
+
+            query += " ORDER BY created_at DESC"
+
+            cursor = conn.execute(query)
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo proyectos: {e}")
+            return []
+
+    def update_project(self, project_id: int, **kwargs) -> bool:
+        """
+        Actualiza un proyecto
+
+        Args:
+            project_id: ID del proyecto
+            **kwargs: Campos a actualizar (name, description, color, icon, is_active)
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        allowed_fields = {'name', 'description', 'color', 'icon', 'is_active'}
+        update_fields = {k: v for k, v in kwargs.items() if k in allowed_fields}
+
+        if not update_fields:
+            logger.warning("No hay campos válidos para actualizar")
+            return False
+
+        try:
+            # Agregar campo updated_at
+            update_fields['updated_at'] = datetime.now().isoformat()
+
+            set_clause = ", ".join([f"{field} = ?" for field in update_fields.keys()])
+            values = list(update_fields.values()) + [project_id]
+
+            with self.transaction() as conn:
+                conn.execute(f"""
+                    UPDATE proyectos
+                    SET {set_clause}
+                    WHERE id = ?
+                """, values)
+
+            logger.info(f"Proyecto {project_id} actualizado")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando proyecto {project_id}: {e}")
+            return False
+
+    def delete_project(self, project_id: int) -> bool:
+        """
+        Elimina un proyecto y todas sus relaciones
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                # Las relaciones y componentes se eliminan automáticamente por CASCADE
+                conn.execute("DELETE FROM proyectos WHERE id = ?", (project_id,))
+
+            logger.info(f"Proyecto {project_id} eliminado")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error eliminando proyecto {project_id}: {e}")
+            return False
+
+    def toggle_project_active(self, project_id: int) -> bool:
+        """
+        Alterna el estado activo/inactivo de un proyecto
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Nuevo estado (True = activo, False = inactivo)
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT is_active FROM proyectos WHERE id = ?
+            """, (project_id,))
+
+            row = cursor.fetchone()
+            if not row:
+                return False
+
+            new_state = not bool(row['is_active'])
+
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE proyectos SET is_active = ?, updated_at = ?
+                    WHERE id = ?
+                """, (new_state, datetime.now().isoformat(), project_id))
+
+            logger.info(f"Proyecto {project_id} estado: {new_state}")
+            return new_state
+
+        except Exception as e:
+            logger.error(f"Error alternando estado del proyecto {project_id}: {e}")
+            return False
+
+    # ==================== PROJECT RELATIONS ====================
+
+    def add_project_relation(self, project_id: int, entity_type: str, entity_id: int,
+                            description: str = "", order_index: int = 0) -> int:
+        """
+        Agrega una relación entre proyecto y entidad
+
+        Args:
+            project_id: ID del proyecto
+            entity_type: Tipo de entidad ('tag', 'process', 'list', 'table', 'category', 'item')
+            entity_id: ID de la entidad
+            description: Descripción contextual del elemento en el proyecto
+            order_index: Índice de ordenamiento
+
+        Returns:
+            ID de la relación creada
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO project_relations
+                    (project_id, entity_type, entity_id, description, order_index)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (project_id, entity_type, entity_id, description, order_index))
+
+                relation_id = cursor.lastrowid
+
+            logger.info(f"Relación creada: {entity_type}#{entity_id} -> Proyecto#{project_id}")
+            return relation_id
+
+        except sqlite3.IntegrityError:
+            logger.error(f"La relación ya existe: {entity_type}#{entity_id} en proyecto {project_id}")
+            raise ValueError(f"El elemento ya está en el proyecto")
+        except Exception as e:
+            logger.error(f"Error creando relación: {e}")
+            raise
+
+    def remove_project_relation(self, relation_id: int) -> bool:
+        """
+        Elimina una relación por su ID
+
+        Args:
+            relation_id: ID de la relación
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("DELETE FROM project_relations WHERE id = ?", (relation_id,))
+
+            logger.info(f"Relación {relation_id} eliminada")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error eliminando relación {relation_id}: {e}")
+            return False
+
+    def remove_project_relation_by_entity(self, project_id: int, entity_type: str,
+                                         entity_id: int) -> bool:
+        """
+        Elimina una relación por proyecto y entidad
+
+        Args:
+            project_id: ID del proyecto
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    DELETE FROM project_relations
+                    WHERE project_id = ? AND entity_type = ? AND entity_id = ?
+                """, (project_id, entity_type, entity_id))
+
+            logger.info(f"Relación eliminada: {entity_type}#{entity_id} del proyecto {project_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error eliminando relación: {e}")
+            return False
+
+    def get_project_relations(self, project_id: int, entity_type: str = None) -> List[Dict]:
+        """
+        Obtiene las relaciones de un proyecto
+
+        Args:
+            project_id: ID del proyecto
+            entity_type: Si se especifica, filtra por tipo de entidad
+
+        Returns:
+            Lista de diccionarios con datos de las relaciones
+        """
+        try:
+            conn = self.connect()
+            query = """
+                SELECT id, project_id, entity_type, entity_id, description, order_index, created_at
+                FROM project_relations
+                WHERE project_id = ?
+            """
+            params = [project_id]
+
+            if entity_type:
+                query += " AND entity_type = ?"
+                params.append(entity_type)
+
+            query += " ORDER BY order_index ASC"
+
+            cursor = conn.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo relaciones del proyecto {project_id}: {e}")
+            return []
+
+    def get_projects_by_entity(self, entity_type: str, entity_id: int) -> List[Dict]:
+        """
+        Obtiene todos los proyectos que contienen una entidad específica
+
+        Args:
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            Lista de proyectos que contienen la entidad
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT p.* FROM proyectos p
+                INNER JOIN project_relations pr ON p.id = pr.project_id
+                WHERE pr.entity_type = ? AND pr.entity_id = ?
+                AND p.is_active = 1
+                ORDER BY p.name
+            """, (entity_type, entity_id))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo proyectos para {entity_type}#{entity_id}: {e}")
+            return []
+
+    def update_relation_description(self, relation_id: int, description: str) -> bool:
+        """
+        Actualiza la descripción de una relación
+
+        Args:
+            relation_id: ID de la relación
+            description: Nueva descripción
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE project_relations SET description = ?
+                    WHERE id = ?
+                """, (description, relation_id))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando descripción de relación {relation_id}: {e}")
+            return False
+
+    def update_project_relation_order(self, relation_id: int, new_order_index: int) -> bool:
+        """
+        Actualiza el orden de una relación de proyecto
+
+        Args:
+            relation_id: ID de la relación
+            new_order_index: Nuevo índice de orden
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE project_relations SET order_index = ?
+                    WHERE id = ?
+                """, (new_order_index, relation_id))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando orden de relación de proyecto {relation_id}: {e}")
+            return False
+
+    # ==================== PROJECT COMPONENTS ====================
+
+    def add_project_component(self, project_id: int, component_type: str,
+                             content: str = "", order_index: int = 0) -> int:
+        """
+        Agrega un componente estructural al proyecto
+
+        Args:
+            project_id: ID del proyecto
+            component_type: Tipo ('divider', 'comment', 'alert', 'note')
+            content: Contenido del componente
+            order_index: Índice de ordenamiento
+
+        Returns:
+            ID del componente creado
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO project_components
+                    (project_id, component_type, content, order_index)
+                    VALUES (?, ?, ?, ?)
+                """, (project_id, component_type, content, order_index))
+
+                component_id = cursor.lastrowid
+
+            logger.info(f"Componente {component_type} creado en proyecto {project_id}")
+            return component_id
+
+        except Exception as e:
+            logger.error(f"Error creando componente: {e}")
+            raise
+
+    def remove_project_component(self, component_id: int) -> bool:
+        """
+        Elimina un componente
+
+        Args:
+            component_id: ID del componente
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("DELETE FROM project_components WHERE id = ?", (component_id,))
+
+            logger.info(f"Componente {component_id} eliminado")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error eliminando componente {component_id}: {e}")
+            return False
+
+    def get_project_components(self, project_id: int) -> List[Dict]:
+        """
+        Obtiene todos los componentes de un proyecto
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Lista de componentes ordenados por order_index
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, project_id, component_type, content, order_index, created_at
+                FROM project_components
+                WHERE project_id = ?
+                ORDER BY order_index ASC
+            """, (project_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo componentes del proyecto {project_id}: {e}")
+            return []
+
+    def update_component_content(self, component_id: int, content: str) -> bool:
+        """
+        Actualiza el contenido de un componente
+
+        Args:
+            component_id: ID del componente
+            content: Nuevo contenido
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE project_components SET content = ?
+                    WHERE id = ?
+                """, (content, component_id))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando componente {component_id}: {e}")
+            return False
+
+    def update_project_component_order(self, component_id: int, new_order_index: int) -> bool:
+        """
+        Actualiza el orden de un componente de proyecto
+
+        Args:
+            component_id: ID del componente
+            new_order_index: Nuevo índice de orden
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    UPDATE project_components SET order_index = ?
+                    WHERE id = ?
+                """, (new_order_index, component_id))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando orden de componente de proyecto {component_id}: {e}")
+            return False
+
+    # ==================== QUERIES COMBINADAS ====================
+
+    def get_project_content_ordered(self, project_id: int) -> List[Dict]:
+        """
+        Obtiene TODOS los elementos del proyecto (relaciones + componentes)
+        ordenados por order_index, permitiendo intercalar ambos tipos
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Lista combinada de relaciones y componentes ordenados
+        """
+        try:
+            conn = self.connect()
+
+            # Obtener relaciones
+            cursor = conn.execute("""
+                SELECT 'relation' as type, id, project_id, entity_type, entity_id,
+                       description, order_index, created_at, NULL as component_type, NULL as content
+                FROM project_relations
+                WHERE project_id = ?
+            """, (project_id,))
+            relations = [dict(row) for row in cursor.fetchall()]
+
+            # Obtener componentes
+            cursor = conn.execute("""
+                SELECT 'component' as type, id, project_id, NULL as entity_type, NULL as entity_id,
+                       NULL as description, order_index, created_at, component_type, content
+                FROM project_components
+                WHERE project_id = ?
+            """, (project_id,))
+            components = [dict(row) for row in cursor.fetchall()]
+
+            # Combinar y ordenar
+            all_items = relations + components
+            # Manejar None en order_index (tratarlo como 0)
+            all_items.sort(key=lambda x: x['order_index'] if x['order_index'] is not None else 0)
+
+            return all_items
+
+        except Exception as e:
+            logger.error(f"Error obteniendo contenido del proyecto {project_id}: {e}")
+            return []
+
+    def reorder_project_content(self, reordered_items: List[tuple]) -> bool:
+        """
+        Actualiza order_index de múltiples elementos (relaciones y componentes)
+
+        Args:
+            reordered_items: Lista de tuplas (type, id, new_order)
+                            type: 'relation' o 'component'
+                            id: ID del elemento
+                            new_order: Nuevo order_index
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                for item_type, item_id, new_order in reordered_items:
+                    if item_type == 'relation':
+                        conn.execute("""
+                            UPDATE project_relations SET order_index = ?
+                            WHERE id = ?
+                        """, (new_order, item_id))
+                    elif item_type == 'component':
+                        conn.execute("""
+                            UPDATE project_components SET order_index = ?
+                            WHERE id = ?
+                        """, (new_order, item_id))
+
+            logger.info(f"Reordenados {len(reordered_items)} elementos")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error reordenando elementos: {e}")
+            return False
+
+    def get_project_content_with_filtered_order(self, project_id: int, filter_tag_id: int,
+                                               filtered_content: List[Dict]) -> List[Dict]:
+        """
+        Aplica el orden filtrado a una lista de contenido filtrado
+
+        Args:
+            project_id: ID del proyecto
+            filter_tag_id: Tag ID usado para filtrar
+            filtered_content: Lista de elementos ya filtrados
+
+        Returns:
+            Lista de elementos ordenados según orden filtrado
+        """
+        try:
+            # Obtener orden filtrado
+            filtered_orders = self.get_filtered_order(project_id, filter_tag_id)
+
+            if not filtered_orders:
+                # Si no hay orden personalizado, devolver contenido en orden original
+                return filtered_content
+
+            # Crear lista ordenada
+            ordered_content = []
+            unordered_content = []
+
+            for item in filtered_content:
+                element_type = 'relation' if item.get('entity_type') else 'component'
+                element_id = item['id']
+                key = (element_type, element_id)
+
+                if key in filtered_orders:
+                    ordered_content.append((filtered_orders[key], item))
+                else:
+                    # Elementos sin orden personalizado van al final
+                    unordered_content.append(item)
+
+            # Ordenar por order_index
+            ordered_content.sort(key=lambda x: x[0])
+            result = [item for _, item in ordered_content] + unordered_content
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error aplicando orden filtrado: {e}")
+            return filtered_content
+
+    def get_project_summary(self, project_id: int) -> Dict[str, int]:
+        """
+        Obtiene resumen estadístico del proyecto (conteo por tipo)
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Diccionario con conteo de cada tipo de entidad y componentes
+        """
+        try:
+            conn = self.connect()
+
+            summary = {
+                'tags': 0,
+                'processes': 0,
+                'lists': 0,
+                'tables': 0,
+                'categories': 0,
+                'items': 0,
+                'components': 0,
+                'total': 0
+            }
+
+            # Contar relaciones por tipo
+            cursor = conn.execute("""
+                SELECT entity_type, COUNT(*) as count
+                FROM project_relations
+                WHERE project_id = ?
+                GROUP BY entity_type
+            """, (project_id,))
+
+            for row in cursor.fetchall():
+                entity_type = row['entity_type']
+                count = row['count']
+                summary[entity_type + 's'] = count  # 'tag' -> 'tags'
+
+            # Contar componentes
+            cursor = conn.execute("""
+                SELECT COUNT(*) as count
+                FROM project_components
+                WHERE project_id = ?
+            """, (project_id,))
+
+            row = cursor.fetchone()
+            if row:
+                summary['components'] = row['count']
+
+            # Calcular total
+            summary['total'] = sum([v for k, v in summary.items() if k != 'total'])
+
+            return summary
+
+        except Exception as e:
+            logger.error(f"Error obteniendo resumen del proyecto {project_id}: {e}")
+            return {}
+
+    def search_projects(self, query: str) -> List[Dict]:
+        """
+        Busca proyectos por nombre o descripción
+
+        Args:
+            query: Texto a buscar
+
+        Returns:
+            Lista de proyectos que coinciden con la búsqueda
+        """
+        try:
+            conn = self.connect()
+            search_term = f"%{query}%"
+
+            cursor = conn.execute("""
+                SELECT id, name, description, color, icon, is_active, created_at, updated_at
+                FROM proyectos
+                WHERE (name LIKE ? OR description LIKE ?)
+                AND is_active = 1
+                ORDER BY name
+            """, (search_term, search_term))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error buscando proyectos: {e}")
+            return []
+
+    def get_entity_content_for_clipboard(self, entity_type: str, entity_id: int) -> str:
+        """
+        Obtiene el contenido de una entidad para copiar al portapapeles
+
+        Args:
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            Contenido de la entidad como string
+        """
+        try:
+            conn = self.connect()
+
+            if entity_type == 'item':
+                cursor = conn.execute("SELECT content FROM items WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['content'] if row else ""
+
+            elif entity_type == 'tag':
+                cursor = conn.execute("SELECT name FROM item_tags WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['name'] if row else ""
+
+            elif entity_type == 'list':
+                cursor = conn.execute("SELECT name FROM listas WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['name'] if row else ""
+
+            elif entity_type == 'process':
+                cursor = conn.execute("SELECT name FROM processes WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['name'] if row else ""
+
+            elif entity_type == 'table':
+                cursor = conn.execute("SELECT name FROM tables WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['name'] if row else ""
+
+            elif entity_type == 'category':
+                cursor = conn.execute("SELECT name FROM categories WHERE id = ?", (entity_id,))
+                row = cursor.fetchone()
+                return row['name'] if row else ""
+
+            return ""
+
+        except Exception as e:
+            logger.error(f"Error obteniendo contenido de {entity_type}#{entity_id}: {e}")
+            return ""
+
+    # ==================== PROJECT ELEMENT TAGS ====================
+
+    def add_project_element_tag(self, name: str, color: str = "#3498db",
+                                 description: str = "") -> int:
+        """
+        Crea un nuevo tag para elementos de proyecto
+
+        Args:
+            name: Nombre del tag (único)
+            color: Color en formato hex (default: #3498db)
+            description: Descripción del tag
+
+        Returns:
+            ID del tag creado
+
+        Raises:
+            ValueError: Si ya existe un tag con ese nombre
+        """
+        try:
+            with self.transaction() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO project_element_tags (name, color, description)
+                    VALUES (?, ?, ?)
+                """, (name, color, description))
+                tag_id = cursor.lastrowid
+
+            logger.info(f"Project element tag creado: {name} (ID: {tag_id})")
+            return tag_id
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error creando project element tag: {e}")
+            raise
+
+    def create_project_element_tag(self, name: str, color: str = "#3498db",
+                                   description: str = "") -> Optional[Dict]:
+        """
+        Crea un tag de elemento de proyecto y retorna la fila creada
+
+        Usa INSERT ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace INSERT + SELECT.
+
+        Args:
+            name: Nombre del tag (único)
+            color: Color en formato hex
+            description: Descripción del tag
+
+        Returns:
+            Optional[Dict]: Datos del tag creado
+
+        Raises:
+            ValueError: Si ya existe un tag con ese nombre
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            tag_id = self.add_project_element_tag(name, color, description)
+            return self.get_project_element_tag_by_id(tag_id)
+
+        try:
+            with self.transaction() as conn:
+                row = conn.execute("""
+                    INSERT INTO project_element_tags (name, color, description)
+                    VALUES (?, ?, ?)
+                    RETURNING *
+                """, (name, color, description)).fetchone()
+
+            logger.info(f"Project element tag creado: {name} (ID: {row['id']})")
+            return dict(row)
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error creando project element tag: {e}")
+            raise
+
+    def get_all_project_element_tags(self) -> List[Dict]:
+        """
+        Obtiene todos los tags de elementos de proyecto
+
+        Returns:
+            Lista de diccionarios con datos de tags
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, name, color, description, created_at, updated_at
+                FROM project_element_tags
+                ORDER BY name ASC
+            """)
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo project element tags: {e}")
+            return []
+
+    def iter_project_element_tags_tuples(self, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Recorre todos los tags de elementos de proyecto como tuplas
+
+        Pensado para cargas masivas: no construye un dict por fila y lee
+        por lotes con fetchmany.
+
+        Args:
+            batch_size: Filas por lote
+
+        Yields:
+            Tuplas (id, name, color, description, created_at, updated_at)
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.row_factory = None  # Tuplas simples en lugar de sqlite3.Row
+        cursor.arraysize = batch_size
+        cursor.execute("""
+            SELECT id, name, color, description, created_at, updated_at
+            FROM project_element_tags
+            ORDER BY name ASC
+        """)
+
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
+    def get_tags_for_project(self, project_id: int) -> List[Dict]:
+        """
+        Obtiene todos los tags asociados a un proyecto específico
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Lista de diccionarios con datos de tags ordenados por order_index
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT t.id, t.name, t.color, t.description,
+                       t.created_at, t.updated_at, o.order_index
+                FROM project_element_tags t
+                INNER JOIN project_tag_orders o ON t.id = o.tag_id
+                WHERE o.project_id = ?
+                ORDER BY o.order_index ASC, t.name ASC
+            """, (project_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags del proyecto {project_id}: {e}")
+            return []
+
+    def get_project_element_tag_by_id(self, tag_id: int) -> Optional[Dict]:
+        """
+        Obtiene un tag específico por su ID
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Diccionario con datos del tag o None si no existe
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, name, color, description, created_at, updated_at
+                FROM project_element_tags
+                WHERE id = ?
+            """, (tag_id,))
+
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tag {tag_id}: {e}")
+            return None
+
+    def get_project_element_tag_by_name(self, name: str) -> Optional[Dict]:
+        """
+        Obtiene un tag específico por su nombre
+
+        Args:
+            name: Nombre del tag
+
+        Returns:
+            Diccionario con datos del tag o None si no existe
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, name, color, description, created_at, updated_at
+                FROM project_element_tags
+                WHERE name = ?
+            """, (name,))
+
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tag por nombre '{name}': {e}")
+            return None
+
+    def update_project_element_tag(self, tag_id: int, name: str = None,
+                                    color: str = None, description: str = None) -> bool:
+        """
+        Actualiza un tag de elemento de proyecto
+
+        Args:
+            tag_id: ID del tag
+            name: Nuevo nombre (opcional)
+            color: Nuevo color (opcional)
+            description: Nueva descripción (opcional)
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        update_fields = {}
+        if name is not None:
+            update_fields['name'] = name
+        if color is not None:
+            update_fields['color'] = color
+        if description is not None:
+            update_fields['description'] = description
+
+        if not update_fields:
+            logger.warning("No hay campos válidos para actualizar")
+            return False
+
+        try:
+            # Agregar campo updated_at
+            update_fields['updated_at'] = datetime.now().isoformat()
+
+            set_clause = ", ".join([f"{field} = ?" for field in update_fields.keys()])
+            values = list(update_fields.values()) + [tag_id]
+
+            with self.transaction() as conn:
+                conn.execute(f"""
+                    UPDATE project_element_tags
+                    SET {set_clause}
+                    WHERE id = ?
+                """, values)
+
+            logger.info(f"Tag {tag_id} actualizado")
+            return True
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error actualizando tag {tag_id}: {e}")
+            return False
+
+    def update_project_element_tag_returning(self, tag_id: int, name: str = None,
+                                             color: str = None,
+                                             description: str = None) -> Optional[Dict]:
+        """
+        Actualiza un tag de elemento de proyecto y retorna la fila actualizada
+
+        Usa UPDATE ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace UPDATE + SELECT.
+
+        Args:
+            tag_id: ID del tag
+            name: Nuevo nombre (opcional)
+            color: Nuevo color (opcional)
+            description: Nueva descripción (opcional)
+
+        Returns:
+            Optional[Dict]: Datos del tag actualizado, o None si no se actualizó
+
+        Raises:
+            ValueError: Si ya existe un tag con ese nombre
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            if not self.update_project_element_tag(tag_id, name, color, description):
+                return None
+            return self.get_project_element_tag_by_id(tag_id)
+
+        update_fields = {}
+        if name is not None:
+            update_fields['name'] = name
+        if color is not None:
+            update_fields['color'] = color
+        if description is not None:
+            update_fields['description'] = description
+
+        if not update_fields:
+            logger.warning("No hay campos válidos para actualizar")
+            return None
+
+        try:
+            update_fields['updated_at'] = datetime.now().isoformat()
+
+            set_clause = ", ".join([f"{field} = ?" for field in update_fields.keys()])
+            values = list(update_fields.values()) + [tag_id]
+
+            with self.transaction() as conn:
+                row = conn.execute(f"""
+                    UPDATE project_element_tags
+                    SET {set_clause}
+                    WHERE id = ?
+                    RETURNING *
+                """, values).fetchone()
+
+            if row is None:
+                return None
+
+            logger.info(f"Tag {tag_id} actualizado")
+            return dict(row)
+
+        except sqlite3.IntegrityError:
+            logger.error(f"Ya existe un tag con el nombre: {name}")
+            raise ValueError(f"Ya existe un tag con el nombre '{name}'")
+        except Exception as e:
+            logger.error(f"Error actualizando tag {tag_id}: {e}")
+            return None
+
+    def delete_project_element_tag(self, tag_id: int) -> bool:
+        """
+        Elimina un tag de elemento de proyecto y todas sus asociaciones
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                # Las asociaciones se eliminan automáticamente por CASCADE
+                conn.execute("DELETE FROM project_element_tags WHERE id = ?", (tag_id,))
+
+            logger.info(f"Tag {tag_id} eliminado")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error eliminando tag {tag_id}: {e}")
+            return False
+
+    def search_project_element_tags(self, query: str) -> List[Dict]:
+        """
+        Busca tags por nombre (coincidencia parcial)
+
+        Args:
+            query: Texto a buscar
+
+        Returns:
+            Lista de tags que coinciden con la búsqueda
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT id, name, color, description, created_at, updated_at
+                FROM project_element_tags
+                WHERE name LIKE ?
+                ORDER BY name ASC
+            """, (f"%{query}%",))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error buscando tags con query '{query}': {e}")
+            return []
+
+    def add_project_element_tags_bulk(self, rows: List[tuple]) -> Dict[str, int]:
+        """
+        Crea múltiples tags de elementos de proyecto en una sola transacción
+
+        Los nombres que ya existen en la BD (o repetidos dentro del lote)
+        se ignoran y no aparecen en el resultado.
+
+        Args:
+            rows: Lista de tuplas (name, color, description)
+
+        Returns:
+            Mapeo nombre -> ID de los tags creados
+        """
+        if not rows:
+            return {}
+
+        names = list(dict.fromkeys(row[0] for row in rows))
+
+        with self.transaction() as conn:
+            existing = set()
+            for chunk, placeholders in _in_chunks(names):
+                existing.update(
+                    row['name'] for row in conn.execute(
+                        f"SELECT name FROM project_element_tags WHERE name IN ({placeholders})",
+                        chunk
+                    )
+                )
+
+            new_rows = [row for row in rows if row[0] not in existing]
+            conn.executemany("""
+                INSERT OR IGNORE INTO project_element_tags (name, color, description)
+                VALUES (?, ?, ?)
+            """, new_rows)
+
+            new_names = list(dict.fromkeys(row[0] for row in new_rows))
+            created = {}
+            for chunk, placeholders in _in_chunks(new_names):
+                for row in conn.execute(
+                    f"SELECT id, name FROM project_element_tags WHERE name IN ({placeholders})",
+                    chunk
+                ):
+                    created[row['name']] = row['id']
+            return created
+
+    def get_project_element_tags_by_ids(self, tag_ids: List[int]) -> List[Dict]:
+        """
+        Obtiene varios tags de elementos de proyecto por ID en una sola consulta
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            Lista de diccionarios con datos de tags
+        """
+        if not tag_ids:
+            return []
+
+        try:
+            conn = self.connect()
+            tags = []
+            for chunk, placeholders in _in_chunks(tag_ids):
+                cursor = conn.execute(f"""
+                    SELECT id, name, color, description, created_at, updated_at
+                    FROM project_element_tags
+                    WHERE id IN ({placeholders})
+                """, chunk)
+                tags.extend(dict(row) for row in cursor.fetchall())
+
+            return tags
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags por IDs: {e}")
+            return []
+
+    def delete_project_element_tags_bulk(self, tag_ids: List[int]) -> List[int]:
+        """
+        Elimina múltiples tags de elementos de proyecto en una sola transacción
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            IDs de los tags eliminados (vacía si no existía ninguno o si hubo un error)
+        """
+        if not tag_ids:
+            return []
+
+        try:
+            # Las asociaciones se eliminan automáticamente por CASCADE
+            deleted_ids = self._delete_ids_returning("project_element_tags", tag_ids)
+            logger.info(f"{len(deleted_ids)} tags eliminados en lote")
+            return deleted_ids
+
+        except Exception as e:
+            logger.error(f"Error eliminando tags en lote: {e}")
+            return []
+
+    # ==================== PROJECT ELEMENT TAG ASSOCIATIONS ====================
+
+    def add_tag_to_project_relation(self, relation_id: int, tag_id: int) -> bool:
+        """
+        Asocia un tag a una relación de proyecto
+
+        Args:
+            relation_id: ID de la relación de proyecto
+            tag_id: ID del tag
+
+        Returns:
+            True si se asoció correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    INSERT OR IGNORE INTO project_element_tag_associations
+                    (project_relation_id, tag_id)
+                    VALUES (?, ?)
+                """, (relation_id, tag_id))
+
+            logger.info(f"Tag {tag_id} asociado a relación {relation_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error asociando tag {tag_id} a relación {relation_id}: {e}")
+            return False
+
+    def remove_tag_from_project_relation(self, relation_id: int, tag_id: int) -> bool:
+        """
+        Remueve un tag de una relación de proyecto
+
+        Args:
+            relation_id: ID de la relación de proyecto
+            tag_id: ID del tag
+
+        Returns:
+            True si se removió correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    DELETE FROM project_element_tag_associations
+                    WHERE project_relation_id = ? AND tag_id = ?
+                """, (relation_id, tag_id))
+
+            logger.info(f"Tag {tag_id} removido de relación {relation_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error removiendo tag {tag_id} de relación {relation_id}: {e}")
+            return False
+
+    def get_tags_for_project_relation(self, relation_id: int) -> List[Dict]:
+        """
+        Obtiene todos los tags de una relación de proyecto
+
+        Args:
+            relation_id: ID de la relación de proyecto
+
+        Returns:
+            Lista de tags asociados a la relación
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT t.id, t.name, t.color, t.description,
+                       t.created_at, t.updated_at, a.created_at as associated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                WHERE a.project_relation_id = ?
+                ORDER BY t.name ASC
+            """, (relation_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags de relación {relation_id}: {e}")
+            return []
+
+    def get_project_relations_by_tag(self, tag_id: int) -> List[Dict]:
+        """
+        Obtiene todas las relaciones de proyecto que tienen un tag específico
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Lista de relaciones que tienen ese tag
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT pr.id, pr.project_id, pr.entity_type, pr.entity_id,
+                       pr.description, pr.order_index, pr.created_at
+                FROM project_relations pr
+                INNER JOIN project_element_tag_associations a ON pr.id = a.project_relation_id
+                WHERE a.tag_id = ?
+                ORDER BY pr.order_index ASC
+            """, (tag_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo relaciones con tag {tag_id}: {e}")
+            return []
+
+    def get_project_relation_ids_by_tag(self, tag_id: int) -> List[int]:
+        """
+        Obtiene solo los IDs de las relaciones de proyecto que tienen un tag
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Lista de IDs de relaciones ordenados por order_index
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT pr.id
+                FROM project_relations pr
+                INNER JOIN project_element_tag_associations a ON pr.id = a.project_relation_id
+                WHERE a.tag_id = ?
+                ORDER BY pr.order_index ASC
+            """, (tag_id,))
+
+            return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo IDs de relaciones con tag {tag_id}: {e}")
+            return []
+
+    def get_lists_by_project_tag(self, project_id: int, tag_id: int) -> List[Dict]:
+        """
+        Obtiene todas las listas de un proyecto que tienen un tag específico
+
+        Args:
+            project_id: ID del proyecto
+            tag_id: ID del tag
+
+        Returns:
+            Lista de diccionarios con información de listas (id, name, description)
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT DISTINCT l.id, l.name, l.description, l.created_at
+                FROM listas l
+                INNER JOIN project_relations pr ON l.id = pr.entity_id
+                INNER JOIN project_element_tag_associations a ON pr.id = a.project_relation_id
+                WHERE pr.project_id = ?
+                  AND pr.entity_type = 'list'
+                  AND a.tag_id = ?
+                ORDER BY l.name ASC
+            """, (project_id, tag_id))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo listas del proyecto {project_id} con tag {tag_id}: {e}")
+            return []
+
+    def update_project_relation_tags(self, relation_id: int, tag_ids: List[int]) -> bool:
+        """
+        Actualiza todos los tags de una relación de proyecto
+        (reemplaza los tags existentes)
+
+        Args:
+            relation_id: ID de la relación de proyecto
+            tag_ids: Lista de IDs de tags a asociar
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                # Eliminar todas las asociaciones existentes
+                conn.execute("""
+                    DELETE FROM project_element_tag_associations
+                    WHERE project_relation_id = ?
+                """, (relation_id,))
+
+                # Agregar las nuevas asociaciones
+                for tag_id in tag_ids:
+                    conn.execute("""
+                        INSERT INTO project_element_tag_associations
+                        (project_relation_id, tag_id)
+                        VALUES (?, ?)
+                    """, (relation_id, tag_id))
+
+            logger.info(f"Tags actualizados para relación {relation_id}: {len(tag_ids)} tags")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando tags de relación {relation_id}: {e}")
+            return False
+
+    def get_tag_usage_count(self, tag_id: int) -> int:
+        """
+        Cuenta cuántas relaciones de proyecto usan un tag específico
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Número de relaciones que usan el tag
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT COUNT(*) as count
+                FROM project_element_tag_associations
+                WHERE tag_id = ?
+            """, (tag_id,))
+
+            row = cursor.fetchone()
+            return row['count'] if row else 0
+
+        except Exception as e:
+            logger.error(f"Error contando uso del tag {tag_id}: {e}")
+            return 0
+
+    def get_project_element_tag_usage_counts(self) -> Dict[int, int]:
+        """
+        Cuenta las asociaciones de todos los tags de elementos de proyecto
+        en una sola consulta
+
+        Returns:
+            Mapeo tag_id -> número de asociaciones (solo tags en uso)
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT tag_id, COUNT(*)
+                FROM project_element_tag_associations
+                GROUP BY tag_id
+            """)
+
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            logger.error(f"Error contando uso de tags: {e}")
+            return {}
+
+    def get_popular_project_element_tags(self, limit: int = 10) -> List[Dict]:
+        """
+        Obtiene los tags más usados con su conteo de uso
+
+        Args:
+            limit: Número máximo de tags a retornar
+
+        Returns:
+            Lista de tags ordenados por uso (más usados primero)
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT
+                    t.id, t.name, t.color, t.description,
+                    t.created_at, t.updated_at,
+                    COUNT(a.id) as usage_count
+                FROM project_element_tags t
+                LEFT JOIN project_element_tag_associations a ON t.id = a.tag_id
+                GROUP BY t.id
+                ORDER BY usage_count DESC, t.name ASC
+                LIMIT ?
+            """, (limit,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags populares: {e}")
+            return []
+
+    # ==================== Project Component Tags ====================
+
+    def add_tag_to_project_component(self, component_id: int, tag_id: int) -> bool:
+        """
+        Asocia un tag a un componente de proyecto
+
+        Args:
+            component_id: ID del componente de proyecto
+            tag_id: ID del tag
+
+        Returns:
+            True si se asoció correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    INSERT INTO project_element_tag_associations
+                        (project_component_id, tag_id)
+                    VALUES (?, ?)
+                """, (component_id, tag_id))
+                return True
+
+        except Exception as e:
+            logger.error(f"Error asociando tag {tag_id} a componente {component_id}: {e}")
+            return False
+
+    def remove_tag_from_project_component(self, component_id: int, tag_id: int) -> bool:
+        """
+        Remueve un tag de un componente de proyecto
+
+        Args:
+            component_id: ID del componente de proyecto
+            tag_id: ID del tag
+
+        Returns:
+            True si se removió correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute("""
+                    DELETE FROM project_element_tag_associations
+                    WHERE project_component_id = ? AND tag_id = ?
+                """, (component_id, tag_id))
+                return True
+
+        except Exception as e:
+            logger.error(f"Error removiendo tag {tag_id} de componente {component_id}: {e}")
+            return False
+
+    def get_tags_for_project_component(self, component_id: int) -> List[Dict]:
+        """
+        Obtiene todos los tags de un componente de proyecto
+
+        Args:
+            component_id: ID del componente de proyecto
+
+        Returns:
+            Lista de tags asociados al componente
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT t.id, t.name, t.color, t.description, t.created_at, t.updated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                WHERE a.project_component_id = ?
+                ORDER BY t.name ASC
+            """, (component_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags para componente {component_id}: {e}")
+            return []
+
+    def get_distinct_tags_for_project(self, project_id: int) -> List[Dict]:
+        """
+        Obtiene los tags únicos usados en un proyecto (relaciones y componentes)
+        en una sola consulta
+
+        Args:
+            project_id: ID del proyecto
+
+        Returns:
+            Lista de tags únicos ordenados por nombre
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT t.id, t.name, t.color, t.description, t.created_at, t.updated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                INNER JOIN project_relations r ON a.project_relation_id = r.id
+                WHERE r.project_id = ?
+                UNION
+                SELECT t.id, t.name, t.color, t.description, t.created_at, t.updated_at
+                FROM project_element_tags t
+                INNER JOIN project_element_tag_associations a ON t.id = a.tag_id
+                INNER JOIN project_components c ON a.project_component_id = c.id
+                WHERE c.project_id = ?
+                ORDER BY name ASC
+            """, (project_id, project_id))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo tags únicos del proyecto {project_id}: {e}")
+            return []
+
+    def get_project_components_by_tag(self, tag_id: int) -> List[Dict]:
+        """
+        Obtiene todos los componentes que tienen un tag específico
+
+        Args:
+            tag_id: ID del tag
+
+        Returns:
+            Lista de componentes que tienen ese tag
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.execute("""
+                SELECT pc.id, pc.project_id, pc.component_type, pc.content,
+                       pc.order_index, pc.created_at
+                FROM project_components pc
+                INNER JOIN project_element_tag_associations a ON pc.id = a.project_component_id
+                WHERE a.tag_id = ?
+                ORDER BY pc.order_index ASC
+            """, (tag_id,))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Error obteniendo componentes con tag {tag_id}: {e}")
+            return []
+
+    def update_project_component_tags(self, component_id: int, tag_ids: List[int]) -> bool:
+        """
+        Actualiza todos los tags de un componente de proyecto
+        (reemplaza los tags existentes)
+
+        Args:
+            component_id: ID del componente de proyecto
+            tag_ids: Lista de IDs de tags a asociar
+
+        Returns:
+            True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                # Eliminar todas las asociaciones existentes
+                conn.execute("""
+                    DELETE FROM project_element_tag_associations
+                    WHERE project_component_id = ?
+                """, (component_id,))
+
+                # Agregar las nuevas asociaciones
+                for tag_id in tag_ids:
+                    conn.execute("""
+                        INSERT INTO project_element_tag_associations
+                            (project_component_id, tag_id)
+                        VALUES (?, ?)
+                    """, (component_id, tag_id))
+
+                return True
+
+        except Exception as e:
+            logger.error(f"Error actualizando tags de componente {component_id}: {e}")
+            return False
+
+    # ==================== GESTIÓN DE ÁREAS ====================
+
+    def add_area(self, name: str, description: str = "",
+                  color: str = "#9b59b6", icon: str = "🏢") -> int:
+        """
+        Agrega una nueva área
+
+        Args:
+            name: Nombre del área
+            description: Descripción del área
+            color: Color en formato hex
+            icon: Emoji icono
+
+        Returns:
+            int: ID del área creada
+        """
+        query = """
+            INSERT INTO areas (name, description, color, icon)
+            VALUES (?, ?, ?, ?)
+        """
+        return self.execute_update(query, (name, description, color, icon))
+
+    def get_area(self, area_id: int) -> Optional[Dict]:
+        """
+        Obtiene un área por ID
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            Optional[Dict]: Diccionario con datos del área o None
+        """
+        query = "SELECT * FROM areas WHERE id = ?"
+        result = self.execute_query(query, (area_id,))
+        return result[0] if result else None
+
+    def get_all_areas(self, active_only: bool = True) -> List[Dict]:
+        """
+        Obtiene todas las áreas
+
+        Args:
+            active_only: Si True, solo retorna áreas activas
+
+        Returns:
+            List[Dict]: Lista de áreas
+        """
+        if active_only:
+            query = "SELECT * FROM areas WHERE is_active = 1 ORDER BY name"
+        else:
+            query = "SELECT * FROM areas ORDER BY name"
+
+        return self.execute_query(query)
+
+    def area_name_exists(self, name: str, exclude_id: int = None) -> bool:
+        """
+        Verifica si existe un área con el nombre dado (sin distinguir mayúsculas,
+        incluidas las acentuadas: "Área" y "área" se consideran iguales)
+
+        Args:
+            name: Nombre a buscar
+            exclude_id: ID de un área a ignorar (p. ej. la que se está editando)
+
+        Returns:
+            bool: True si ya existe otra área con ese nombre
+        """
+        query = """
+            SELECT 1 FROM areas
+            WHERE casefold(name) = casefold(?) AND (? IS NULL OR id <> ?)
+            LIMIT 1
+        """
+        return bool(self.execute_query(query, (name, exclude_id, exclude_id)))
+
+    def update_area(self, area_id: int, **kwargs) -> bool:
+        """
+        Actualiza un área
+
+        Args:
+            area_id: ID del área
+            **kwargs: Campos a actualizar (name, description, color, icon, is_active)
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        allowed_fields = ['name', 'description', 'color', 'icon', 'is_active']
+        updates = []
+        values = []
+
+        for key, value in kwargs.items():
+            if key in allowed_fields:
+                updates.append(f"{key} = ?")
+                values.append(value)
+
+        if not updates:
+            return False
+
+        updates.append("updated_at = CURRENT_TIMESTAMP")
+        values.append(area_id)
+
+        query = f"UPDATE areas SET {', '.join(updates)} WHERE id = ?"
+
+        try:
+            self.execute_update(query, tuple(values))
+            return True
+        except Exception as e:
+            logger.error(f"Error actualizando área {area_id}: {e}")
+            return False
+
+    def delete_area(self, area_id: int) -> bool:
+        """
+        Elimina un área (soft delete)
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = "UPDATE areas SET is_active = 0 WHERE id = ?"
+        try:
+            self.execute_update(query, (area_id,))
+            return True
+        except Exception as e:
+            logger.error(f"Error eliminando área {area_id}: {e}")
+            return False
+
+    def purge_area(self, area_id: int) -> bool:
+        """
+        Elimina un área definitivamente (sus relaciones y componentes se
+        eliminan por CASCADE)
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            bool: True si se eliminó correctamente
+        """
+        query = "DELETE FROM areas WHERE id = ?"
+        try:
+            self.execute_update(query, (area_id,))
+            return True
+        except Exception as e:
+            logger.error(f"Error eliminando área {area_id}: {e}")
+            return False
+
+    def search_areas(self, query_text: str) -> List[Dict]:
+        """
+        Busca áreas por nombre o descripción
+
+        Args:
+            query_text: Texto a buscar
+
+        Returns:
+            List[Dict]: Lista de áreas que coinciden
+        """
+        query = """
+            SELECT * FROM areas
+            WHERE (name LIKE ? OR description LIKE ?)
+            AND is_active = 1
+            ORDER BY name
+        """
+        search_pattern = f"%{query_text}%"
+        return self.execute_query(query, (search_pattern, search_pattern))
+
+    def get_area_summary(self, area_id: int) -> Dict:
+        """
+        Obtiene resumen de un área con estadísticas
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            Dict: Resumen con cantidades de relaciones y componentes
+        """
+        area = self.get_area(area_id)
+        if not area:
+            return {}
+
+        # Contar relaciones
+        relations_query = "SELECT COUNT(*) as count FROM area_relations WHERE area_id = ?"
+        relations_count = self.execute_query(relations_query, (area_id,))[0]['count']
+
+        # Contar componentes
+        components_query = "SELECT COUNT(*) as count FROM area_components WHERE area_id = ?"
+        components_count = self.execute_query(components_query, (area_id,))[0]['count']
+
+        area['relations_count'] = relations_count
+        area['components_count'] = components_count
+        area['total_elements'] = relations_count + components_count
+
+        return area
+
+    # ==================== ITEMS DE ÁREAS (Para Paneles Flotantes) ====================
+
+    def get_items_by_area(self, area_id: int) -> List[Dict]:
+        """
+        Obtiene todos los items de categorías relacionadas con un área
+
+        Este método obtiene items de dos formas:
+        1. Items de categorías asociadas al área (entity_type='category')
+        2. Items directamente asociados al área (entity_type='item')
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            List[Dict]: Lista de items (con duplicados removidos si un item está en ambas formas)
+        """
+        query = """
+            SELECT DISTINCT i.*
+            FROM items i
+            WHERE i.id IN (
+                -- Items a través de categorías
+                SELECT i2.id
+                FROM items i2
+                INNER JOIN area_relations ar ON ar.entity_id = i2.category_id
+                WHERE ar.area_id = ? AND ar.entity_type = 'category'
+
+                UNION
+
+                -- Items directamente asociados al área
+                SELECT ar2.entity_id
+                FROM area_relations ar2
+                WHERE ar2.area_id = ? AND ar2.entity_type = 'item'
+            )
+            ORDER BY i.label ASC
+        """
+        return self.execute_query(query, (area_id, area_id))
+
+    def get_items_by_area_tag(self, tag_id: int, area_id: int = None) -> List[Dict]:
+        """
+        Obtiene items relacionados con un tag de área
+
+        Busca items que están en:
+        1. Relaciones de área que tienen ese tag
+        2. Opcionalmente filtrado por un área específica
+
+        Args:
+            tag_id: ID del tag de área
+            area_id: ID del área (opcional, para filtrar por área específica)
+
+        Returns:
+            List[Dict]: Lista de items
+        """
+        if area_id is not None:
+            # Filtrar por área específica
+            query = """
+                SELECT DISTINCT i.*
+                FROM items i
+                WHERE i.id IN (
+                    -- Items a través de categorías con el tag
+                    SELECT i2.id
+                    FROM items i2
+                    INNER JOIN area_relations ar ON ar.entity_id = i2.category_id
+                    INNER JOIN area_element_tag_associations aeta ON aeta.area_relation_id = ar.id
+                    WHERE aeta.tag_id = ?
+                      AND ar.entity_type = 'category'
+                      AND ar.area_id = ?
+
+                    UNION
+
+                    -- Items directamente asociados con el tag
+                    SELECT ar2.entity_id
+                    FROM area_relations ar2
+                    INNER JOIN area_element_tag_associations aeta2 ON aeta2.area_relation_id = ar2.id
+                    WHERE aeta2.tag_id = ?
+                      AND ar2.entity_type = 'item'
+                      AND ar2.area_id = ?
+                )
+                ORDER BY i.label ASC
+            """
+            return self.execute_query(query, (tag_id, area_id, tag_id, area_id))
+        else:
+            # Sin filtro de área
+            query = """
+                SELECT DISTINCT i.*
+                FROM items i
+                WHERE i.id IN (
+                    -- Items a través de categorías con el tag
+                    SELECT i2.id
+                    FROM items i2
+                    INNER JOIN area_relations ar ON ar.entity_id = i2.category_id
+                    INNER JOIN area_element_tag_associations aeta ON aeta.area_relation_id = ar.id
+                    WHERE aeta.tag_id = ? AND ar.entity_type = 'category'
+
+                    UNION
+
+                    -- Items directamente asociados con el tag
+                    SELECT ar2.entity_id
+                    FROM area_relations ar2
+                    INNER JOIN area_element_tag_associations aeta2 ON aeta2.area_relation_id = ar2.id
+                    WHERE aeta2.tag_id = ? AND ar2.entity_type = 'item'
+                )
+                ORDER BY i.label ASC
+            """
+            return self.execute_query(query, (tag_id, tag_id))
+
+    def get_items_by_item_tag_in_area(self, tag_id: int, area_id: int = None) -> List[Dict]:
+        """
+        Obtiene items que tienen un tag de item específico y están en un área
+
+        Esta función busca en la tabla 'item_tags' (tags normales de items),
+        NO en 'area_element_tags' (tags de área).
+
+        Args:
+            tag_id: ID del tag de item (de la tabla 'tags')
+            area_id: ID del área (opcional, para filtrar por área específica)
+
+        Returns:
+            List[Dict]: Lista de items que tienen ese tag y están en el área
+        """
+        if area_id is not None:
+            # Filtrar por área específica
+            query = """
+                SELECT DISTINCT i.*
+                FROM items i
+                INNER JOIN item_tags it ON it.item_id = i.id
+                WHERE it.tag_id = ?
+                  AND i.id IN (
+                      -- Items a través de categorías en el área
+                      SELECT i2.id
+                      FROM items i2
+                      INNER JOIN area_relations ar ON ar.entity_id = i2.category_id
+                      WHERE ar.area_id = ? AND ar.entity_type = 'category'
+
+                      UNION
+
+                      -- Items directamente asociados al área
+                      SELECT ar2.entity_id
+                      FROM area_relations ar2
+                      WHERE ar2.area_id = ? AND ar2.entity_type = 'item'
+                  )
+                ORDER BY i.label ASC
+            """
+            return self.execute_query(query, (tag_id, area_id, area_id))
+        else:
+            # Sin filtro de área - todos los items con ese tag que están en algún área
+            query = """
+                SELECT DISTINCT i.*
+                FROM items i
+                INNER JOIN item_tags it ON it.item_id = i.id
+                WHERE it.tag_id = ?
+                  AND (
+                      -- Items en categorías que están en áreas
+                      EXISTS (
+                          SELECT 1
+                          FROM area_relations ar
+                          WHERE ar.entity_id = i.category_id
+                            AND ar.entity_type = 'category'
+                      )
+                      OR
+                      -- Items directamente en áreas
+                      EXISTS (
+                          SELECT 1
+                          FROM area_relations ar2
+                          WHERE ar2.entity_id = i.id
+                            AND ar2.entity_type = 'item'
+                      )
+                  )
+                ORDER BY i.label ASC
+            """
+            return self.execute_query(query, (tag_id,))
+
+    def get_items_by_category_in_area(self, category_id: int, area_id: int) -> List[Dict]:
+        """
+        Obtiene todos los items de una categoría específica dentro de un área
+
+        Verifica que la categoría esté asociada al área antes de retornar los items.
+
+        Args:
+            category_id: ID de la categoría
+            area_id: ID del área
+
+        Returns:
+            List[Dict]: Lista de items de la categoría (vacía si la categoría no está en el área)
+        """
+        # Verificar que la categoría esté en el área
+        verification_query = """
+            SELECT COUNT(*) as count
+            FROM area_relations
+            WHERE area_id = ? AND entity_type = 'category' AND entity_id = ?
+        """
+        verification = self.execute_query(verification_query, (area_id, category_id))
+
+        if not verification or verification[0]['count'] == 0:
+            logger.warning(f"Category {category_id} is not associated with area {area_id}")
+            return []
+
+        # Obtener items de la categoría
+        query = """
+            SELECT *
+            FROM items
+            WHERE category_id = ? AND is_active = 1
+            ORDER BY label ASC
+        """
+        return self.execute_query(query, (category_id,))
+
+    # ==================== RELACIONES DE ÁREAS ====================
+
+    def add_area_relation(self, area_id: int, entity_type: str, entity_id: int,
+                          description: str = "", order_index: int = 0) -> int:
+        """
+        Agrega una relación entre área y entidad
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad ('tag', 'process', 'list', 'table', 'category', 'item')
+            entity_id: ID de la entidad
+            description: Descripción contextual
+            order_index: Índice de orden
+
+        Returns:
+            int: ID de la relación creada
+        """
+        query = """
+            INSERT INTO area_relations (area_id, entity_type, entity_id, description, order_index)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        return self.execute_update(query, (area_id, entity_type, entity_id, description, order_index))
+
+    def get_area_max_order(self, area_id: int) -> int:
+        """
+        Obtiene el order_index máximo entre relaciones y componentes de un área
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            int: order_index máximo, o -1 si el área está vacía
+        """
+        query = """
+            SELECT COALESCE(MAX(order_index), -1) as max_order FROM (
+                SELECT order_index FROM area_relations WHERE area_id = ?
+                UNION ALL
+                SELECT order_index FROM area_components WHERE area_id = ?
+            )
+        """
+        result = self.execute_query(query, (area_id, area_id))
+        return result[0]['max_order'] if result else -1
+
+    def clone_area_relations(self, src_area_id: int, dst_area_id: int) -> int:
+        """
+        Copia todas las relaciones de un área a otra con un único INSERT ... SELECT
+
+        Args:
+            src_area_id: ID del área origen
+            dst_area_id: ID del área destino
+
+        Returns:
+            int: Número de relaciones copiadas
+        """
+        query = """
+            INSERT INTO area_relations (area_id, entity_type, entity_id, description, order_index)
+            SELECT ?, entity_type, entity_id, description, order_index
+            FROM area_relations
+            WHERE area_id = ?
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(query, (dst_area_id, src_area_id))
+            return cursor.rowcount
+
+    def get_area_relations(self, area_id: int, entity_type: str = None) -> List[Dict]:
+        """
+        Obtiene todas las relaciones de un área
+
+        Args:
+            area_id: ID del área
+            entity_type: Si se especifica, filtra por tipo de entidad
+
         Returns:
             List[Dict]: Lista de relaciones
         """
+        query = "SELECT * FROM area_relations WHERE area_id = ?"
+        params = [area_id]
+
+        if entity_type:
+            query += " AND entity_type = ?"
+            params.append(entity_type)
+
+        query += " ORDER BY order_index ASC"
+        return self.execute_query(query, tuple(params))
+
+    def area_has_entity(self, area_id: int, entity_type: str, entity_id: int) -> bool:
+        """
+        Verifica si una entidad está relacionada con un área
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad
+            entity_id: ID de la entidad
+
+        Returns:
+            bool: True si existe la relación
+        """
+        query = """
+            SELECT 1 FROM area_relations
+            WHERE area_id = ? AND entity_type = ? AND entity_id = ?
+            LIMIT 1
+        """
+        return bool(self.execute_query(query, (area_id, entity_type, entity_id)))
+
+    def get_area_entity_counts(self, area_id: int) -> Dict[str, int]:
+        """
+        Cuenta las relaciones de un área agrupadas por tipo de entidad
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            Dict[str, int]: {entity_type: cantidad}
+        """
         query = """
-            SELECT * FROM area_relations
+            SELECT entity_type, COUNT(*) as count
+            FROM area_relations
             WHERE area_id = ?
-            ORDER BY order_index ASC
+            GROUP BY entity_type
         """
-        return self.execute_query(query, (area_id,))
+        results = self.execute_query(query, (area_id,))
+        return {row['entity_type']: row['count'] for row in results}
+
+    def get_entities_in_area(self, area_id: int, entity_type: str) -> List[Dict]:
+        """
+        Obtiene las entidades de un tipo que pertenecen a un área
+        (JOIN con area_relations, sin cargar la tabla completa)
+
+        Args:
+            area_id: ID del área
+            entity_type: Tipo de entidad ('tag', 'process', 'list', 'table', 'category', 'item')
+
+        Returns:
+            List[Dict]: Filas de la tabla de la entidad
+        """
+        if entity_type == 'list':
+            # Listas de categorías activas, con conteo de items
+            query = """
+                SELECT l.*,
+                       COUNT(i.id) as item_count,
+                       MAX(i.last_used) as last_item_used
+                FROM listas l
+                INNER JOIN area_relations r ON r.entity_id = l.id
+                INNER JOIN categories c ON c.id = l.category_id
+                LEFT JOIN items i ON i.list_id = l.id
+                WHERE r.area_id = ? AND r.entity_type = 'list'
+                  AND c.is_active = 1
+                GROUP BY l.id
+                ORDER BY l.created_at DESC
+            """
+            return self.execute_query(query, (area_id,))
+
+        if entity_type == 'item':
+            # Mismo resultado que get_all_items: items de categorías activas,
+            # con datos de categoría, tags y contenido sensible descifrado
+            query = """
+                SELECT
+                    i.*,
+                    c.name as category_name,
+                    c.icon as category_icon,
+                    c.color as category_color,
+                    c.id as category_id
+                FROM items i
+                INNER JOIN area_relations r ON r.entity_id = i.id
+                INNER JOIN categories c ON i.category_id = c.id
+                WHERE r.area_id = ? AND r.entity_type = 'item'
+                  AND c.is_active = 1
+                ORDER BY i.created_at DESC
+            """
+            return self._attach_tags_and_decrypt(self.execute_query(query, (area_id,)))
+
+        if entity_type == 'category':
+            # Mismo resultado que get_categories: categorías activas con 'tags'
+            query = """
+                SELECT c.*
+                FROM categories c
+                INNER JOIN area_relations r ON r.entity_id = c.id
+                WHERE r.area_id = ? AND r.entity_type = 'category'
+                  AND c.is_active = 1
+                ORDER BY c.order_index
+            """
+            categories = self.execute_query(query, (area_id,))
+
+            # Tags de todas las categorías del área en una sola consulta
+            tags_query = """
+                SELECT ctc.category_id, ct.name
+                FROM category_tags ct
+                INNER JOIN category_tags_category ctc ON ct.id = ctc.tag_id
+                INNER JOIN area_relations r ON r.entity_id = ctc.category_id
+                WHERE r.area_id = ? AND r.entity_type = 'category'
+                ORDER BY ct.name ASC
+            """
+            tags_by_category: Dict[int, List[str]] = {}
+            for row in self.execute_query(tags_query, (area_id,)):
+                tags_by_category.setdefault(row['category_id'], []).append(row['name'])
+
+            for category in categories:
+                category['tags'] = tags_by_category.get(category['id'], [])
+
+            return categories
+
+        # tipo -> (tabla, condición adicional, orden)
+        entity_tables = {
+            'tag': ('tags', '1 = 1', 'e.name ASC'),
+            'process': ('processes', 'e.is_active = 1 AND e.is_archived = 0',
+                        'e.pinned_order ASC, e.order_index ASC, e.name ASC'),
+            'table': ('tables', '1 = 1', 'e.name'),
+        }
+
+        if entity_type not in entity_tables:
+            logger.warning(f"Tipo de entidad no soportado: {entity_type}")
+            return []
+
+        table, condition, order = entity_tables[entity_type]
+        query = f"""
+            SELECT e.*
+            FROM {table} e
+            INNER JOIN area_relations r ON r.entity_id = e.id
+            WHERE r.area_id = ? AND r.entity_type = ?
+              AND {condition}
+            ORDER BY {order}
+        """
+        return self.execute_query(query, (area_id, entity_type))
 
     def remove_area_relation(self, relation_id: int) -> bool:
         """
@@ -8389,6 +15041,27 @@ class DBManager:
         """
         return self.execute_update(query, (area_id, component_type, content, order_index))
 
+    def clone_area_components(self, src_area_id: int, dst_area_id: int) -> int:
+        """
+        Copia todos los componentes de un área a otra con un único INSERT ... SELECT
+
+        Args:
+            src_area_id: ID del área origen
+            dst_area_id: ID del área destino
+
+        Returns:
+            int: Número de componentes copiados
+        """
+        query = """
+            INSERT INTO area_components (area_id, component_type, content, order_index)
+            SELECT ?, component_type, content, order_index
+            FROM area_components
+            WHERE area_id = ?
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(query, (dst_area_id, src_area_id))
+            return cursor.rowcount
+
     def get_area_components(self, area_id: int) -> List[Dict]:
         """
         Obtiene todos los componentes de un área
@@ -8462,6 +15135,72 @@ class DBManager:
             logger.error(f"Error actualizando orden de componente de área {component_id}: {e}")
             return False
 
+    def shift_area_item_orders(self, area_id: int, from_order: int) -> bool:
+        """
+        Incrementa en 1 el order_index de todas las relaciones y componentes
+        de un área con order_index >= from_order (una sentencia por tabla,
+        en una sola transacción)
+
+        Args:
+            area_id: ID del área
+            from_order: Primer order_index a desplazar
+
+        Returns:
+            bool: True si se actualizó correctamente
+        """
+        try:
+            with self.transaction() as conn:
+                conn.execute(
+                    "UPDATE area_relations SET order_index = order_index + 1 "
+                    "WHERE area_id = ? AND order_index >= ?",
+                    (area_id, from_order)
+                )
+                conn.execute(
+                    "UPDATE area_components SET order_index = order_index + 1 "
+                    "WHERE area_id = ? AND order_index >= ?",
+                    (area_id, from_order)
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error desplazando orden de elementos del área {area_id}: {e}")
+            return False
+
+    def swap_area_item_orders(self, kind_a: str, id_a: int,
+                              kind_b: str, id_b: int) -> bool:
+        """
+        Intercambia el order_index de dos elementos de un área en una sola transacción
+
+        Args:
+            kind_a: Tipo del primer elemento ('relation' o 'component')
+            id_a: ID del primer elemento
+            kind_b: Tipo del segundo elemento ('relation' o 'component')
+            id_b: ID del segundo elemento
+
+        Returns:
+            bool: True si se intercambiaron correctamente
+        """
+        tables = {'relation': 'area_relations', 'component': 'area_components'}
+        try:
+            table_a = tables[kind_a]
+            table_b = tables[kind_b]
+            with self.transaction() as conn:
+                order_a = conn.execute(
+                    f"SELECT order_index FROM {table_a} WHERE id = ?", (id_a,)
+                ).fetchone()
+                order_b = conn.execute(
+                    f"SELECT order_index FROM {table_b} WHERE id = ?", (id_b,)
+                ).fetchone()
+                if order_a is None or order_b is None:
+                    return False
+                conn.execute(f"UPDATE {table_a} SET order_index = ? WHERE id = ?",
+                             (order_b[0], id_a))
+                conn.execute(f"UPDATE {table_b} SET order_index = ? WHERE id = ?",
+                             (order_a[0], id_b))
+            return True
+        except Exception as e:
+            logger.error(f"Error intercambiando orden de elementos de área: {e}")
+            return False
+
     def get_area_content_ordered(self, area_id: int) -> List[Dict]:
         """
         Obtiene todo el contenido de un área (relaciones y componentes) ordenado
@@ -8528,6 +15267,104 @@ class DBManager:
         """
         return self.execute_update(query, (name, color, description))
 
+    def create_area_element_tag(self, name: str, color: str = "#9b59b6",
+                                description: str = "") -> Optional[Dict]:
+        """
+        Crea un tag de elemento de área y retorna la fila creada
+
+        Usa INSERT ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace INSERT + SELECT.
+
+        Args:
+            name: Nombre del tag
+            color: Color en formato hex
+            description: Descripción del tag
+
+        Returns:
+            Optional[Dict]: Datos del tag creado
+        """
+        if sqlite3.sqlite_version_info < (3, 35, 0):
+            tag_id = self.add_area_element_tag(name, color, description)
+            return self.get_area_element_tag(tag_id)
+
+        conn = self.connect()
+        try:
+            cursor = conn.execute("""
+                INSERT INTO area_element_tags (name, color, description)
+                VALUES (?, ?, ?)
+                RETURNING *
+            """, (name, color, description))
+            row = cursor.fetchone()
+            conn.commit()
+            return dict(row) if row else None
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.error(f"Error creando tag de área '{name}': {e}")
+            raise
+
+    def add_area_element_tags_bulk(self, rows: List[tuple]) -> Dict[str, int]:
+        """
+        Crea múltiples tags de elemento de área en una sola transacción
+
+        Los nombres que ya existen en la BD (o repetidos dentro del lote)
+        se ignoran y no aparecen en el resultado.
+
+        Args:
+            rows: Lista de tuplas (name, color, description)
+
+        Returns:
+            Dict[str, int]: Mapeo nombre -> ID de los tags creados
+        """
+        if not rows:
+            return {}
+
+        names = list(dict.fromkeys(row[0] for row in rows))
+
+        with self.transaction() as conn:
+            existing = set()
+            for chunk, placeholders in _in_chunks(names):
+                existing.update(
+                    row['name'] for row in conn.execute(
+                        f"SELECT name FROM area_element_tags WHERE name IN ({placeholders})",
+                        chunk
+                    )
+                )
+
+            new_rows = [row for row in rows if row[0] not in existing]
+            conn.executemany("""
+                INSERT OR IGNORE INTO area_element_tags (name, color, description)
+                VALUES (?, ?, ?)
+            """, new_rows)
+
+            new_names = list(dict.fromkeys(row[0] for row in new_rows))
+            created = {}
+            for chunk, placeholders in _in_chunks(new_names):
+                for row in conn.execute(
+                    f"SELECT id, name FROM area_element_tags WHERE name IN ({placeholders})",
+                    chunk
+                ):
+                    created[row['name']] = row['id']
+            return created
+
+    def get_area_element_tags_by_ids(self, tag_ids: List[int]) -> List[Dict]:
+        """
+        Obtiene varios tags de elemento de área por ID en una sola consulta
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            List[Dict]: Lista de tags encontrados
+        """
+        if not tag_ids:
+            return []
+
+        tags = []
+        for chunk, placeholders in _in_chunks(tag_ids):
+            query = f"SELECT * FROM area_element_tags WHERE id IN ({placeholders})"
+            tags.extend(self.execute_query(query, chunk))
+        return tags
+
     def get_all_area_element_tags(self) -> List[Dict]:
         """
         Obtiene todos los tags de elementos de área
@@ -8634,9 +15471,12 @@ class DBManager:
         return result[0]['count'] if result else 0
 
     def update_area_element_tag(self, tag_id: int, name: str = None,
-                                 color: str = None, description: str = None) -> bool:
+                                 color: str = None, description: str = None) -> Optional[Dict]:
         """
-        Actualiza un tag de elemento de área
+        Actualiza un tag de elemento de área y retorna la fila actualizada
+
+        Usa UPDATE ... RETURNING (SQLite 3.35+) para evitar releer la fila;
+        en versiones anteriores hace UPDATE + SELECT.
 
         Args:
             tag_id: ID del tag
@@ -8645,7 +15485,7 @@ class DBManager:
             description: Nueva descripción (opcional)
 
         Returns:
-            bool: True si se actualizó correctamente
+            Optional[Dict]: Datos del tag actualizado, o None si no se actualizó
         """
         updates = []
         values = []
@@ -8663,7 +15503,7 @@ class DBManager:
             values.append(description)
 
         if not updates:
-            return False
+            return None
 
         updates.append("updated_at = CURRENT_TIMESTAMP")
         values.append(tag_id)
@@ -8671,11 +15511,16 @@ class DBManager:
         query = f"UPDATE area_element_tags SET {', '.join(updates)} WHERE id = ?"
 
         try:
-            self.execute_update(query, tuple(values))
-            return True
+            if sqlite3.sqlite_version_info < (3, 35, 0):
+                self.execute_update(query, tuple(values))
+                return self.get_area_element_tag(tag_id)
+
+            with self.transaction() as conn:
+                row = conn.execute(f"{query} RETURNING *", tuple(values)).fetchone()
+            return dict(row) if row else None
         except Exception as e:
             logger.error(f"Error actualizando tag {tag_id}: {e}")
-            return False
+            return None
 
     def delete_area_element_tag(self, tag_id: int) -> bool:
         """
@@ -8695,6 +15540,61 @@ class DBManager:
             logger.error(f"Error eliminando tag {tag_id}: {e}")
             return False
 
+    def _delete_ids_returning(self, table: str, ids: List[int]) -> List[int]:
+        """
+        Elimina filas por ID en una sola transacción y retorna los IDs eliminados
+
+        Usa DELETE ... RETURNING (SQLite 3.35+); en versiones anteriores
+        consulta los IDs existentes antes de eliminarlos. Los IDs que no
+        existían no aparecen en el resultado.
+
+        Args:
+            table: Tabla (nombre interno, nunca datos del usuario)
+            ids: IDs a eliminar
+
+        Returns:
+            List[int]: IDs efectivamente eliminados
+        """
+        deleted: List[int] = []
+
+        with self.transaction() as conn:
+            for chunk, placeholders in _in_chunks(ids):
+                if sqlite3.sqlite_version_info >= (3, 35, 0):
+                    rows = conn.execute(
+                        f"DELETE FROM {table} WHERE id IN ({placeholders}) RETURNING id",
+                        chunk
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        f"SELECT id FROM {table} WHERE id IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    conn.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", chunk)
+
+                deleted.extend(row[0] for row in rows)
+
+        return deleted
+
+    def delete_area_element_tags_bulk(self, tag_ids: List[int]) -> List[int]:
+        """
+        Elimina múltiples tags de elemento de área en una sola transacción
+
+        Args:
+            tag_ids: Lista de IDs de tags
+
+        Returns:
+            List[int]: IDs de los tags eliminados (vacía si no existía ninguno
+            o si hubo un error)
+        """
+        if not tag_ids:
+            return []
+
+        try:
+            return self._delete_ids_returning("area_element_tags", tag_ids)
+        except Exception as e:
+            logger.error(f"Error eliminando tags en lote: {e}")
+            return []
+
     def assign_tag_to_area_relation(self, relation_id: int, tag_id: int) -> bool:
         """
         Asigna un tag a una relación de área
@@ -8831,17 +15731,54 @@ class DBManager:
         Returns:
             List[Dict]: Lista de tags únicos
         """
+        # UNION en lugar de LEFT JOIN + OR para que cada rama use su índice
         query = """
-            SELECT DISTINCT t.*
+            SELECT t.*
             FROM area_element_tags t
             INNER JOIN area_element_tag_associations a ON t.id = a.tag_id
-            LEFT JOIN area_relations r ON a.area_relation_id = r.id
-            LEFT JOIN area_components c ON a.area_component_id = c.id
-            WHERE r.area_id = ? OR c.area_id = ?
-            ORDER BY t.name
+            INNER JOIN area_relations r ON a.area_relation_id = r.id
+            WHERE r.area_id = ?
+            UNION
+            SELECT t.*
+            FROM area_element_tags t
+            INNER JOIN area_element_tag_associations a ON t.id = a.tag_id
+            INNER JOIN area_components c ON a.area_component_id = c.id
+            WHERE c.area_id = ?
+            ORDER BY name
         """
         return self.execute_query(query, (area_id, area_id))
 
+    def get_all_tags_for_area(self, area_id: int) -> Dict[tuple, List[Dict]]:
+        """
+        Obtiene los tags de todas las relaciones y componentes de un área
+        en una sola consulta (evita una consulta por elemento al cargar)
+
+        Args:
+            area_id: ID del área
+
+        Returns:
+            Dict[tuple, List[Dict]]: ('relation' | 'component', owner_id) -> tags
+            ordenados por nombre
+        """
+        query = """
+            SELECT 'relation' AS owner_kind, a.area_relation_id AS owner_id, t.*
+            FROM area_element_tag_associations a
+            INNER JOIN area_relations r ON a.area_relation_id = r.id
+            INNER JOIN area_element_tags t ON t.id = a.tag_id
+            WHERE r.area_id = ?
+            UNION ALL
+            SELECT 'component' AS owner_kind, a.area_component_id AS owner_id, t.*
+            FROM area_element_tag_associations a
+            INNER JOIN area_components c ON a.area_component_id = c.id
+            INNER JOIN area_element_tags t ON t.id = a.tag_id
+            WHERE c.area_id = ?
+            ORDER BY name
+        """
+        result: Dict[tuple, List[Dict]] = {}
+        for row in self.execute_query(query, (area_id, area_id)):
+            result.setdefault((row['owner_kind'], row['owner_id']), []).append(row)
+        return result
+
     def update_area_relation_tags(self, relation_id: int, tag_ids: List[int]) -> bool:
         """
         Actualiza todos los tags de una relación de área
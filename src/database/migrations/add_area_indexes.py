@@ -0,0 +1,60 @@
+"""
+Migración: Índices adicionales para consultas de áreas
+Fecha: 2026-10-15
+Versión: 1.0
+
+Esta migración agrega índices que aceleran las consultas del sistema de áreas
+en bases de datos existentes (las nuevas ya los crean en el esquema):
+
+- idx_area_relations_entity_area: búsquedas inversas por entidad
+  ("¿qué áreas contienen este tag?") resueltas solo con el índice.
+  Reemplaza a idx_area_relations_entity, que es un prefijo suyo.
+
+Es idempotente: DBManager la aplica al abrir una base de datos existente
+(ensure_area_indexes).
+
+Las búsquedas por (area_id, entity_type, entity_id) ya están cubiertas por el
+índice de la restricción UNIQUE de area_relations, y (area_id, order_index) de
+area_components por idx_area_components_order.
+"""
+
+
+def ensure_area_indexes(conn):
+    """
+    Crea los índices de áreas si faltan (sin salida por consola)
+
+    Args:
+        conn: Conexión sqlite3 a la base de datos
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_area_relations_entity_area
+        ON area_relations(entity_type, entity_id, area_id)
+    """)
+    cursor.execute("DROP INDEX IF EXISTS idx_area_relations_entity")
+    conn.commit()
+
+
+def upgrade(conn):
+    """Crear índices de áreas"""
+    print("[*] Creando índices para áreas...")
+
+    print("    [1] idx_area_relations_entity_area...")
+    ensure_area_indexes(conn)
+
+    print("[OK] Migración completada exitosamente")
+
+
+def downgrade(conn):
+    """Eliminar índices de áreas"""
+    print("[*] Revirtiendo migración...")
+
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_area_relations_entity
+        ON area_relations(entity_type, entity_id)
+    """)
+    cursor.execute("DROP INDEX IF EXISTS idx_area_relations_entity_area")
+
+    conn.commit()
+    print("[OK] Reversión completada")
@@ -7,16 +7,47 @@ Modelos:
 - AreaComponent: Componente estructural (divisor, comentario, alerta, nota)
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, InitVar
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Set, Tuple, TYPE_CHECKING
 
 # Evitar import circular usando TYPE_CHECKING
 if TYPE_CHECKING:
     from .area_element_tag import AreaElementTag
 
 
-@dataclass
+# Tipos de entidad válidos para relaciones de área
+VALID_ENTITY_TYPES = frozenset({'tag', 'process', 'list', 'table', 'category', 'item'})
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parsea un timestamp ISO (memoizado: las filas suelen repetir timestamps)"""
+    return datetime.fromisoformat(value)
+
+
+def _to_iso(value: Any) -> Any:
+    """Convierte un datetime a string ISO (otros valores se retornan tal cual)"""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _created_at_iso(obj) -> Any:
+    """
+    Retorna obj.created_at en formato ISO, memoizado por valor de created_at
+
+    La conversión se cachea junto al datetime que la originó, de modo que si
+    created_at se reasigna el string se recalcula en el siguiente acceso.
+    """
+    created_at = obj.created_at
+    cached = obj._created_iso
+    if cached is None or cached[0] is not created_at:
+        cached = (created_at, _to_iso(created_at))
+        obj._created_iso = cached
+    return cached[1]
+
+
+@dataclass(slots=True)
 class Area:
     """
     Modelo de área
@@ -33,32 +64,39 @@ class Area:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Caché (created_at, created_at en ISO), se calcula en el primer to_dict
+    _created_iso: Optional[Tuple[Optional[datetime], Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convierte el área a diccionario"""
-        data = asdict(self)
-        # Convertir datetime a string ISO
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-        return data
+        # Construcción directa (asdict hace deepcopy recursivo de cada campo)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'color': self.color,
+            'icon': self.icon,
+            'is_active': self.is_active,
+            # Convertir datetime a string ISO
+            'created_at': _created_at_iso(self),
+            'updated_at': self.updated_at.isoformat() if self.updated_at else self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Area':
         """Crea un área desde un diccionario"""
         # Convertir strings ISO a datetime
         if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
+            data['created_at'] = _parse_iso(data['created_at'])
         if 'updated_at' in data and isinstance(data['updated_at'], str):
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+            data['updated_at'] = _parse_iso(data['updated_at'])
         return cls(**data)
 
     def __str__(self) -> str:
         return f"{self.icon} {self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class AreaRelation:
     """
     Modelo de relación área-entidad
@@ -74,7 +112,8 @@ class AreaRelation:
         description: Descripción contextual del elemento
         order_index: Orden de visualización en el área
         created_at: Fecha de creación
-        tags: Lista de tags asociados a esta relación
+        tags: Lista de tags asociados a esta relación (se deserializa al
+            primer acceso cuando la relación viene de from_dict)
     """
     id: int
     area_id: int
@@ -83,18 +122,40 @@ class AreaRelation:
     description: str = ""  # Descripción contextual del elemento en el área
     order_index: int = 0
     created_at: Optional[datetime] = None
-    tags: List['AreaElementTag'] = field(default_factory=list)
+    tags: InitVar[Optional[List['AreaElementTag']]] = None
+    # Tags materializados (None = pendientes de deserializar desde _tags_raw)
+    _tags: Optional[List['AreaElementTag']] = field(default=None, init=False, repr=False, compare=False)
+    # Tags en crudo (dicts) recibidos en from_dict
+    _tags_raw: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    # Índice de IDs de tags (lazy, se mantiene sincronizado por los métodos de tags)
+    _tag_ids_set: Optional[Set[int]] = field(default=None, init=False, repr=False, compare=False)
+    # Caché (created_at, created_at en ISO), se calcula en el primer to_dict
+    _created_iso: Optional[Tuple[Optional[datetime], Any]] = field(default=None, init=False, repr=False, compare=False)
 
     # Tipos de entidad válidos
-    VALID_ENTITY_TYPES = {'tag', 'process', 'list', 'table', 'category', 'item'}
+    VALID_ENTITY_TYPES = VALID_ENTITY_TYPES
 
-    def __post_init__(self):
+    def __post_init__(self, tags: Optional[List['AreaElementTag']]):
         """Validación post-inicialización"""
         if self.entity_type not in self.VALID_ENTITY_TYPES:
             raise ValueError(
                 f"entity_type inválido: '{self.entity_type}'. "
                 f"Debe ser uno de: {', '.join(self.VALID_ENTITY_TYPES)}"
             )
+        self._tags = list(tags) if tags is not None else []
+
+    def _get_tags(self) -> List['AreaElementTag']:
+        """Retorna los tags, deserializándolos en el primer acceso"""
+        if self._tags is None:
+            from .area_element_tag import AreaElementTag
+            self._tags = [AreaElementTag.from_dict(tag_data) for tag_data in self._tags_raw]
+            self._tags_raw = None
+        return self._tags
+
+    def _set_tags(self, tags: List['AreaElementTag']) -> None:
+        self._tags = tags
+        self._tags_raw = None
+        self._tag_ids_set = None
 
     def to_dict(self, include_tags: bool = True) -> Dict[str, Any]:
         """
@@ -106,17 +167,24 @@ class AreaRelation:
         Returns:
             Diccionario con datos de la relación
         """
-        data = asdict(self)
-
-        # Convertir datetime
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-
-        # Convertir tags a lista de diccionarios
-        if include_tags and self.tags:
-            data['tags'] = [tag.to_dict() for tag in self.tags]
-        elif not include_tags:
-            data.pop('tags', None)
+        # Construcción directa (asdict copiaría recursivamente la lista de tags)
+        data = {
+            'id': self.id,
+            'area_id': self.area_id,
+            'entity_type': self.entity_type,
+            'entity_id': self.entity_id,
+            'description': self.description,
+            'order_index': self.order_index,
+            # Convertir datetime
+            'created_at': _created_at_iso(self),
+        }
+
+        # Convertir tags a lista de diccionarios (sin materializarlos si siguen en crudo)
+        if include_tags:
+            if self._tags is None:
+                data['tags'] = [dict(tag_data) for tag_data in self._tags_raw]
+            else:
+                data['tags'] = [tag.to_dict() for tag in self._tags]
 
         return data
 
@@ -125,6 +193,9 @@ class AreaRelation:
         """
         Crea una relación desde un diccionario
 
+        Los tags se guardan en crudo y se convierten a AreaElementTag
+        recién cuando se accede a `tags`.
+
         Args:
             data: Diccionario con datos de la relación
             include_tags: Si True, carga los tags desde el diccionario
@@ -134,16 +205,25 @@ class AreaRelation:
         """
         # Convertir strings ISO a datetime
         if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
+            data['created_at'] = _parse_iso(data['created_at'])
 
-        # Convertir lista de tags si existe
-        if include_tags and 'tags' in data and data['tags']:
-            from .area_element_tag import AreaElementTag
-            data['tags'] = [AreaElementTag.from_dict(tag_data) for tag_data in data['tags']]
-        else:
-            data.pop('tags', None)
+        tags_raw = data.pop('tags', None)
+        relation = cls(**data)
 
-        return cls(**data)
+        if include_tags and tags_raw:
+            relation._tags = None
+            relation._tags_raw = list(tags_raw)
+
+        return relation
+
+    def _tag_ids(self) -> Set[int]:
+        """Retorna el set de IDs de tags (lo construye en el primer acceso)"""
+        if self._tag_ids_set is None:
+            if self._tags is None:
+                self._tag_ids_set = {tag_data['id'] for tag_data in self._tags_raw}
+            else:
+                self._tag_ids_set = {tag.id for tag in self._tags}
+        return self._tag_ids_set
 
     def add_tag(self, tag: 'AreaElementTag') -> None:
         """
@@ -152,8 +232,12 @@ class AreaRelation:
         Args:
             tag: Tag a agregar
         """
-        if tag not in self.tags:
-            self.tags.append(tag)
+        tag_id = tag.id
+        tag_ids = self._tag_ids()
+        if tag_id in tag_ids:
+            return
+        tag_ids.add(tag_id)
+        self.tags.append(tag)
 
     def remove_tag(self, tag: 'AreaElementTag') -> None:
         """
@@ -164,6 +248,7 @@ class AreaRelation:
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._tag_ids_set = None
 
     def remove_tag_by_id(self, tag_id: int) -> None:
         """
@@ -172,7 +257,9 @@ class AreaRelation:
         Args:
             tag_id: ID del tag a remover
         """
-        self.tags = [tag for tag in self.tags if tag.id != tag_id]
+        if tag_id in self._tag_ids():
+            self._tags = [tag for tag in self.tags if tag.id != tag_id]
+            self._tag_ids_set.discard(tag_id)
 
     def has_tag(self, tag: 'AreaElementTag') -> bool:
         """
@@ -196,7 +283,7 @@ class AreaRelation:
         Returns:
             True si el tag está asociado
         """
-        return any(tag.id == tag_id for tag in self.tags)
+        return tag_id in self._tag_ids()
 
     def get_tag_ids(self) -> List[int]:
         """
@@ -205,14 +292,21 @@ class AreaRelation:
         Returns:
             Lista de IDs de tags
         """
-        return [tag.id for tag in self.tags]
+        if self._tags is None:
+            return [tag_data['id'] for tag_data in self._tags_raw]
+        return [tag.id for tag in self._tags]
 
     def __str__(self) -> str:
-        tag_count = len(self.tags)
+        tag_count = len(self._tags) if self._tags is not None else len(self._tags_raw)
         return f"AreaRelation({self.entity_type}#{self.entity_id} -> Area#{self.area_id}, {tag_count} tags)"
 
 
-@dataclass
+# `tags` es InitVar (parámetro del constructor); el acceso como atributo
+# se resuelve con esta propiedad, asignada tras generar la clase
+AreaRelation.tags = property(AreaRelation._get_tags, AreaRelation._set_tags)
+
+
+@dataclass(slots=True)
 class AreaComponent:
     """
     Modelo de componente estructural del área
@@ -229,6 +323,8 @@ class AreaComponent:
     content: str = ""  # Texto del componente (vacío para divisores)
     order_index: int = 0
     created_at: Optional[datetime] = None
+    # Caché (created_at, created_at en ISO), se calcula en el primer to_dict
+    _created_iso: Optional[Tuple[Optional[datetime], Any]] = field(default=None, init=False, repr=False, compare=False)
 
     # Tipos de componente válidos
     VALID_COMPONENT_TYPES = {'divider', 'comment', 'alert', 'note'}
@@ -251,16 +347,20 @@ class AreaComponent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convierte el componente a diccionario"""
-        data = asdict(self)
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        return data
+        return {
+            'id': self.id,
+            'area_id': self.area_id,
+            'component_type': self.component_type,
+            'content': self.content,
+            'order_index': self.order_index,
+            'created_at': _created_at_iso(self),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AreaComponent':
         """Crea un componente desde un diccionario"""
         if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
+            data['created_at'] = _parse_iso(data['created_at'])
         return cls(**data)
 
     def get_icon(self) -> str:
@@ -282,7 +382,7 @@ class AreaComponent:
 # Función auxiliar para validar tipos de entidad
 def validate_entity_type(entity_type: str) -> bool:
     """Valida si el tipo de entidad es válido"""
-    return entity_type in AreaRelation.VALID_ENTITY_TYPES
+    return entity_type in VALID_ENTITY_TYPES
 
 
 # Función auxiliar para validar tipos de componente
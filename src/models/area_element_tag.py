@@ -5,12 +5,39 @@ Este módulo define el modelo AreaElementTag que representa
 los tags que pueden asignarse a elementos dentro de áreas.
 """
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, Tuple, List, Iterable, Iterator
 
+# Referencias locales: evitan resolver el atributo en cada fila
+_fromiso = datetime.fromisoformat
+_setattr = object.__setattr__
+_intern = sys.intern
 
-@dataclass
+
+@lru_cache(maxsize=512)
+def _iso_cached(value: datetime, utcoffset: Any) -> str:
+    # utcoffset forma parte de la clave: datetimes aware con el mismo instante
+    # pero distinta zona son iguales entre sí y se formatean distinto
+    return value.isoformat()
+
+
+def _iso(value: Optional[datetime]) -> Any:
+    """Formatea un datetime como ISO (memoizado: los lotes comparten fechas)"""
+    return _iso_cached(value, value.utcoffset()) if value else value
+
+
+def _parse_dt(value: Any) -> Any:
+    """Convierte un string ISO a datetime (otros valores se retornan tal cual)"""
+    return _fromiso(value) if type(value) is str else value
+
+
+# eq=False: __eq__/__hash__ propios comparan solo por ID.
+# frozen: los tags se comparten desde el caché; para modificar usar dataclasses.replace
+@dataclass(frozen=True, slots=True, eq=False)
 class AreaElementTag:
     """
     Modelo para tags de elementos de área
@@ -33,6 +60,32 @@ class AreaElementTag:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    # Nombres de campos en orden (evita introspección con fields()/asdict)
+    _FIELDS: ClassVar[Tuple[str, ...]] = ('id', 'name', 'color', 'description', 'created_at', 'updated_at')
+
+    def __post_init__(self):
+        """Internar el color (pocos valores repetidos en miles de tags)"""
+        if type(self.color) is str:
+            object.__setattr__(self, 'color', sys.intern(self.color))
+
+    @classmethod
+    def _fast_new(cls, id: int, name: str, color: str, description: str,
+                  created_at: Optional[datetime], updated_at: Optional[datetime]) -> 'AreaElementTag':
+        """
+        Crea un tag sin pasar por __init__/__post_init__ (cargas masivas)
+
+        Recibe todos los campos ya convertidos; aplica la misma
+        normalización que __post_init__ (color internado).
+        """
+        tag = object.__new__(cls)
+        _setattr(tag, 'id', id)
+        _setattr(tag, 'name', name)
+        _setattr(tag, 'color', _intern(color) if type(color) is str else color)
+        _setattr(tag, 'description', description)
+        _setattr(tag, 'created_at', created_at)
+        _setattr(tag, 'updated_at', updated_at)
+        return tag
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convierte el tag a diccionario
@@ -40,34 +93,40 @@ class AreaElementTag:
         Returns:
             Diccionario con todos los campos del tag
         """
-        data = asdict(self)
-
-        # Convertir datetime a string ISO
-        if self.created_at:
-            data['created_at'] = self.created_at.isoformat()
-        if self.updated_at:
-            data['updated_at'] = self.updated_at.isoformat()
-
-        return data
+        # Construcción directa (asdict hace deepcopy recursivo de cada campo)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'color': self.color,
+            'description': self.description,
+            # Convertir datetime a string ISO
+            'created_at': _iso(self.created_at),
+            'updated_at': _iso(self.updated_at),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AreaElementTag':
         """
         Crea un tag desde un diccionario
 
+        Las claves que no son campos del tag se ignoran y el diccionario
+        recibido no se modifica.
+
         Args:
             data: Diccionario con datos del tag
 
         Returns:
             Instancia de AreaElementTag
         """
-        # Convertir strings ISO a datetime
-        if 'created_at' in data and isinstance(data['created_at'], str):
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
-        if 'updated_at' in data and isinstance(data['updated_at'], str):
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-
-        return cls(**data)
+        get = data.get
+        return cls._fast_new(
+            data['id'],
+            data['name'],
+            get('color', '#9b59b6'),
+            get('description', ''),
+            _parse_dt(get('created_at')),
+            _parse_dt(get('updated_at')),
+        )
 
     def __str__(self) -> str:
         """Representación en string del tag"""
@@ -79,9 +138,8 @@ class AreaElementTag:
 
     def __eq__(self, other) -> bool:
         """Compara dos tags por ID"""
-        if not isinstance(other, AreaElementTag):
-            return False
-        return self.id == other.id
+        # Identidad primero: el caso común al buscar en listas del caché
+        return self is other or (type(other) is AreaElementTag and self.id == other.id)
 
     def __hash__(self) -> int:
         """Hash basado en el ID para usar en sets/dicts"""
@@ -90,6 +148,12 @@ class AreaElementTag:
 
 # Funciones auxiliares para trabajar con tags
 
+@lru_cache(maxsize=2048)
+def _lower_name(name: str) -> str:
+    """Nombre en minúsculas (memoizado: los mismos nombres se filtran una y otra vez)"""
+    return name.lower()
+
+
 def create_tag_from_db_row(row: Dict[str, Any]) -> AreaElementTag:
     """
     Crea un AreaElementTag desde una fila de base de datos
@@ -100,30 +164,87 @@ def create_tag_from_db_row(row: Dict[str, Any]) -> AreaElementTag:
     Returns:
         Instancia de AreaElementTag
     """
-    # Filtrar solo los campos relevantes
-    tag_data = {
-        'id': row['id'],
-        'name': row['name'],
-        'color': row.get('color', '#9b59b6'),
-        'description': row.get('description', ''),
-        'created_at': row.get('created_at'),
-        'updated_at': row.get('updated_at'),
-    }
+    # Construcción directa, sin dict intermedio (los campos extra se ignoran);
+    # fechas parseadas en línea para no sumar una llamada por campo
+    get = row.get
+    created_at = get('created_at')
+    updated_at = get('updated_at')
+    return AreaElementTag._fast_new(
+        row['id'],
+        row['name'],
+        get('color') or '#9b59b6',
+        get('description') or '',
+        _fromiso(created_at) if type(created_at) is str else created_at,
+        _fromiso(updated_at) if type(updated_at) is str else updated_at,
+    )
+
+
+def tags_from_rows_bulk(rows: Iterable[Dict[str, Any]]) -> List[AreaElementTag]:
+    """
+    Crea tags desde muchas filas de BD (carga masiva)
+
+    Igual que create_tag_from_db_row por fila, pero cada timestamp distinto
+    se parsea una sola vez: las filas insertadas juntas comparten fechas.
 
-    return AreaElementTag.from_dict(tag_data)
+    Args:
+        rows: Filas de area_element_tags
+
+    Returns:
+        Lista de AreaElementTag
+    """
+    parsed: Dict[str, datetime] = {}
+
+    def parse(value):
+        if type(value) is not str:
+            return value
+        dt = parsed.get(value)
+        if dt is None:
+            dt = parsed[value] = _fromiso(value)
+        return dt
+
+    fast_new = AreaElementTag._fast_new
+    return [
+        fast_new(
+            row['id'],
+            row['name'],
+            row.get('color') or '#9b59b6',
+            row.get('description') or '',
+            parse(row.get('created_at')),
+            parse(row.get('updated_at')),
+        )
+        for row in rows
+    ]
+
+
+# Lee todos los campos de un tag en una sola llamada (en C)
+_get_tag_fields = attrgetter(*AreaElementTag._FIELDS)
+_get_tag_id = attrgetter('id')
 
 
 def tags_to_dict_list(tags: list) -> list:
     """
     Convierte una lista de tags a lista de diccionarios
 
+    Equivale a llamar to_dict() en cada tag, pero sin una llamada a
+    método por tag.
+
     Args:
         tags: Lista de AreaElementTag
 
     Returns:
         Lista de diccionarios
     """
-    return [tag.to_dict() for tag in tags]
+    return [
+        {
+            'id': tag_id,
+            'name': name,
+            'color': color,
+            'description': description,
+            'created_at': _iso(created_at),
+            'updated_at': _iso(updated_at),
+        }
+        for tag_id, name, color, description, created_at, updated_at in map(_get_tag_fields, tags)
+    ]
 
 
 def tags_from_dict_list(data: list) -> list:
@@ -149,7 +270,8 @@ def get_tag_ids(tags: list) -> list:
     Returns:
         Lista de IDs (int)
     """
-    return [tag.id for tag in tags]
+    # map + attrgetter: el recorrido completo se ejecuta en C
+    return list(map(_get_tag_id, tags))
 
 
 def filter_tags_by_name(tags: list, query: str) -> list:
@@ -164,7 +286,23 @@ def filter_tags_by_name(tags: list, query: str) -> list:
         Lista de tags filtrados
     """
     query_lower = query.lower()
-    return [tag for tag in tags if query_lower in tag.name.lower()]
+    return [tag for tag in tags if query_lower in _lower_name(tag.name)]
+
+
+def iter_filter_tags_by_name(tags: Iterable[AreaElementTag], query: str) -> Iterator[AreaElementTag]:
+    """
+    Igual que filter_tags_by_name pero retorna un generador
+    (para resultados que se ordenan o paginan a continuación)
+
+    Args:
+        tags: Tags a filtrar
+        query: Texto a buscar (case-insensitive)
+
+    Returns:
+        Generador de tags que coinciden
+    """
+    query_lower = query.lower()
+    return (tag for tag in tags if query_lower in _lower_name(tag.name))
 
 
 def sort_tags_by_name(tags: list, reverse: bool = False) -> list:
@@ -178,4 +316,6 @@ def sort_tags_by_name(tags: list, reverse: bool = False) -> list:
     Returns:
         Lista de tags ordenados
     """
-    return sorted(tags, key=lambda t: t.name.lower(), reverse=reverse)
+    # Reutiliza los nombres en minúsculas ya memoizados por filter_tags_by_name
+    return sorted(tags, key=lambda t: _lower_name(t.name), reverse=reverse)
+
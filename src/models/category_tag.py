@@ -5,11 +5,12 @@ Category Tag Model - Modelo de datos para tags de categorías
 Representa un tag que puede ser asignado a categorías para su organización.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryTag:
     """
     Modelo de datos para un tag de categoría
@@ -29,6 +30,14 @@ class CategoryTag:
     updated_at: Optional[str] = None
 
     def __post_init__(self):
-        """Normalizar nombre del tag a minúsculas"""
-        if self.name:
-            self.name = self.name.strip().lower()
+        """Normalizar nombre del tag a minúsculas e internar el color"""
+        # frozen: asignar con object.__setattr__
+        name = self.name
+        if name:
+            # Los nombres leídos de BD ya vienen normalizados: no reasignar
+            # (strip() retorna el mismo objeto si no hay nada que recortar)
+            stripped = name.strip()
+            if stripped is not name or not stripped.islower():
+                object.__setattr__(self, 'name', stripped.lower())
+        if type(self.color) is str:
+            object.__setattr__(self, 'color', sys.intern(self.color))
@@ -9,7 +9,7 @@ Modelos:
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Set, TYPE_CHECKING
 
 # Evitar import circular usando TYPE_CHECKING
 if TYPE_CHECKING:
@@ -83,6 +83,8 @@ class ProjectRelation:
     order_index: int = 0
     created_at: Optional[datetime] = None
     tags: List['ProjectElementTag'] = field(default_factory=list)  # NUEVO
+    # Índice de IDs de tags (lazy, se mantiene sincronizado por los métodos de tags)
+    _tag_ids_set: Optional[Set[int]] = field(default=None, init=False, repr=False, compare=False)
 
     # Tipos de entidad válidos
     VALID_ENTITY_TYPES = {'tag', 'process', 'list', 'table', 'category', 'item'}
@@ -106,6 +108,7 @@ class ProjectRelation:
             Diccionario con datos de la relación
         """
         data = asdict(self)
+        data.pop('_tag_ids_set', None)
 
         # Convertir datetime
         if self.created_at:
@@ -144,6 +147,12 @@ class ProjectRelation:
 
         return cls(**data)
 
+    def _tag_ids(self) -> Set[int]:
+        """Retorna el set de IDs de tags (lo construye en el primer acceso)"""
+        if self._tag_ids_set is None:
+            self._tag_ids_set = {tag.id for tag in self.tags}
+        return self._tag_ids_set
+
     def add_tag(self, tag: 'ProjectElementTag') -> None:
         """
         Agrega un tag a esta relación
@@ -151,8 +160,12 @@ class ProjectRelation:
         Args:
             tag: Tag a agregar
         """
-        if tag not in self.tags:
-            self.tags.append(tag)
+        tag_id = tag.id
+        tag_ids = self._tag_ids()
+        if tag_id in tag_ids:
+            return
+        tag_ids.add(tag_id)
+        self.tags.append(tag)
 
     def remove_tag(self, tag: 'ProjectElementTag') -> None:
         """
@@ -163,6 +176,7 @@ class ProjectRelation:
         """
         if tag in self.tags:
             self.tags.remove(tag)
+            self._tag_ids_set = None
 
     def remove_tag_by_id(self, tag_id: int) -> None:
         """
@@ -171,7 +185,9 @@ class ProjectRelation:
         Args:
             tag_id: ID del tag a remover
         """
-        self.tags = [tag for tag in self.tags if tag.id != tag_id]
+        if tag_id in self._tag_ids():
+            self.tags = [tag for tag in self.tags if tag.id != tag_id]
+            self._tag_ids_set.discard(tag_id)
 
     def has_tag(self, tag: 'ProjectElementTag') -> bool:
         """
@@ -195,7 +211,7 @@ class ProjectRelation:
         Returns:
             True si el tag está asociado
         """
-        return any(tag.id == tag_id for tag in self.tags)
+        return tag_id in self._tag_ids()
 
     def get_tag_ids(self) -> List[int]:
         """
@@ -113,6 +113,26 @@ def create_tag_from_db_row(row: Dict[str, Any]) -> ProjectElementTag:
     return ProjectElementTag.from_dict(tag_data)
 
 
+def create_tag_from_db_tuple(row: tuple) -> ProjectElementTag:
+    """
+    Crea un ProjectElementTag desde una tupla de base de datos
+
+    Args:
+        row: Tupla (id, name, color, description, created_at, updated_at)
+
+    Returns:
+        Instancia de ProjectElementTag
+    """
+    tag_id, name, color, description, created_at, updated_at = row
+
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    if isinstance(updated_at, str):
+        updated_at = datetime.fromisoformat(updated_at)
+
+    return ProjectElementTag(tag_id, name, color, description, created_at, updated_at)
+
+
 def tags_to_dict_list(tags: list) -> list:
     """
     Convierte una lista de tags a lista de diccionarios
@@ -12,14 +12,18 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QLineEdit, QListWidget,
                              QListWidgetItem, QTextEdit, QScrollArea, QFrame,
                              QMessageBox, QColorDialog, QApplication, QDialog, QStackedWidget)
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve, QRect
+from PyQt6.QtCore import (Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve, QRect, QTimer,
+                          QObject, QRunnable, QThreadPool)
 from PyQt6.QtGui import QColor
 import logging
 
 from src.core.area_manager import AreaManager
 from src.core.area_export_manager import AreaExportManager
 from src.core.taskbar_minimizable_mixin import TaskbarMinimizableMixin
+from src.core.entity_metadata import fetch_entities_metadata_batch
 from src.database.db_manager import DBManager
+from src.models.area import get_entity_type_icon, get_entity_type_label
+from src.models.area_element_tag import create_tag_from_db_row
 from src.views.widgets.area_relation_widget import AreaRelationWidget
 from src.views.widgets.area_component_widget import AreaComponentWidget
 from src.views.widgets.area_card_widget import AreaCardWidget
@@ -29,11 +33,67 @@ from src.views.area_manager.area_full_view_panel import AreaFullViewPanel
 logger = logging.getLogger(__name__)
 
 
+def _run_read_query(fn, db: DBManager, *args):
+    """
+    Ejecuta fn(db, *args) registrando el error si falla
+
+    Returns:
+        Resultado de fn, o None si lanzó una excepción
+    """
+    try:
+        return fn(db, *args)
+    except Exception as e:
+        logger.error(f"Error en consulta de área: {e}")
+        return None
+
+
+class AreaQuerySignals(QObject):
+    """Señales de AreaQueryRunnable (QRunnable no es QObject)"""
+
+    finished = pyqtSignal(int, object)  # generation, result (None si falló)
+
+
+class AreaQueryRunnable(QRunnable):
+    """
+    Ejecuta una consulta de solo lectura en el pool de hilos
+
+    Usa su propia conexión de solo lectura (DBManager.create_reader), así no ve
+    las transacciones sin confirmar del hilo principal ni se ve afectada por sus
+    commits/rollbacks. El resultado vuelve al hilo principal por la señal finished
+    (conexión en cola), donde se construyen los widgets.
+    """
+
+    def __init__(self, generation: int, reader: DBManager, fn, *args):
+        """
+        Args:
+            generation: Generación de la petición (para descartar resultados obsoletos)
+            reader: DBManager de solo lectura; se cierra al terminar
+            fn: Función fn(db, *args) a ejecutar en segundo plano
+            *args: Argumentos adicionales de fn
+        """
+        super().__init__()
+        self.generation = generation
+        self.reader = reader
+        self.fn = fn
+        self.args = args
+        self.signals = AreaQuerySignals()
+
+    def run(self):
+        try:
+            result = _run_read_query(self.fn, self.reader, *self.args)
+        finally:
+            self.reader.close()
+        self.signals.finished.emit(self.generation, result)
+
+
 class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
     """Ventana principal de gestión de áreas"""
 
     closed = pyqtSignal()
 
+    # Widgets/cards creados por iteración del event loop al cargar un área
+    LOAD_CHUNK_SIZE = 20
+
     def __init__(self, db_manager: DBManager, parent=None):
         super().__init__(parent)
         self.db = db_manager
@@ -43,6 +103,13 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         self._view_mode = 'edit'  # 'edit', 'clean', o 'full'
         self._is_full_view = False  # Estado para saber si estamos en vista completa
         self._selected_insert_position = None  # (item_type, item_id, order_index) del elemento seleccionado
+        self._current_content = []  # Contenido mostrado (ya filtrado/ordenado), en orden del canvas
+        self._checked_widget = None  # Único widget del canvas con checkbox marcado
+        self._pending_items = []  # Elementos cuyo widget/card aún no se ha creado (carga por lotes)
+        self._area_snapshot = None  # (contenido sin filtrar, metadata_map, tags_by_owner) del área mostrada
+        self._displayed_widgets = {}  # ('relation' | 'component', id) -> widget/card mostrado
+        self._load_generation = 0  # Se incrementa para cancelar una carga por lotes en curso
+        self._search_generation = 0  # Se incrementa en cada búsqueda (descarta resultados obsoletos)
 
         # Atributos para minimización a barra lateral
         self.entity_name = "Gestión de Áreas"
@@ -178,6 +245,13 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         self.search_input.textChanged.connect(self.on_search_changed)
         layout.addWidget(self.search_input)
 
+        # Timer para debounce de búsqueda (solo consulta la última tecla de una ráfaga)
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_search)
+
         # Botón nueva área
         new_btn = QPushButton("+ Nueva Área")
         new_btn.clicked.connect(self.on_new_area)
@@ -465,27 +539,104 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
     def load_areas(self):
         """Carga todas las áreas en la lista"""
-        self.areas_list.clear()
+        # Descartar resultados de una búsqueda en segundo plano aún en curso
+        self._search_generation += 1
         areas = self.area_manager.get_all_areas(active_only=True)
-
-        for area in areas:
-            item = QListWidgetItem(f"{area['icon']} {area['name']}")
-            item.setData(Qt.ItemDataRole.UserRole, area['id'])
-            self.areas_list.addItem(item)
+        self._populate_areas_list(areas)
 
     def on_search_changed(self, text):
-        """Filtra áreas por búsqueda"""
+        """Programa el filtrado de áreas (debounce de 150 ms)"""
+        self._pending_search = text
+        self._search_timer.start()
+
+    def _do_search(self):
+        """Filtra áreas por la última búsqueda pendiente"""
+        text = self._pending_search
         if not text:
             self.load_areas()
             return
 
-        results = self.area_manager.search_areas(text)
-        self.areas_list.clear()
+        # Consultar en segundo plano; solo se aplica el resultado de la última búsqueda
+        self._search_generation += 1
+        self._start_read_query(
+            self._search_generation, self._on_search_results, self._query_search_areas, text
+        )
+
+    @staticmethod
+    def _query_search_areas(db: DBManager, text: str) -> list:
+        """Consulta de búsqueda de áreas (se ejecuta en el pool de hilos)"""
+        return db.search_areas(text)
+
+    def _on_search_results(self, generation: int, results):
+        """Muestra los resultados de búsqueda (hilo principal)"""
+        if generation != self._search_generation:
+            return
+
+        if results is None:
+            # Falló la consulta en segundo plano: reintentar en el hilo principal
+            results = _run_read_query(self._query_search_areas, self.db, self._pending_search)
+            if results is None:
+                return
+
+        self._populate_areas_list(results)
+
+    def _start_read_query(self, generation: int, slot, fn, *args):
+        """
+        Ejecuta fn(db, *args) en el pool de hilos y entrega el resultado a slot
+
+        Si la BD no admite una conexión de lectura independiente (BD en memoria),
+        la consulta se ejecuta de forma síncrona en el hilo principal.
 
-        for area in results:
-            item = QListWidgetItem(f"{area['icon']} {area['name']}")
+        Args:
+            generation: Generación de la petición
+            slot: Receptor slot(generation, result) en el hilo principal
+            fn: Función de consulta fn(db, *args)
+            *args: Argumentos adicionales de fn
+        """
+        try:
+            reader = self.db.create_reader()
+        except Exception as e:
+            logger.error(f"No se pudo abrir conexión de lectura: {e}")
+            reader = None
+
+        if reader is None:
+            slot(generation, _run_read_query(fn, self.db, *args))
+            return
+
+        runnable = AreaQueryRunnable(generation, reader, fn, *args)
+        runnable.signals.finished.connect(slot)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _populate_areas_list(self, areas: list):
+        """
+        Reemplaza el contenido de la lista de áreas en un solo lote
+
+        Los items se construyen antes de tocar el widget y la inserción se hace
+        con repintado, señales y ordenamiento suspendidos (un solo relayout).
+
+        Args:
+            areas: Lista de áreas (dicts con id, icon y name)
+        """
+        labels = [f"{area['icon']} {area['name']}" for area in areas]
+        items = []
+        for label, area in zip(labels, areas):
+            item = QListWidgetItem(label)
             item.setData(Qt.ItemDataRole.UserRole, area['id'])
-            self.areas_list.addItem(item)
+            items.append(item)
+
+        areas_list = self.areas_list
+        sorting_enabled = areas_list.isSortingEnabled()
+        areas_list.setUpdatesEnabled(False)
+        areas_list.blockSignals(True)
+        areas_list.setSortingEnabled(False)
+        try:
+            areas_list.clear()
+            for item in items:
+                areas_list.addItem(item)
+        finally:
+            areas_list.setSortingEnabled(sorting_enabled)
+            areas_list.blockSignals(False)
+            areas_list.setUpdatesEnabled(True)
 
     def on_new_area(self):
         """Crea una nueva área"""
@@ -513,6 +664,8 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         if not area:
             return
 
+        self._current_content = []
+
         # Actualizar header
         self.area_name_label.setText(f"{area['icon']} {area['name']}")
         self.area_desc_label.setText(area['description'])
@@ -533,6 +686,12 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
     def _clear_canvas(self):
         """Limpia el canvas eliminando todos los widgets"""
+        # Cancelar la carga por lotes en curso (si la hay)
+        self._load_generation += 1
+        self._pending_items = []
+        self._area_snapshot = None
+        self._displayed_widgets = {}
+        self._checked_widget = None
         while self.canvas_layout.count() > 1:  # Mantener el stretch
             child = self.canvas_layout.takeAt(0)
             if child.widget():
@@ -547,12 +706,77 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         self._clear_canvas()
         self.clean_mode_grid.clear_cards()
 
+        # Lecturas en segundo plano; los widgets se crean al recibir el resultado
+        self._start_read_query(
+            self._load_generation, self._on_area_content_loaded,
+            self._query_area_content, self.current_area_id
+        )
+
+    @staticmethod
+    def _query_area_content(db: DBManager, area_id: int) -> tuple:
+        """
+        Consultas de solo lectura para cargar el contenido de un área
+        (se ejecuta en el pool de hilos)
+
+        Se carga el contenido completo, sin filtrar: los filtros de tags se aplican
+        en memoria, así un cambio de filtros no requiere volver a consultar.
+
+        Args:
+            db: DBManager sobre el que consultar
+            area_id: ID del área
+
+        Returns:
+            Tupla (content, metadata_map, tags_by_owner)
+        """
         # Cargar contenido ordenado
-        content = self.db.get_area_content_ordered(self.current_area_id)
+        content = db.get_area_content_ordered(area_id)
+
+        # Obtener tags de todos los elementos de una vez (en lugar de una consulta por elemento)
+        tags_by_owner = db.get_all_tags_for_area(area_id)
+
+        # Obtener metadata de todas las relaciones de una vez (una consulta por tipo)
+        metadata_map = fetch_entities_metadata_batch(db, [
+            (item['entity_type'], item['entity_id'])
+            for item in content if item.get('entity_type')
+        ], get_entity_type_icon, get_entity_type_label)
+
+        return content, metadata_map, tags_by_owner
+
+    def _on_area_content_loaded(self, generation: int, result):
+        """Recibe el contenido consultado y crea los widgets (hilo principal)"""
+        if generation != self._load_generation:
+            return
+
+        if result is None:
+            # Falló la consulta en segundo plano: reintentar en el hilo principal
+            result = _run_read_query(self._query_area_content, self.db, self.current_area_id)
+            if result is None:
+                QMessageBox.warning(self, "Error", "No se pudo cargar el contenido del área")
+                return
+
+        self._area_snapshot = result
+        content = self._compute_displayed_content()
+
+        # Guardar contenido mostrado para reordenar sin volver a consultar
+        self._current_content = content
+
+        # Crear widgets/cards por lotes para no bloquear la interfaz en áreas grandes
+        self._pending_items = list(content)
+        self._load_area_chunk(generation)
+
+    def _compute_displayed_content(self) -> list:
+        """
+        Aplica los filtros de tags activos (y su orden filtrado) al contenido cargado
+
+        Returns:
+            Lista de elementos a mostrar, en orden
+        """
+        content, _, tags_by_owner = self._area_snapshot
 
-        # Aplicar filtros de tags si están activos
         if self.active_tag_filters:
-            content = self._filter_content_by_tags(content)
+            content = self._filter_content_by_tags(
+                content, tags_by_owner, self.active_tag_filters, self.tag_filter_match_all
+            )
 
             # Si hay exactamente un tag filtrado, aplicar orden filtrado
             if len(self.active_tag_filters) == 1:
@@ -567,26 +791,106 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
                 )
                 logger.debug(f"Applied filtered order for tag {filter_tag_id}")
 
+        return content
+
+    def _load_area_chunk(self, generation: int):
+        """
+        Crea el siguiente lote de widgets/cards del área y reprograma el resto
+
+        Args:
+            generation: Generación de la carga; si cambió, la carga fue cancelada
+        """
+        if generation != self._load_generation or not self._pending_items:
+            return
+
+        chunk = self._pending_items[:self.LOAD_CHUNK_SIZE]
+        del self._pending_items[:self.LOAD_CHUNK_SIZE]
+
+        for item in chunk:
+            self._add_content_item(item)
+
+        # Ceder el control al event loop antes del siguiente lote
+        if self._pending_items:
+            QTimer.singleShot(0, lambda: self._load_area_chunk(generation))
+
+    def _add_content_item(self, item: dict):
+        """
+        Crea el widget (modo edición) o la card (modo limpio) de un elemento
+
+        Args:
+            item: Elemento del contenido del área
+        """
+        _, metadata_map, tags_by_owner = self._area_snapshot
+        key = (item['type'], item.get('id'))
+        widget = None
+
         # Cargar según el modo actual
         if self._view_mode == 'edit':
             # Modo edición: usar widgets verticales
-            for item in content:
-                if item['type'] == 'relation':
-                    self._add_relation_widget(item)
-                else:  # component
-                    self._add_component_widget(item)
+            if item['type'] == 'relation':
+                widget = self._add_relation_widget(
+                    item, metadata_map.get((item['entity_type'], item['entity_id']))
+                )
+            else:  # component
+                widget = self._add_component_widget(item, tags_by_owner.get(key, []))
         elif self._view_mode == 'clean':
             # Modo limpio: usar cards en grid
-            for item in content:
-                self._add_card_widget(item)
+            metadata = None
+            if item.get('entity_type'):
+                # Copia: la card agrega descripción/tags propios de la relación
+                metadata = dict(metadata_map[(item['entity_type'], item['entity_id'])])
+            widget = self._add_card_widget(item, metadata, tags_by_owner.get(key, []))
+
+        if widget is not None:
+            self._displayed_widgets[key] = widget
+
+    def _apply_tag_filter_diff(self):
+        """
+        Aplica un cambio de filtros de tags sin reconstruir el área
+
+        Solo se eliminan los widgets/cards que dejan de mostrarse y se crean los
+        nuevos; los que siguen visibles se conservan y se reordenan.
+        """
+        content = self._compute_displayed_content()
+        new_keys = {(item['type'], item.get('id')) for item in content}
+        displayed = self._displayed_widgets
+
+        # Quitar los que ya no pasan el filtro
+        for key in set(displayed) - new_keys:
+            widget = displayed.pop(key)
+            if widget is self._checked_widget:
+                self._checked_widget = None
+            if self._view_mode == 'edit':
+                self.canvas_layout.removeWidget(widget)
+                widget.deleteLater()
+            # En modo limpio el grid elimina las cards descartadas en set_cards
+
+        # Crear los que ahora pasan el filtro
+        for item in content:
+            if (item['type'], item.get('id')) not in displayed:
+                self._add_content_item(item)
+
+        # Reordenar según el nuevo contenido
+        ordered = [displayed[key] for key in
+                   ((item['type'], item.get('id')) for item in content) if key in displayed]
+        if self._view_mode == 'edit':
+            for index, widget in enumerate(ordered):
+                if self.canvas_layout.indexOf(widget) != index:
+                    self.canvas_layout.removeWidget(widget)
+                    self.canvas_layout.insertWidget(index, widget)
+        elif self._view_mode == 'clean':
+            self.clean_mode_grid.set_cards(ordered)
+
+        self._current_content = content
 
-    def _add_relation_widget(self, relation):
+    def _add_relation_widget(self, relation, metadata: dict = None):
         """Agrega un widget de relación al canvas"""
-        # Obtener metadata
-        metadata = self.area_manager.get_entity_metadata(
-            relation['entity_type'],
-            relation['entity_id']
-        )
+        # Obtener metadata (si no viene precargada)
+        if metadata is None:
+            metadata = self.area_manager.get_entity_metadata(
+                relation['entity_type'],
+                relation['entity_id']
+            )
 
         # Crear widget especializado
         # Solo mostrar flechas de ordenamiento cuando hay un filtro de tag activo
@@ -604,18 +908,19 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         widget.edit_description_requested.connect(self._on_relation_description_edit)
         widget.move_up_requested.connect(self._on_move_up)
         widget.move_down_requested.connect(self._on_move_down)
-        widget.checkbox_changed.connect(lambda relation_id, checked: self._on_checkbox_changed('relation', relation_id, relation, checked))
+        widget.checkbox_changed.connect(lambda relation_id, checked: self._on_checkbox_changed('relation', relation_id, relation, checked, widget))
 
         self.canvas_layout.insertWidget(self.canvas_layout.count() - 1, widget)
+        return widget
 
-    def _add_component_widget(self, component):
+    def _add_component_widget(self, component, tags_data: list = None):
         """Agrega un widget de componente al canvas"""
-        # Obtener y agregar tags del componente
+        # Obtener y agregar tags del componente (si no vienen precargados)
         component_id = component.get('id')
         if component_id:
-            tags_data = self.db.get_tags_for_area_component(component_id)
+            if tags_data is None:
+                tags_data = self.db.get_tags_for_area_component(component_id)
             # Convertir a objetos AreaElementTag
-            from src.models.area_element_tag import create_tag_from_db_row
             tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
             component['tags'] = tags
 
@@ -631,22 +936,24 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         widget.edit_content_requested.connect(self._on_component_content_edit)
         widget.move_up_requested.connect(self._on_move_up)
         widget.move_down_requested.connect(self._on_move_down)
-        widget.checkbox_changed.connect(lambda component_id, checked: self._on_checkbox_changed('component', component_id, component, checked))
+        widget.checkbox_changed.connect(lambda component_id, checked: self._on_checkbox_changed('component', component_id, component, checked, widget))
 
         self.canvas_layout.insertWidget(self.canvas_layout.count() - 1, widget)
+        return widget
 
-    def _add_card_widget(self, item):
+    def _add_card_widget(self, item, metadata: dict = None, tags_data: list = None):
         """Agrega una card al grid (modo limpio)"""
         # Determinar tipo de elemento
         if item.get('entity_type'):
             # Es una relación (tag, item, category, list, table, process)
             entity_type = item['entity_type']
 
-            # Obtener metadata del elemento
-            metadata = self.area_manager.get_entity_metadata(
-                entity_type,
-                item['entity_id']
-            )
+            # Obtener metadata del elemento (si no viene precargada)
+            if metadata is None:
+                metadata = self.area_manager.get_entity_metadata(
+                    entity_type,
+                    item['entity_id']
+                )
 
             # Agregar descripción de la relación a la metadata
             metadata['description'] = item.get('description', '')
@@ -654,9 +961,9 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
             # Obtener y agregar tags de la relación
             relation_id = item.get('id')
             if relation_id:
-                tags_data = self.db.get_tags_for_area_relation(relation_id)
+                if tags_data is None:
+                    tags_data = self.db.get_tags_for_area_relation(relation_id)
                 # Convertir a objetos AreaElementTag
-                from src.models.area_element_tag import create_tag_from_db_row
                 tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
                 metadata['tags'] = tags
 
@@ -673,7 +980,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
             # Saltar divisores en modo limpio (no tienen sentido en grid)
             if component_type == 'divider':
-                return
+                return None
 
             # Preparar datos para la card
             card_data = {
@@ -685,9 +992,9 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
             # Obtener y agregar tags del componente
             component_id = item.get('id')
             if component_id:
-                tags_data = self.db.get_tags_for_area_component(component_id)
+                if tags_data is None:
+                    tags_data = self.db.get_tags_for_area_component(component_id)
                 # Convertir a objetos AreaElementTag
-                from src.models.area_element_tag import create_tag_from_db_row
                 tags = [create_tag_from_db_row(tag_data) for tag_data in tags_data]
                 card_data['tags'] = tags
 
@@ -706,6 +1013,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
         # Agregar card al grid
         self.clean_mode_grid.add_card(card)
+        return card
 
     def _on_relation_delete(self, relation_id: int):
         """Maneja eliminación de relación"""
@@ -713,6 +1021,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
             success = self.db.remove_area_relation(relation_id)
             if success:
                 logger.info(f"Relation {relation_id} deleted")
+                self.tag_manager.invalidate_area_tags(self.current_area_id)
                 self.load_area(self.current_area_id)
             else:
                 QMessageBox.warning(self, "Error", "No se pudo eliminar la relación")
@@ -735,6 +1044,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
             success = self.db.remove_area_component(component_id)
             if success:
                 logger.info(f"Component {component_id} deleted")
+                self.tag_manager.invalidate_area_tags(self.current_area_id)
                 self.load_area(self.current_area_id)
             else:
                 QMessageBox.warning(self, "Error", "No se pudo eliminar el componente")
@@ -751,263 +1061,126 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
         except Exception as e:
             logger.error(f"Error updating component content: {e}")
 
-    def _on_checkbox_changed(self, item_type: str, item_id: int, item_data: dict, checked: bool):
+    def _on_checkbox_changed(self, item_type: str, item_id: int, item_data: dict, checked: bool,
+                             widget: QWidget = None):
         """Maneja cambio de checkbox para seleccionar posición de inserción"""
         if checked:
             # Guardar posición seleccionada
             self._selected_insert_position = (item_type, item_id, item_data.get('order_index'))
             logger.info(f"Insert position selected: {item_type} #{item_id} (order_index: {item_data.get('order_index')})")
 
-            # Desmarcar todos los demás checkboxes
-            self._uncheck_all_except(item_type, item_id)
+            # Desmarcar el checkbox anterior (como máximo hay uno marcado)
+            previous = self._checked_widget
+            if previous is not None and previous is not widget:
+                previous.checkbox.blockSignals(True)  # Bloquear señales para evitar recursión
+                previous.checkbox.setChecked(False)
+                previous.checkbox.blockSignals(False)
+            self._checked_widget = widget
         else:
+            if widget is self._checked_widget:
+                self._checked_widget = None
+
             # Si se desmarca, limpiar posición seleccionada
             if self._selected_insert_position and self._selected_insert_position[1] == item_id:
                 self._selected_insert_position = None
                 logger.info("Insert position cleared")
 
-    def _uncheck_all_except(self, except_type: str, except_id: int):
-        """Desmarca todos los checkboxes excepto el especificado"""
-        # Iterar sobre todos los widgets en el canvas
-        for i in range(self.canvas_layout.count() - 1):  # -1 para excluir el stretch
-            widget = self.canvas_layout.itemAt(i).widget()
-            if widget and hasattr(widget, 'checkbox'):
-                # Determinar el ID del widget
-                widget_id = None
-                widget_type = None
-
-                if isinstance(widget, AreaRelationWidget):
-                    widget_id = widget.relation_data.get('id')
-                    widget_type = 'relation'
-                elif isinstance(widget, AreaComponentWidget):
-                    widget_id = widget.component_data.get('id')
-                    widget_type = 'component'
-
-                # Si no es el widget excepto, desmarcar
-                if widget_id and (widget_type != except_type or widget_id != except_id):
-                    widget.checkbox.blockSignals(True)  # Bloquear señales para evitar recursión
-                    widget.checkbox.setChecked(False)
-                    widget.checkbox.blockSignals(False)
-
     def _shift_order_indices_down(self, from_order: int):
         """Incrementa el order_index de todos los elementos >= from_order"""
         if not self.current_area_id:
             return
 
-        try:
-            # Obtener todo el contenido
-            content = self.db.get_area_content_ordered(self.current_area_id)
-
-            # Incrementar order_index de elementos >= from_order
-            for item in content:
-                current_order = item.get('order_index')
-                if current_order is not None and current_order >= from_order:
-                    new_order = current_order + 1
-
-                    # Determinar tipo y actualizar
-                    if item.get('entity_type') is not None:
-                        self.db.update_relation_order(item['id'], new_order)
-                        logger.info(f"Shifted relation {item['id']} from {current_order} to {new_order}")
-                    elif item.get('component_type') is not None:
-                        self.db.update_component_order(item['id'], new_order)
-                        logger.info(f"Shifted component {item['id']} from {current_order} to {new_order}")
-
-        except Exception as e:
-            logger.error(f"Error shifting order indices: {e}")
+        if self.db.shift_area_item_orders(self.current_area_id, from_order):
+            logger.info(f"Shifted area items from order_index {from_order}")
 
     def _on_move_up(self, item_id: int):
         """Maneja mover elemento hacia arriba"""
+        self._move_item(item_id, -1)
+
+    def _on_move_down(self, item_id: int):
+        """Maneja mover elemento hacia abajo"""
+        self._move_item(item_id, 1)
+
+    def _move_item(self, item_id: int, offset: int):
+        """
+        Intercambia un elemento con su vecino (arriba o abajo)
+
+        Usa el contenido cacheado en la última carga: guarda el intercambio en
+        una sola transacción y mueve el widget dentro del canvas sin recargar.
+
+        Args:
+            item_id: ID del elemento a mover
+            offset: -1 para subir, 1 para bajar
+        """
         if not self.current_area_id:
             return
 
         try:
-            logger.info(f"Move up requested for item_id: {item_id}")
+            logger.info(f"Move {'up' if offset < 0 else 'down'} requested for item_id: {item_id}")
 
-            # Obtener todo el contenido ordenado
-            content = self.db.get_area_content_ordered(self.current_area_id)
+            # El canvas debe estar completo para que sus índices coincidan con el contenido
+            if self._pending_items:
+                logger.info("Area still loading, move ignored")
+                return
 
-            # Determinar si estamos usando orden filtrado
-            use_filtered_order = self.active_tag_filters and len(self.active_tag_filters) == 1
-            filter_tag_id = self.active_tag_filters[0] if use_filtered_order else None
-
-            # Si hay filtros de tags activos, trabajar solo con el contenido filtrado
-            if self.active_tag_filters:
-                content = self._filter_content_by_tags(content)
-                logger.info(f"Working with filtered content: {len(content)} items")
-
-                # Si usamos orden filtrado, aplicar ese orden
-                if use_filtered_order:
-                    # Sincronizar orden filtrado con contenido actual
-                    self.db.sync_area_filtered_order_with_content(
-                        self.current_area_id, filter_tag_id, content
-                    )
-                    # Aplicar orden filtrado
-                    content = self.db.get_area_content_with_filtered_order(
-                        self.current_area_id, filter_tag_id, content
-                    )
-                    logger.info("Applied filtered order")
-            else:
-                logger.info(f"Total content items: {len(content)}")
+            content = self._current_content
 
             # Encontrar el índice del item
             current_index = None
             for i, item in enumerate(content):
                 if item.get('id') == item_id:
                     current_index = i
-                    if item.get('entity_type') is not None:
-                        logger.info(f"Found relation at index {i}, entity_type: {item.get('entity_type')}")
-                    elif item.get('component_type') is not None:
-                        logger.info(f"Found component at index {i}, type: {item.get('component_type')}")
                     break
 
             if current_index is None:
                 logger.warning(f"Item {item_id} not found in content")
                 return
 
-            if current_index == 0:
-                logger.info("Item already at top")
-                return  # Ya está al inicio
+            target_index = current_index + offset
+            if not 0 <= target_index < len(content):
+                logger.info("Item already at the edge")
+                return
 
-            # Intercambiar posiciones con el elemento anterior
             current_item = content[current_index]
-            prev_item = content[current_index - 1]
-
-            # Si usamos orden filtrado, actualizar en tabla filtered_order
-            if use_filtered_order:
-                logger.info("Updating filtered order")
+            other_item = content[target_index]
+            current_element_type = 'relation' if current_item.get('entity_type') else 'component'
+            other_element_type = 'relation' if other_item.get('entity_type') else 'component'
 
-                # Determinar tipos de elementos
-                current_element_type = 'relation' if current_item.get('entity_type') else 'component'
-                prev_element_type = 'relation' if prev_item.get('entity_type') else 'component'
+            # Determinar si estamos usando orden filtrado
+            use_filtered_order = self.active_tag_filters and len(self.active_tag_filters) == 1
 
+            if use_filtered_order:
                 # Intercambiar índices (usar índices de la lista filtrada)
-                self.db.update_area_filtered_order(
-                    self.current_area_id, filter_tag_id,
-                    current_element_type, current_item['id'], current_index - 1
-                )
-                self.db.update_area_filtered_order(
-                    self.current_area_id, filter_tag_id,
-                    prev_element_type, prev_item['id'], current_index
+                saved = self.db.set_area_filtered_orders(
+                    self.current_area_id, self.active_tag_filters[0], [
+                        (current_element_type, current_item['id'], target_index),
+                        (other_element_type, other_item['id'], current_index),
+                    ]
                 )
             else:
                 # Usar orden global
-                logger.info(f"Swapping global order: current={current_item['order_index']}, prev={prev_item['order_index']}")
-
-                # Determinar tipo del item actual
-                if current_item.get('entity_type') is not None:
-                    self.db.update_area_relation_order(current_item['id'], prev_item['order_index'])
-                elif current_item.get('component_type') is not None:
-                    self.db.update_area_component_order(current_item['id'], prev_item['order_index'])
-
-                # Determinar tipo del item anterior
-                if prev_item.get('entity_type') is not None:
-                    self.db.update_area_relation_order(prev_item['id'], current_item['order_index'])
-                elif prev_item.get('component_type') is not None:
-                    self.db.update_area_component_order(prev_item['id'], current_item['order_index'])
-
-            # Recargar área
-            logger.info("Reloading area after move")
-            self.load_area(self.current_area_id)
-
-        except Exception as e:
-            logger.error(f"Error moving item up: {e}")
-
-    def _on_move_down(self, item_id: int):
-        """Maneja mover elemento hacia abajo"""
-        if not self.current_area_id:
-            return
-
-        try:
-            logger.info(f"Move down requested for item_id: {item_id}")
-
-            # Obtener todo el contenido ordenado
-            content = self.db.get_area_content_ordered(self.current_area_id)
-
-            # Determinar si estamos usando orden filtrado
-            use_filtered_order = self.active_tag_filters and len(self.active_tag_filters) == 1
-            filter_tag_id = self.active_tag_filters[0] if use_filtered_order else None
-
-            # Si hay filtros de tags activos, trabajar solo con el contenido filtrado
-            if self.active_tag_filters:
-                content = self._filter_content_by_tags(content)
-                logger.info(f"Working with filtered content: {len(content)} items")
-
-                # Si usamos orden filtrado, aplicar ese orden
-                if use_filtered_order:
-                    # Sincronizar orden filtrado con contenido actual
-                    self.db.sync_area_filtered_order_with_content(
-                        self.current_area_id, filter_tag_id, content
-                    )
-                    # Aplicar orden filtrado
-                    content = self.db.get_area_content_with_filtered_order(
-                        self.current_area_id, filter_tag_id, content
+                saved = self.db.swap_area_item_orders(
+                    current_element_type, current_item['id'],
+                    other_element_type, other_item['id']
+                )
+                if saved:
+                    current_item['order_index'], other_item['order_index'] = (
+                        other_item['order_index'], current_item['order_index']
                     )
-                    logger.info("Applied filtered order")
-            else:
-                logger.info(f"Total content items: {len(content)}")
-
-            # Encontrar el índice del item
-            current_index = None
-            for i, item in enumerate(content):
-                if item.get('id') == item_id:
-                    current_index = i
-                    if item.get('entity_type') is not None:
-                        logger.info(f"Found relation at index {i}, entity_type: {item.get('entity_type')}")
-                    elif item.get('component_type') is not None:
-                        logger.info(f"Found component at index {i}, type: {item.get('component_type')}")
-                    break
 
-            if current_index is None:
-                logger.warning(f"Item {item_id} not found in content")
+            if not saved:
+                logger.warning(f"Could not move item {item_id}")
                 return
 
-            if current_index >= len(content) - 1:
-                logger.info("Item already at bottom")
-                return  # Ya está al final
-
-            # Intercambiar posiciones con el elemento siguiente
-            current_item = content[current_index]
-            next_item = content[current_index + 1]
-
-            # Si usamos orden filtrado, actualizar en tabla filtered_order
-            if use_filtered_order:
-                logger.info("Updating filtered order")
+            content[current_index], content[target_index] = other_item, current_item
 
-                # Determinar tipos de elementos
-                current_element_type = 'relation' if current_item.get('entity_type') else 'component'
-                next_element_type = 'relation' if next_item.get('entity_type') else 'component'
-
-                # Intercambiar índices (usar índices de la lista filtrada)
-                self.db.update_area_filtered_order(
-                    self.current_area_id, filter_tag_id,
-                    current_element_type, current_item['id'], current_index + 1
-                )
-                self.db.update_area_filtered_order(
-                    self.current_area_id, filter_tag_id,
-                    next_element_type, next_item['id'], current_index
-                )
-            else:
-                # Usar orden global
-                logger.info(f"Swapping global order: current={current_item['order_index']}, next={next_item['order_index']}")
-
-                # Determinar tipo del item actual
-                if current_item.get('entity_type') is not None:
-                    self.db.update_area_relation_order(current_item['id'], next_item['order_index'])
-                elif current_item.get('component_type') is not None:
-                    self.db.update_area_component_order(current_item['id'], next_item['order_index'])
-
-                # Determinar tipo del item siguiente
-                if next_item.get('entity_type') is not None:
-                    self.db.update_area_relation_order(next_item['id'], current_item['order_index'])
-                elif next_item.get('component_type') is not None:
-                    self.db.update_area_component_order(next_item['id'], current_item['order_index'])
-
-            # Recargar área
-            logger.info("Reloading area after move")
-            self.load_area(self.current_area_id)
+            # Mover el widget existente (canvas en el mismo orden que el contenido)
+            layout_item = self.canvas_layout.takeAt(current_index)
+            if layout_item is not None and layout_item.widget() is not None:
+                self.canvas_layout.insertWidget(target_index, layout_item.widget())
 
         except Exception as e:
-            logger.error(f"Error moving item down: {e}")
+            logger.error(f"Error moving item: {e}")
 
     def _copy_to_clipboard(self, text: str):
         """Copia texto al portapapeles"""
@@ -1281,9 +1454,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
                     # Asociar tags si hay
                     if tag_ids:
-                        from src.core.area_element_tag_manager import AreaElementTagManager
-                        tag_manager = AreaElementTagManager(self.db)
-                        tag_manager.assign_tags_to_relation(relation_id, tag_ids)
+                        self.tag_manager.assign_tags_to_relation(relation_id, tag_ids)
                         logger.info(f"Assigned {len(tag_ids)} tags to relation {relation_id}")
 
                 logger.info(f"Added {entity_type} #{entity_id} to area {self.current_area_id}")
@@ -1355,51 +1526,46 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
 
             self.load_area(self.current_area_id)
 
-    def _filter_content_by_tags(self, content: list) -> list:
+    def _filter_content_by_tags(self, content: list, tags_by_owner: dict, tag_ids: list,
+                                match_all: bool) -> list:
         """
         Filtra el contenido por tags seleccionados
 
         Args:
             content: Lista de elementos del área
+            tags_by_owner: Tags por elemento, de DBManager.get_all_tags_for_area
+            tag_ids: IDs de los tags a filtrar
+            match_all: True para AND (todos los tags), False para OR
 
         Returns:
             Lista filtrada de elementos
         """
-        if not self.active_tag_filters:
+        if not tag_ids:
             return content
 
-        filtered = []
+        active = frozenset(tag_ids)
 
-        for item in content:
-            item_tags_ids = []
+        # Conjunto de IDs de tags por elemento ('relation' | 'component', id)
+        tag_id_sets = {
+            owner: {tag['id'] for tag in tags}
+            for owner, tags in tags_by_owner.items()
+        }
+        empty = frozenset()
 
-            # Obtener tags según el tipo de elemento
-            if item['type'] == 'relation':
-                # Obtener tags de la relación
-                relation_id = item.get('id')
-                relation_tags = self.tag_manager.get_relation_tags(relation_id)
-                item_tags_ids = [tag.id for tag in relation_tags]
-            elif item['type'] == 'component':
-                # Obtener tags del componente
-                component_id = item.get('id')
-                component_tags = self.tag_manager.get_tags_for_component(component_id)
-                item_tags_ids = [tag.id for tag in component_tags]
-
-            # Aplicar lógica de filtro
-            if self.tag_filter_match_all:
-                # AND: debe tener TODOS los tags
-                if all(tag_id in item_tags_ids for tag_id in self.active_tag_filters):
-                    filtered.append(item)
-            else:
-                # OR: debe tener AL MENOS uno
-                if any(tag_id in item_tags_ids for tag_id in self.active_tag_filters):
-                    filtered.append(item)
+        # AND: debe tener TODOS los tags; OR: al menos uno
+        if match_all:
+            filtered = [item for item in content
+                        if active <= tag_id_sets.get((item['type'], item.get('id')), empty)]
+        else:
+            filtered = [item for item in content
+                        if not active.isdisjoint(tag_id_sets.get((item['type'], item.get('id')), empty))]
 
         logger.debug(f"Filtered {len(content)} items to {len(filtered)} items")
         return filtered
 
     def _on_tag_filter_changed(self, tag_ids: list, match_all: bool):
         """Maneja cambio en filtros de tags"""
+        had_filters = bool(self.active_tag_filters)
         self.active_tag_filters = tag_ids
         self.tag_filter_match_all = match_all
 
@@ -1424,9 +1590,17 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
                 self.full_view_panel.clear_filters()
                 logger.debug("Filtros limpiados en vista completa")
 
-        # Recargar área con filtros
-        if self.current_area_id:
-            self.load_area(self.current_area_id)
+        if not self.current_area_id or self._is_full_view:
+            # La vista completa ya aplicó los filtros
+            return
+
+        # Recargar solo si no hay contenido completo en pantalla, o si cambia la
+        # visibilidad de las flechas de ordenamiento (se fija al crear cada widget)
+        if (self._area_snapshot is None or self._pending_items
+                or (self._view_mode == 'edit' and had_filters != bool(tag_ids))):
+            self._load_area_content()
+        else:
+            self._apply_tag_filter_diff()
 
     def on_refresh_area(self):
         """Recarga el área actual sin cerrar la ventana"""
@@ -1434,6 +1608,7 @@ class AreasWindow(QMainWindow, TaskbarMinimizableMixin):
             return
 
         logger.info(f"Refreshing area {self.current_area_id}")
+        self.tag_manager.invalidate_area_tags(self.current_area_id)
         self.load_area(self.current_area_id)
 
     def on_edit_area(self):
@@ -347,6 +347,8 @@ class AreaTagManagerDialog(QDialog):
         self.tag_manager.tag_created.connect(lambda _: self.refresh_tag_list())
         self.tag_manager.tag_updated.connect(lambda _: self.refresh_tag_list())
         self.tag_manager.tag_deleted.connect(lambda _: self.refresh_tag_list())
+        self.tag_manager.tags_created_batch.connect(lambda _: self.refresh_tag_list())
+        self.tag_manager.tags_deleted_batch.connect(lambda _: self.refresh_tag_list())
 
     def refresh_tag_list(self):
         """Actualiza la lista de tags"""
@@ -577,26 +577,39 @@ class ProjectsWindow(QMainWindow, TaskbarMinimizableMixin):
                 )
                 logger.debug(f"Applied filtered order for tag {filter_tag_id}")
 
+        # Obtener metadata de todas las relaciones de una vez (una consulta por tipo)
+        metadata_map = self.project_manager.get_entities_metadata_batch([
+            (item['entity_type'], item['entity_id'])
+            for item in content if item.get('entity_type')
+        ])
+
         # Cargar según el modo actual
         if self._view_mode == 'edit':
             # Modo edición: usar widgets verticales
             for item in content:
                 if item['type'] == 'relation':
-                    self._add_relation_widget(item)
+                    self._add_relation_widget(
+                        item, metadata_map.get((item['entity_type'], item['entity_id']))
+                    )
                 else:  # component
                     self._add_component_widget(item)
         else:
             # Modo limpio: usar cards en grid
             for item in content:
-                self._add_card_widget(item)
+                metadata = None
+                if item.get('entity_type'):
+                    # Copia: la card agrega descripción/tags propios de la relación
+                    metadata = dict(metadata_map[(item['entity_type'], item['entity_id'])])
+                self._add_card_widget(item, metadata)
 
-    def _add_relation_widget(self, relation):
+    def _add_relation_widget(self, relation, metadata: dict = None):
         """Agrega un widget de relación al canvas"""
-        # Obtener metadata
-        metadata = self.project_manager.get_entity_metadata(
-            relation['entity_type'],
-            relation['entity_id']
-        )
+        # Obtener metadata (si no viene precargada)
+        if metadata is None:
+            metadata = self.project_manager.get_entity_metadata(
+                relation['entity_type'],
+                relation['entity_id']
+            )
 
         # Crear widget especializado
         # Solo mostrar flechas de ordenamiento cuando hay un filtro de tag activo
@@ -645,18 +658,19 @@ class ProjectsWindow(QMainWindow, TaskbarMinimizableMixin):
 
         self.canvas_layout.insertWidget(self.canvas_layout.count() - 1, widget)
 
-    def _add_card_widget(self, item):
+    def _add_card_widget(self, item, metadata: dict = None):
         """Agrega una card al grid (modo limpio)"""
         # Determinar tipo de elemento
         if item.get('entity_type'):
             # Es una relación (tag, item, category, list, table, process)
             entity_type = item['entity_type']
 
-            # Obtener metadata del elemento
-            metadata = self.project_manager.get_entity_metadata(
-                entity_type,
-                item['entity_id']
-            )
+            # Obtener metadata del elemento (si no viene precargada)
+            if metadata is None:
+                metadata = self.project_manager.get_entity_metadata(
+                    entity_type,
+                    item['entity_id']
+                )
 
             # Agregar descripción de la relación a la metadata
             metadata['description'] = item.get('description', '')
@@ -723,6 +737,7 @@ class ProjectsWindow(QMainWindow, TaskbarMinimizableMixin):
             success = self.db.remove_project_relation(relation_id)
             if success:
                 logger.info(f"Relation {relation_id} deleted")
+                self.tag_manager.invalidate_usage_counts()
                 self.load_project(self.current_project_id)
             else:
                 QMessageBox.warning(self, "Error", "No se pudo eliminar la relación")
@@ -745,6 +760,7 @@ class ProjectsWindow(QMainWindow, TaskbarMinimizableMixin):
             success = self.db.remove_project_component(component_id)
             if success:
                 logger.info(f"Component {component_id} deleted")
+                self.tag_manager.invalidate_usage_counts()
                 self.load_project(self.current_project_id)
             else:
                 QMessageBox.warning(self, "Error", "No se pudo eliminar el componente")
@@ -1278,9 +1294,7 @@ class ProjectsWindow(QMainWindow, TaskbarMinimizableMixin):
 
                     # Asociar tags si hay
                     if tag_ids:
-                        from src.core.project_element_tag_manager import ProjectElementTagManager
-                        tag_manager = ProjectElementTagManager(self.db)
-                        tag_manager.assign_tags_to_relation(relation_id, tag_ids)
+                        self.tag_manager.assign_tags_to_relation(relation_id, tag_ids)
                         logger.info(f"Assigned {len(tag_ids)} tags to relation {relation_id}")
 
                 logger.info(f"Added {entity_type} #{entity_id} to project {self.current_project_id}")
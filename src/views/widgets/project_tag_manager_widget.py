@@ -310,6 +310,7 @@ class ProjectTagManagerWidget(QWidget):
         self.tag_manager.tag_created.connect(lambda _: self.refresh_tag_list())
         self.tag_manager.tag_updated.connect(lambda _: self.refresh_tag_list())
         self.tag_manager.tag_deleted.connect(lambda _: self.refresh_tag_list())
+        self.tag_manager.tags_created_batch.connect(lambda _: self.refresh_tag_list())
 
     def refresh_tag_list(self):
         """Actualiza la lista de tags"""
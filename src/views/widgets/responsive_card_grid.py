@@ -111,6 +111,25 @@ class ResponsiveCardGrid(QWidget):
         self.cards.clear()
         # No resetear current_columns para mantener el layout actual
 
+    def set_cards(self, cards: list):
+        """
+        Reemplaza las cards del grid conservando las instancias que se repiten
+
+        Las cards actuales que no están en la nueva lista se eliminan; el resto
+        se reorganiza en el orden dado con un solo relayout.
+
+        Args:
+            cards: Nueva lista ordenada de cards
+        """
+        keep = set(map(id, cards))
+        for card in self.cards:
+            if id(card) not in keep:
+                self.grid_layout.removeWidget(card)
+                card.deleteLater()
+
+        self.cards = list(cards)
+        self._relayout_cards()
+
     def _calculate_columns(self, width: int) -> int:
         """Calcula el número de columnas según el ancho"""
         if width < self.BREAKPOINTS['xs']: